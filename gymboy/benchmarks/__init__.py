@@ -0,0 +1 @@
+"""Benchmarks of the gymboy hot paths."""
@@ -0,0 +1,71 @@
+"""
+Benchmarks the conversion of the game boy screen into the RGB observation of the
+*FullImage environments.
+
+Usage:
+    python -m gymboy.benchmarks.image --number 1000
+"""
+
+import argparse
+import timeit
+from typing import Dict
+
+import numpy as np
+from PIL import Image
+
+from gymboy.utils import rgba_to_rgb
+
+
+def _skimage_rgba_to_rgb(image: Image.Image) -> np.ndarray:
+    """Returns the RGB observation the way the *FullImage environments used to."""
+    import skimage as ski
+
+    obs = ski.color.rgba2rgb(image)
+    return (255 * obs).clip(0, 255).astype(np.uint8)
+
+
+def run(number: int = 1000, seed: int = 0) -> Dict[str, float]:
+    """
+    Measures the time per conversion of a random opaque (144, 160, 4) screen.
+
+    Args:
+        number (int):
+            The number of conversions to time
+
+        seed (int):
+            The seed for the random screen
+
+    Returns:
+        Dict[str, float]:
+            The time per conversion in microseconds of both conversions
+    """
+    rng = np.random.default_rng(seed)
+    screen = rng.integers(0, 256, size=(144, 160, 4), dtype=np.uint8)
+    screen[..., 3] = 255
+    image = Image.fromarray(screen, "RGBA")
+
+    if not np.array_equal(_skimage_rgba_to_rgb(image), rgba_to_rgb(screen)):
+        raise RuntimeError("rgba_to_rgb() is not bit-identical to rgba2rgb().")
+
+    skimage_time = timeit.timeit(lambda: _skimage_rgba_to_rgb(image), number=number)
+    lut_time = timeit.timeit(lambda: rgba_to_rgb(screen), number=number)
+    return {
+        "skimage_us": 1e6 * skimage_time / number,
+        "rgba_to_rgb_us": 1e6 * lut_time / number,
+        "speedup": skimage_time / lut_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = run(number=args.number)
+    print(f"skimage.color.rgba2rgb: {results['skimage_us']:8.1f} us/step")
+    print(f"rgba_to_rgb:            {results['rgba_to_rgb_us']:8.1f} us/step")
+    print(f"speedup:                {results['speedup']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmarks the time of `import gymboy`, which makes up most of the startup time of
+each worker process.
+
+Usage:
+    python -m gymboy.benchmarks.import_time --number 10
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Modules that must not be imported by `import gymboy`
+HEAVY_MODULES = ["gymboy.environments.", "pyboy", "skimage"]
+
+
+def _time_python(code: str, number: int) -> List[float]:
+    """Returns the wall times of running the code in fresh interpreters."""
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def imported_modules(module: str = "gymboy") -> List[str]:
+    """
+    Returns the heavy modules that are imported by importing the module.
+
+    Args:
+        module (str):
+            The name of the module to import
+
+    Returns:
+        List[str]:
+            The imported heavy modules
+    """
+    code = (
+        f"import sys, {module}; "
+        "print('\\n'.join(m for m in sys.modules "
+        f"if m.startswith({tuple(HEAVY_MODULES)!r})))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return output.split()
+
+
+def run(number: int = 10) -> Dict[str, float]:
+    """
+    Measures the time of `import gymboy` in fresh interpreters.
+
+    Args:
+        number (int):
+            The number of interpreters to start
+
+    Returns:
+        Dict[str, float]:
+            The best time in milliseconds of the bare interpreter and the time of
+            `import gymboy` without the interpreter startup
+    """
+    python_time = min(_time_python("pass", number))
+    gymboy_time = min(_time_python("import gymboy", number))
+    return {
+        "python_ms": 1e3 * python_time,
+        "import_gymboy_ms": 1e3 * (gymboy_time - python_time),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    results = run(number=args.number)
+    print(f"python startup: {results['python_ms']:8.1f} ms")
+    print(f"import gymboy:  {results['import_gymboy_ms']:8.1f} ms")
+    print(f"heavy modules:  {imported_modules() or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
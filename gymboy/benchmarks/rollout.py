@@ -0,0 +1,504 @@
+"""
+Benchmarks the rollout throughput of the registered environments and writes the
+results as JSON, so that performance regressions between releases can be found.
+
+Without --resources-dir each environment runs on a synthetic ROM with the cartridge
+title of the game, which measures the overhead of gymboy and PyBoy but not the
+emulation of the real game. With --resources-dir the ROMs and states are read from
+the same layout as ./resources of the tests.
+
+Usage:
+    python -m gymboy.benchmarks.rollout --output results.json
+    python -m gymboy.benchmarks.rollout --resources-dir ./resources \\
+        --env-ids Tetris-flatten-v1
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from importlib import metadata
+from typing import Any, Dict, List, Sequence, Tuple
+
+from gymboy.registration import make, make_vec, registered_envs
+from gymboy.testing import CARTRIDGE_TITLES
+
+# Observation variants of the registered environments
+VARIANTS = ["flatten", "full-image", "grayscale-image", "minimal-image"]
+
+# ROM path and initial state path (relative to the resources directory) of each
+# game
+GAMES = {
+    "Kirby-Dream-Land-1": (
+        "roms/kirby/dream_land_1/kirby_dream_land_1.gb",
+        "states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
+    ),
+    "Pokemon-Blue": (
+        "roms/pokemon/gen_1/pokemon_blue.gb",
+        "states/pokemon/gen_1/pokemon_blue_after_intro.state",
+    ),
+    "Pokemon-Gold": (
+        "roms/pokemon/gen_2/pokemon_gold.gbc",
+        "states/pokemon/gen_2/pokemon_gold_after_intro.state",
+    ),
+    "Pokemon-Red": (
+        "roms/pokemon/gen_1/pokemon_red.gb",
+        "states/pokemon/gen_1/pokemon_red_after_intro.state",
+    ),
+    "Pokemon-Silver": (
+        "roms/pokemon/gen_2/pokemon_silver.gbc",
+        "states/pokemon/gen_2/pokemon_silver_after_intro.state",
+    ),
+    "Pokemon-Yellow": (
+        "roms/pokemon/gen_1/pokemon_yellow.gbc",
+        "states/pokemon/gen_1/pokemon_yellow_after_intro.state",
+    ),
+    "Super-Mario-Land-1": (
+        "roms/mario/land_1/super_mario_land_1.gb",
+        "states/mario/land_1/super_mario_land_1_after_intro.state",
+    ),
+    "Tetris": (
+        "roms/tetris/tetris/tetris.gb",
+        "states/tetris/tetris/tetris_after_intro.state",
+    ),
+}
+
+
+def split_env_id(env_id: str) -> Tuple[str, str]:
+    """
+    Splits an environment ID into the game and the observation variant.
+
+    Args:
+        env_id (str):
+            The ID of the environment, e.g. "Tetris-flatten-v1"
+
+    Returns:
+        Tuple[str, str]:
+            The game and the observation variant, e.g. ("Tetris", "flatten")
+    """
+    for variant in VARIANTS:
+        game, sep, _ = env_id.partition(f"-{variant}-")
+        if sep:
+            return game, variant
+    raise ValueError(f"Unknown observation variant of '{env_id}'.")
+
+
+def synthetic_rom(cartridge_title: str, rom_path: str) -> str:
+    """
+    Writes a ROM that loops forever and has the cartridge title of a game.
+
+    The initial state is saved next to the ROM with the extension ".state".
+
+    Args:
+        cartridge_title (str):
+            The cartridge title of the game
+
+        rom_path (str):
+            The path of the ROM file, where ".gbc" marks a game boy color game
+
+    Returns:
+        str:
+            The path of the initial state file
+    """
+    from pyboy import PyBoy
+
+    rom = bytearray(0x8000)
+    # Entry point: nop; jp 0x0150, where 0x0150 jumps to itself
+    rom[0x0100:0x0104] = bytes([0x00, 0xC3, 0x50, 0x01])
+    rom[0x0150:0x0153] = bytes([0xC3, 0x50, 0x01])
+    rom[0x0134 : 0x0134 + len(cartridge_title)] = cartridge_title.encode("ascii")
+    if rom_path.endswith(".gbc"):
+        rom[0x0143] = 0x80
+    checksum = 0
+    for address in range(0x0134, 0x014D):
+        checksum = (checksum - rom[address] - 1) & 0xFF
+    rom[0x014D] = checksum
+    with open(rom_path, "wb") as f:
+        f.write(rom)
+
+    init_state_path = os.path.splitext(rom_path)[0] + ".state"
+    pyboy = PyBoy(rom_path, window="null", sound_emulated=False)
+    try:
+        pyboy.tick(10, False)
+        with open(init_state_path, "wb") as f:
+            pyboy.save_state(f)
+    finally:
+        pyboy.stop(save=False)
+    return init_state_path
+
+
+def _rss_mb() -> float | None:
+    """Returns the resident memory of the process in MB or None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _pss_mb(pid: int | str = "self") -> float | None:
+    """
+    Returns the proportional set size (PSS) of a process in MB or None if unknown.
+
+    Unlike the resident memory, the PSS splits each page that is shared between
+    processes (e.g. copy-on-write after a fork) evenly among them.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) / 2**10
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def _descendant_pids() -> List[int]:
+    """Returns the IDs of all (grand-)child processes of the process."""
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return []
+
+    children = {}
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The parent ID is the second field after the name in parentheses
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids, stack = [], [os.getpid()]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            pids.append(child)
+            stack.append(child)
+    return pids
+
+
+def _sample_actions(env: Any, n_steps: int, seed: int) -> List[Any]:
+    """Returns n_steps actions sampled from the action space of the environment."""
+    env.action_space.seed(seed)
+    return [env.action_space.sample() for _ in range(n_steps)]
+
+
+def benchmark_env(
+    env_id: str,
+    rom_path: str,
+    init_state_path: str | None,
+    n_steps: int = 1000,
+    n_resets: int = 20,
+    seed: int = 0,
+) -> Dict[str, float | None]:
+    """
+    Measures the steps per second, reset latency and memory of an environment.
+
+    Args:
+        env_id (str):
+            The ID of the environment
+
+        rom_path (str):
+            The path to the ROM file
+
+        init_state_path (str | None):
+            The path to the initial state file
+
+        n_steps (int):
+            The number of steps to time
+
+        n_resets (int):
+            The number of resets to time
+
+        seed (int):
+            The seed of the resets and actions
+
+    Returns:
+        Dict[str, float | None]:
+            The steps per second, the mean reset latency in milliseconds and the
+            resident memory of the environment in MB (None if unknown)
+    """
+    gc.collect()
+    rss_before = _rss_mb()
+    env = make(env_id, rom_path=rom_path, init_state_path=init_state_path)
+    try:
+        env.reset(seed=seed)
+        rss_after = _rss_mb()
+        actions = _sample_actions(env, n_steps, seed)
+
+        start = time.perf_counter()
+        for action in actions:
+            _, _, terminated, truncated, _ = env.step(action)
+            if terminated or truncated:
+                env.reset()
+        step_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(n_resets):
+            env.reset(seed=seed + i)
+        reset_time = time.perf_counter() - start
+    finally:
+        env.close()
+
+    memory = None
+    if rss_before is not None and rss_after is not None:
+        memory = rss_after - rss_before
+    return {
+        "steps_per_second": n_steps / step_time,
+        "reset_ms": 1e3 * reset_time / n_resets,
+        "memory_mb": memory,
+    }
+
+
+def benchmark_vector_env(
+    env_id: str,
+    rom_path: str,
+    init_state_path: str | None,
+    num_envs: int,
+    vectorization_mode: str,
+    n_steps: int = 1000,
+    seed: int = 0,
+) -> Dict[str, float | None]:
+    """
+    Measures the steps per second, startup time and memory of a vectorized
+    environment.
+
+    Args:
+        env_id (str):
+            The ID of the environment
+
+        rom_path (str):
+            The path to the ROM file
+
+        init_state_path (str | None):
+            The path to the initial state file
+
+        num_envs (int):
+            The number of environments
+
+        vectorization_mode (str):
+            The vectorization mode of make_vec()
+
+        n_steps (int):
+            The number of vectorized steps to time
+
+        seed (int):
+            The seed of the reset and actions
+
+    Returns:
+        Dict[str, float | None]:
+            The (single environment) steps per second, the vectorized steps per
+            second, the time in seconds to create and reset the environments and
+            the memory (PSS) per environment in MB (None if unknown)
+    """
+    gc.collect()
+    pss_before = _pss_mb()
+    start = time.perf_counter()
+    envs = make_vec(
+        env_id,
+        num_envs=num_envs,
+        vectorization_mode=vectorization_mode,
+        rom_path=rom_path,
+        init_state_path=init_state_path,
+    )
+    try:
+        envs.reset(seed=seed)
+        startup_time = time.perf_counter() - start
+        memory = _vector_memory_mb(pss_before, num_envs)
+        actions = _sample_actions(envs, n_steps, seed)
+
+        # Vector environments reset the finished environments themselves
+        start = time.perf_counter()
+        for action in actions:
+            envs.step(action)
+        step_time = time.perf_counter() - start
+    finally:
+        envs.close()
+
+    return {
+        "steps_per_second": num_envs * n_steps / step_time,
+        "vector_steps_per_second": n_steps / step_time,
+        "startup_s": startup_time,
+        "memory_mb_per_env": memory,
+    }
+
+
+def _vector_memory_mb(pss_before: float | None, num_envs: int) -> float | None:
+    """Returns the memory (PSS) of the process and its workers per environment."""
+    pss_after = _pss_mb()
+    if pss_before is None or pss_after is None:
+        return None
+    memory = pss_after - pss_before
+    for pid in _descendant_pids():
+        memory += _pss_mb(pid) or 0.0
+    return memory / num_envs
+
+
+def _metadata(synthetic: bool) -> Dict[str, Any]:
+    """Returns the versions and machine the benchmark runs on."""
+    versions = {}
+    for package in ["gymboy", "gymnasium", "numpy", "pyboy"]:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+        "synthetic": synthetic,
+    }
+
+
+def run(
+    env_ids: Sequence[str] | None = None,
+    resources_dir: str | None = None,
+    n_steps: int = 1000,
+    n_resets: int = 20,
+    num_envs: Sequence[int] = (1, 2, 4),
+    vectorization_modes: Sequence[str] = ("sync", "async"),
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Benchmarks the environments and their vectorized versions.
+
+    Args:
+        env_ids (Sequence[str] | None):
+            The IDs of the environments.
+            If None, all registered environments are benchmarked.
+
+        resources_dir (str | None):
+            The directory with the ROMs and states of the games.
+            If None, synthetic ROMs are used.
+
+        n_steps (int):
+            The number of steps to time per environment
+
+        n_resets (int):
+            The number of resets to time per environment
+
+        num_envs (Sequence[int]):
+            The numbers of environments of the vectorized environments
+
+        vectorization_modes (Sequence[str]):
+            The vectorization modes of the vectorized environments
+
+        seed (int):
+            The seed of the resets and actions
+
+    Returns:
+        Dict[str, Any]:
+            The metadata of the run and the results of each environment
+    """
+    env_ids = registered_envs if env_ids is None else list(env_ids)
+    for env_id in env_ids:
+        if env_id not in registered_envs:
+            raise ValueError(f"{env_id} is not in registered gymboy environments.")
+
+    results = {"metadata": _metadata(synthetic=resources_dir is None), "envs": {}}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for env_id in env_ids:
+            game, variant = split_env_id(env_id)
+            rom_file, state_file = GAMES[game]
+            if resources_dir is None:
+                rom_path = os.path.join(tmp_dir, os.path.basename(rom_file))
+                if not os.path.exists(rom_path):
+                    synthetic_rom(CARTRIDGE_TITLES[game], rom_path)
+                init_state_path = os.path.splitext(rom_path)[0] + ".state"
+            else:
+                rom_path = os.path.join(resources_dir, rom_file)
+                init_state_path = os.path.join(resources_dir, state_file)
+
+            result = {"game": game, "variant": variant}
+            result.update(
+                benchmark_env(
+                    env_id,
+                    rom_path,
+                    init_state_path,
+                    n_steps=n_steps,
+                    n_resets=n_resets,
+                    seed=seed,
+                )
+            )
+            result["vector"] = [
+                {
+                    "vectorization_mode": vectorization_mode,
+                    "num_envs": n,
+                    **benchmark_vector_env(
+                        env_id,
+                        rom_path,
+                        init_state_path,
+                        num_envs=n,
+                        vectorization_mode=vectorization_mode,
+                        n_steps=n_steps,
+                        seed=seed,
+                    ),
+                }
+                for vectorization_mode in vectorization_modes
+                for n in num_envs
+            ]
+            results["envs"][env_id] = result
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--env-ids", type=str, nargs="+", default=None)
+    parser.add_argument("--resources-dir", type=str, default=None)
+    parser.add_argument("--n-steps", type=int, default=1000)
+    parser.add_argument("--n-resets", type=int, default=20)
+    parser.add_argument("--num-envs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument(
+        "--vectorization-modes",
+        type=str,
+        nargs="+",
+        default=["sync", "async"],
+        choices=[
+            "async",
+            "sync",
+            "shared_memory",
+            "fork_server",
+            "double_buffer",
+            "work_stealing",
+        ],
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    results = run(
+        env_ids=args.env_ids,
+        resources_dir=args.resources_dir,
+        n_steps=args.n_steps,
+        n_resets=args.n_resets,
+        num_envs=args.num_envs,
+        vectorization_modes=args.vectorization_modes,
+        seed=args.seed,
+    )
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    for env_id, result in results["envs"].items():
+        print(
+            f"{env_id:40s} {result['steps_per_second']:10.1f} steps/s "
+            f"{result['reset_ms']:8.2f} ms/reset",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
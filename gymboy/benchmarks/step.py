@@ -0,0 +1,84 @@
+"""
+Benchmarks the overhead of the action validation of step() on a FakePyBoy, i.e.
+without emulation, with the spaces built on each access (as before), with the
+cached spaces and with trusted actions (as in SharedMemoryVectorEnv).
+
+Usage:
+    python -m gymboy.benchmarks.step --env-id Tetris-flatten-v1 --number 10000
+"""
+
+import argparse
+import timeit
+from typing import Dict
+
+import gymnasium as gym
+from gymnasium import spaces
+from gymnasium.core import ActType
+
+from gymboy.testing import make_fake
+
+
+def _legacy_step(env: gym.Env, action: ActType):
+    """Performs a step the way step() used to validate the action."""
+    if not spaces.Discrete(n=len(env.actions)).contains(action):
+        raise ValueError(f"{action} ({type(action)}) invalid.")
+    env.step(action)
+
+
+def run(
+    env_id: str = "Tetris-flatten-v1", number: int = 10000, seed: int = 0
+) -> Dict[str, float]:
+    """
+    Measures the time per step of an environment on a FakePyBoy.
+
+    Args:
+        env_id (str):
+            The ID of the registered environment
+
+        number (int):
+            The number of steps to time
+
+        seed (int):
+            The seed for the actions
+
+    Returns:
+        Dict[str, float]:
+            The time per step in microseconds with the legacy validation, the
+            validation with the cached spaces and without validation
+    """
+    env = make_fake(env_id).unwrapped
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [int(env.action_space.sample()) for _ in range(number)]
+
+    def _time(step) -> float:
+        iterator = iter(actions)
+        return 1e6 * timeit.timeit(lambda: step(next(iterator)), number=number) / number
+
+    env.trust_actions = True
+    legacy_us = _time(lambda action: _legacy_step(env, action))
+    trusted_us = _time(env.step)
+    env.trust_actions = False
+    validated_us = _time(env.step)
+    env.close()
+    return {
+        "legacy_us": legacy_us,
+        "validated_us": validated_us,
+        "trusted_us": trusted_us,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--env-id", type=str, default="Tetris-flatten-v1")
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    results = run(env_id=args.env_id, number=args.number)
+    print(f"spaces built on each access: {results['legacy_us']:8.2f} us/step")
+    print(f"cached spaces:               {results['validated_us']:8.2f} us/step")
+    print(f"trusted actions:             {results['trusted_us']:8.2f} us/step")
+
+
+if __name__ == "__main__":
+    main()
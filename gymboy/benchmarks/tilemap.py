@@ -0,0 +1,96 @@
+"""
+Benchmarks the game area of the Pokemon Yellow and Gen 2 *Flatten and
+*MinimalImage environments.
+
+Usage:
+    python -m gymboy.benchmarks.tilemap --rom-path pokemon_gold.gbc --number 1000
+"""
+
+import argparse
+import timeit
+from typing import Dict
+
+import numpy as np
+from pyboy import PyBoy
+
+from gymboy.utils import tilemap_game_area
+
+
+def _loop_game_area(pyboy: PyBoy) -> np.ndarray:
+    """Returns the game area the way the environments used to."""
+    area = np.ndarray(shape=(18, 20), dtype=np.uint32)
+    for y in range(18):
+        SCX = pyboy.screen.tilemap_position_list[y * 8][0] // 8
+        SCY = pyboy.screen.tilemap_position_list[y * 8][1] // 8
+        for x in range(20):
+            area[y, x] = pyboy.tilemap_background.tile_identifier(
+                (x + SCX) % 32, (y + SCY) % 32
+            )
+
+    for s in [pyboy.get_sprite(s) for s in range(40)]:
+        if 0 <= s.y // 8 < 18 and 0 <= s.x // 8 < 20:
+            area[s.y // 8][s.x // 8] = s.tile_identifier
+    return area
+
+
+def run(
+    rom_path: str, init_state_path: str | None = None, number: int = 1000
+) -> Dict[str, float]:
+    """
+    Measures the time per call of both game area implementations.
+
+    Args:
+        rom_path (str):
+            The path to the ROM file
+
+        init_state_path (str | None):
+            The path to the initial state file
+
+        number (int):
+            The number of calls to time
+
+    Returns:
+        Dict[str, float]:
+            The time per call in microseconds of both implementations
+    """
+    pyboy = PyBoy(rom_path, window="null", sound_emulated=False)
+    if init_state_path is not None:
+        with open(init_state_path, "rb") as f:
+            pyboy.load_state(f)
+    pyboy.tick(60)
+
+    try:
+        if not np.array_equal(_loop_game_area(pyboy), tilemap_game_area(pyboy)):
+            raise RuntimeError("tilemap_game_area() is not identical to the loop.")
+
+        loop_time = timeit.timeit(lambda: _loop_game_area(pyboy), number=number)
+        vectorized_time = timeit.timeit(lambda: tilemap_game_area(pyboy), number=number)
+    finally:
+        pyboy.stop(save=False)
+
+    return {
+        "loop_us": 1e6 * loop_time / number,
+        "tilemap_game_area_us": 1e6 * vectorized_time / number,
+        "speedup": loop_time / vectorized_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--rom-path", type=str, required=True)
+    parser.add_argument("--init-state-path", type=str, default=None)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = run(
+        rom_path=args.rom_path,
+        init_state_path=args.init_state_path,
+        number=args.number,
+    )
+    print(f"loop:              {results['loop_us']:8.1f} us/call")
+    print(f"tilemap_game_area: {results['tilemap_game_area_us']:8.1f} us/call")
+    print(f"speedup:           {results['speedup']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,93 @@
 """Gymboy environments."""
 
-# Kirby environments
-from .kirby import (
-    KirbyDreamLand1Flatten,
-    KirbyDreamLand1FullImage,
-    KirbyDreamLand1MinimalImage,
-)
+import importlib
+from typing import Any, List
 
-# Mario environments
-from .mario import (
-    SuperMarioLand1Flatten,
-    SuperMarioLand1FullImage,
-    SuperMarioLand1MinimalImage,
-)
+# The sub-package of each environment, which is only imported on first access
+_MODULES = {
+    # Kirby environments
+    "KirbyDreamLand1Flatten": ".kirby",
+    "KirbyDreamLand1FullImage": ".kirby",
+    "KirbyDreamLand1GrayscaleImage": ".kirby",
+    "KirbyDreamLand1MinimalImage": ".kirby",
+    # Pokemon environments
+    "PokemonBlueFlatten": ".pokemon",
+    "PokemonBlueFullImage": ".pokemon",
+    "PokemonBlueGrayscaleImage": ".pokemon",
+    "PokemonBlueMinimalImage": ".pokemon",
+    "PokemonGoldFlatten": ".pokemon",
+    "PokemonGoldFullImage": ".pokemon",
+    "PokemonGoldGrayscaleImage": ".pokemon",
+    "PokemonGoldMinimalImage": ".pokemon",
+    "PokemonRedFlatten": ".pokemon",
+    "PokemonRedFullImage": ".pokemon",
+    "PokemonRedGrayscaleImage": ".pokemon",
+    "PokemonRedMinimalImage": ".pokemon",
+    "PokemonSilverFlatten": ".pokemon",
+    "PokemonSilverFullImage": ".pokemon",
+    "PokemonSilverGrayscaleImage": ".pokemon",
+    "PokemonSilverMinimalImage": ".pokemon",
+    "PokemonYellowFlatten": ".pokemon",
+    "PokemonYellowFullImage": ".pokemon",
+    "PokemonYellowGrayscaleImage": ".pokemon",
+    "PokemonYellowMinimalImage": ".pokemon",
+    # Mario environments
+    "SuperMarioLand1Flatten": ".mario",
+    "SuperMarioLand1FullImage": ".mario",
+    "SuperMarioLand1GrayscaleImage": ".mario",
+    "SuperMarioLand1MinimalImage": ".mario",
+    # Tetris environments
+    "TetrisFlatten": ".tetris",
+    "TetrisFullImage": ".tetris",
+    "TetrisGrayscaleImage": ".tetris",
+    "TetrisMinimalImage": ".tetris",
+}
 
-# Pokemon environments
-from .pokemon import (
-    PokemonBlueFlatten,
-    PokemonBlueFullImage,
-    PokemonBlueMinimalImage,
-    PokemonGoldFlatten,
-    PokemonGoldFullImage,
-    PokemonGoldMinimalImage,
-    PokemonRedFlatten,
-    PokemonRedFullImage,
-    PokemonRedMinimalImage,
-    PokemonSilverFlatten,
-    PokemonSilverFullImage,
-    PokemonSilverMinimalImage,
-    PokemonYellowFlatten,
-    PokemonYellowFullImage,
-    PokemonYellowMinimalImage,
-)
 
-# Tetris environments
-from .tetris import TetrisFlatten, TetrisFullImage, TetrisMinimalImage
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "KirbyDreamLand1Flatten",
     "KirbyDreamLand1FullImage",
+    "KirbyDreamLand1GrayscaleImage",
     "KirbyDreamLand1MinimalImage",
     "PokemonBlueFlatten",
     "PokemonBlueFullImage",
+    "PokemonBlueGrayscaleImage",
     "PokemonBlueMinimalImage",
     "PokemonGoldFlatten",
     "PokemonGoldFullImage",
+    "PokemonGoldGrayscaleImage",
     "PokemonGoldMinimalImage",
     "PokemonRedFlatten",
     "PokemonRedFullImage",
+    "PokemonRedGrayscaleImage",
     "PokemonRedMinimalImage",
     "PokemonSilverFlatten",
     "PokemonSilverFullImage",
+    "PokemonSilverGrayscaleImage",
     "PokemonSilverMinimalImage",
     "PokemonYellowFlatten",
     "PokemonYellowFullImage",
+    "PokemonYellowGrayscaleImage",
     "PokemonYellowMinimalImage",
     "SuperMarioLand1Flatten",
     "SuperMarioLand1FullImage",
+    "SuperMarioLand1GrayscaleImage",
     "SuperMarioLand1MinimalImage",
     "TetrisFlatten",
     "TetrisFullImage",
+    "TetrisGrayscaleImage",
     "TetrisMinimalImage",
 ]
 
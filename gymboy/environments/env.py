@@ -1,6 +1,9 @@
+import io
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, SupportsFloat, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, Sequence, SupportsFloat, Tuple
 
 import gymnasium as gym
 import numpy as np
@@ -8,6 +11,8 @@ from gymnasium import spaces
 from gymnasium.core import ActType, ObsType, RenderFrame
 from pyboy import PyBoy
 
+from gymboy.utils import ObservationBuffer, PhaseProfiler, PyBoySnapshot, Schema
+
 
 class PyBoyEnv(gym.Env, ABC):
     """
@@ -31,8 +36,52 @@ class PyBoyEnv(gym.Env, ABC):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+            With "auto" the screen is only rendered if the observation needs pixels.
+
+        memory_ranges (List[Tuple[int, int]] | None):
+            The [start, end) address ranges of the memory that are copied once per step.
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        schema (Schema | None):
+            The schema of the fields that are decoded once per step.
     """
 
+    # Whether the observation is built from the rendered screen
+    _requires_rendering = True
+
+    # The name and size of each slice of a flat observation or None
+    _observation_layout: List[Tuple[str, int]] | None = None
+
+    # The phases of step() and reset() that are recorded with profile=True
+    _profiled_phases = [
+        "action",
+        "emulation",
+        "observation",
+        "reward",
+        "termination",
+        "reset",
+    ]
+
     def __init__(
         self,
         cartridge_title: str,
@@ -41,39 +90,84 @@ class PyBoyEnv(gym.Env, ABC):
         n_frameskip: int = 1,
         sound: bool = False,
         render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        memory_ranges: List[Tuple[int, int]] | None = None,
+        schema: Schema | None = None,
     ):
-        if not rom_path.endswith(".gb") and not rom_path.endswith(".gbc"):
-            raise ValueError(f"'{rom_path}' is not referring to a ROM file.")
-        if not os.path.exists(rom_path):
-            raise FileNotFoundError(f"ROM file '{rom_path}' not found.")
-        if not init_state_path.endswith(".state"):
-            raise ValueError(f"'{init_state_path}' is not referring to a state file.")
-        if not os.path.exists(init_state_path):
-            raise FileNotFoundError(f"State file '{init_state_path}' not found.")
+        if pyboy is None:
+            if not rom_path.endswith(".gb") and not rom_path.endswith(".gbc"):
+                raise ValueError(f"'{rom_path}' is not referring to a ROM file.")
+            if not os.path.exists(rom_path):
+                raise FileNotFoundError(f"ROM file '{rom_path}' not found.")
+        if init_state is None and init_state_path is not None:
+            if not init_state_path.endswith(".state"):
+                raise ValueError(
+                    f"'{init_state_path}' is not referring to a state file."
+                )
+            if not os.path.exists(init_state_path):
+                raise FileNotFoundError(f"State file '{init_state_path}' not found.")
+
+            # Read the initial state once instead of on every reset
+            with open(init_state_path, "rb") as f:
+                init_state = f.read()
         if n_frameskip <= 0:
             raise ValueError(f"n_frameskip must be greater than 0, got {n_frameskip}.")
+        if render_policy not in ["auto", "always", "never"]:
+            raise ValueError(f"Invalid render policy '{render_policy}'.")
 
         self.cartridge_title = cartridge_title
         self.rom_path = rom_path
         self.init_state_path = init_state_path
+        self.init_state = init_state
         self.sound = sound
         self.render_mode = render_mode
+        self.render_policy = render_policy
+        self.copy_observation = copy_observation
+        self.skipped_frames = 0
+
+        # The time of each phase is only recorded if profiling is enabled
+        self.profiler = PhaseProfiler(self._profiled_phases) if profile else None
+
+        # If True, the screen is the maximum of the last two frames of each step,
+        # e.g. to remove flickering sprites (see gymboy.wrappers.FrameStack)
+        self.max_pool = False
+        self._pooled_screen = None
+
+        # If True, step() and step_many() skip the validation of the actions, e.g.
+        # for vector environments that already validated the batch of actions
+        self.trust_actions = False
 
         # Default actions for the gameboy color
         self.actions = ["", "a", "b", "left", "right", "up", "down", "start", "select"]
 
         # Create the environment
         if self.render_mode == "human":
-            self.pyboy = PyBoy(gamerom=rom_path, sound_emulated=self.sound)
+            if pyboy is None:
+                pyboy = PyBoy(gamerom=rom_path, sound_emulated=self.sound)
+            self.pyboy = pyboy
             self.pyboy.set_emulation_speed(1)
             self.n_frameskip = 1
         else:
-            self.pyboy = PyBoy(
-                gamerom=rom_path, sound_emulated=self.sound, window="null"
-            )
+            if pyboy is None:
+                pyboy = PyBoy(
+                    gamerom=rom_path, sound_emulated=self.sound, window="null"
+                )
+            self.pyboy = pyboy
             self.pyboy.set_emulation_speed(0)
             self.n_frameskip = n_frameskip
 
+        # Only render the last frame of a step if someone is looking at it
+        if self.render_mode == "human" or self.render_policy == "always":
+            self._render_last_frame = True
+        elif self.render_policy == "never":
+            self._render_last_frame = False
+        else:
+            self._render_last_frame = self._requires_rendering
+
         # Check if the cartridge title is correct
         if self.pyboy.cartridge_title != self.cartridge_title:
             raise ValueError(
@@ -81,13 +175,26 @@ class PyBoyEnv(gym.Env, ABC):
                 + f"expected '{self.cartridge_title}'."
             )
 
+        # The memory readers work on a copy of the memory taken once per step
+        self.ram = PyBoySnapshot(self.pyboy, memory_ranges or [], schema)
+        self.ram.update()
+
+        # The flat observation is filled in place on each step
+        self.observation_buffer = None
+        if self._observation_layout is not None:
+            self.observation_buffer = ObservationBuffer(self._observation_layout)
+
     @property
     @abstractmethod
     def observation_space(self) -> spaces.Space:
-        """Returns the observation space of the environment."""
+        """
+        Returns the observation space of the environment.
+
+        The subclasses build it once per instance with @cached_property.
+        """
         pass
 
-    @property
+    @cached_property
     def action_space(self) -> spaces.Space:
         """Returns the action space of the environment."""
         return spaces.Discrete(n=len(self.actions))
@@ -96,51 +203,309 @@ class PyBoyEnv(gym.Env, ABC):
         self,
         action: ActType,
     ) -> Tuple[ObsType, SupportsFloat, bool, bool, Dict[str, Any]]:
-        if not self.action_space.contains(action):
-            raise ValueError(f"{action} ({type(action)}) invalid.")
+        if self.profiler is not None:
+            return self._profiled_step(action)
 
-        # Perform the action
-        if action == 0:
-            pass
-        else:
-            self.pyboy.button(self.actions[action])
+        if not self.trust_actions:
+            self._validate_action(action)
 
-        # Progress the game
-        self.pyboy.tick(self.n_frameskip)
+        # Perform the action and progress the game
+        self._perform(action)
 
         # Get the observation, reward, done and info
         observation = self.observation()
         reward = self.reward()
         terminated = self.terminated()
         truncated = self.truncated()
-        info = {}
+        info = self.info()
 
         return observation, reward, terminated, truncated, info
 
+    def _validate_action(self, action: ActType):
+        """Raises a ValueError if the action is not in the action space."""
+        # Fast path: An integer in [0, n) is a valid discrete action
+        if isinstance(action, (int, np.integer)) and 0 <= action < self.action_space.n:
+            return
+        if not self.action_space.contains(action):
+            raise ValueError(f"{action} ({type(action)}) invalid.")
+
+    def _profiled_step(
+        self,
+        action: ActType,
+    ) -> Tuple[ObsType, SupportsFloat, bool, bool, Dict[str, Any]]:
+        """Performs step() and records the time of each phase."""
+        reward, terminated, truncated = self._transition(
+            action, validate=not self.trust_actions
+        )
+
+        # Get the observation and info
+        start = time.perf_counter()
+        observation = self.observation()
+        info = self.info()
+        self.profiler.record("observation", start)
+
+        return observation, reward, terminated, truncated, info
+
+    def _transition(
+        self, action: ActType, validate: bool
+    ) -> Tuple[SupportsFloat, bool, bool]:
+        """
+        Performs the action and returns the reward and the terminated and truncated
+        flags, where the time of each phase is recorded if profiling is enabled.
+        """
+        start = time.perf_counter() if self.profiler is not None else 0.0
+        if validate:
+            self._validate_action(action)
+
+        # Perform the action and progress the game
+        self._dispatch(action)
+        start = self._record("action", start)
+        self._progress()
+        start = self._record("emulation", start)
+
+        # Get the reward and done
+        reward = self.reward()
+        start = self._record("reward", start)
+        terminated = self.terminated()
+        truncated = self.truncated()
+        self._record("termination", start)
+
+        return reward, terminated, truncated
+
+    def _record(self, phase: str, start: float) -> float:
+        """Records the time since start of the phase if profiling is enabled."""
+        if self.profiler is None:
+            return start
+        return self.profiler.record(phase, start)
+
+    def step_many(
+        self,
+        actions: Sequence[ActType],
+        observe_every: int | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Performs a sequence of actions in one call.
+
+        The observation is only built every observe_every steps and after the last
+        performed step. The sequence stops early if the episode terminates or gets
+        truncated.
+
+        Args:
+            actions (Sequence[ActType]):
+                The actions to perform
+
+            observe_every (int | None):
+                The number of steps between two observations.
+                If None, only the observation after the last step is built.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+                The stacked observations, rewards, terminated and truncated flags of
+                the performed steps and the info with the indices of the observed
+                steps under "observation_steps"
+        """
+        if len(actions) == 0:
+            raise ValueError("actions must contain at least one action.")
+        if observe_every is not None and observe_every <= 0:
+            raise ValueError(
+                f"observe_every must be greater than 0, got {observe_every}."
+            )
+        if not self.trust_actions:
+            for action in actions:
+                self._validate_action(action)
+
+        observations, observation_steps = [], []
+        rewards, terminations, truncations = [], [], []
+        for t, action in enumerate(actions):
+            reward, terminated, truncated = self._transition(action, validate=False)
+            rewards.append(reward)
+            terminations.append(terminated)
+            truncations.append(truncated)
+
+            # Get the observation (if necessary)
+            done = terminated or truncated
+            if (
+                done
+                or t == len(actions) - 1
+                or (observe_every is not None and (t + 1) % observe_every == 0)
+            ):
+                start = time.perf_counter()
+                observation = self.observation()
+                if not self.copy_observation:
+                    observation = observation.copy()
+                observations.append(observation)
+                self._record("observation", start)
+                observation_steps.append(t)
+            if done:
+                break
+
+        return (
+            np.stack(observations),
+            np.array(rewards, dtype=np.float64),
+            np.array(terminations, dtype=np.bool_),
+            np.array(truncations, dtype=np.bool_),
+            {"observation_steps": np.array(observation_steps)},
+        )
+
     def reset(
         self,
         *,
         seed: int | None = None,
         options: Dict[str, Any] | None = None,
     ) -> Tuple[ObsType, Dict[str, Any]]:
-        if self.init_state_path is None:
+        start = time.perf_counter()
+        if self.init_state is None:
             # Case: Reset the game
             self.pyboy.game_wrapper.reset_game(seed)
         else:
             # Case: Load the initial game state
-            with open(self.init_state_path, "rb") as f:
-                self.pyboy.load_state(f)
-                self.pyboy.game_wrapper._set_timer_div(seed)
+            self.pyboy.load_state(io.BytesIO(self.init_state))
+            self.pyboy.game_wrapper._set_timer_div(seed)
 
         # Progress the game
-        self.pyboy.tick(1)
+        self.pyboy.tick(1, self._render_last_frame)
+        self.ram.update()
+        if self.max_pool:
+            self._pool_screen(reset=True)
 
         # Get the initial observation and info
+        self.skipped_frames = 0
         observation = self.observation()
-        info = {}
+        info = self.info()
 
+        if self.profiler is not None:
+            self.profiler.record("reset", start)
         return observation, info
 
+    def _perform(self, action: ActType):
+        """Performs the action and progresses the game by n_frameskip frames."""
+        self._dispatch(action)
+        self._progress()
+
+    def _dispatch(self, action: ActType):
+        """Presses the button of the action."""
+        if action == 0:
+            pass
+        else:
+            self.pyboy.button(self.actions[action])
+
+    def _progress(self):
+        """Progresses the game by n_frameskip frames."""
+        self._tick(self.n_frameskip)
+        self.skipped_frames = self._fast_forward()
+        if self.skipped_frames > 0 and self.max_pool:
+            self._pool_screen(reset=True)
+        self.ram.update()
+
+    def _tick(self, count: int):
+        """
+        Progresses the game by count frames.
+
+        PyBoy skips rendering for all but the last frame. With max_pool, the screen
+        before the last frame is max-pooled with the last frame.
+
+        Args:
+            count (int):
+                The number of frames
+        """
+        if not self.max_pool:
+            self.pyboy.tick(count, self._render_last_frame)
+            return
+
+        if count > 1:
+            self.pyboy.tick(count - 1, True)
+        self._pool_screen(reset=True)
+        self.pyboy.tick(1, True)
+        self._pool_screen(reset=False)
+
+    def _pool_screen(self, reset: bool):
+        """Copies (reset=True) or max-pools the current screen into the pooled one."""
+        if self._pooled_screen is None:
+            self._pooled_screen = np.empty_like(self.pyboy.screen.ndarray)
+        if reset:
+            np.copyto(self._pooled_screen, self.pyboy.screen.ndarray)
+        else:
+            np.maximum(
+                self._pooled_screen, self.pyboy.screen.ndarray, out=self._pooled_screen
+            )
+
+    def screen(self) -> np.ndarray:
+        """
+        Returns the current RGBA screen.
+
+        Returns:
+            np.ndarray:
+                The (144, 160, 4) screen or the maximum of the last two frames of the
+                screen if max_pool is True
+        """
+        if self.max_pool and self._pooled_screen is not None:
+            return self._pooled_screen
+        return self.pyboy.screen.ndarray
+
+    def _fast_forward(self) -> int:
+        """
+        Progresses the game while the player has no control, e.g. in text boxes.
+
+        Returns:
+            int:
+                The number of skipped frames
+        """
+        return 0
+
+    def snapshot(self, buffer: io.BytesIO | None = None) -> io.BytesIO:
+        """
+        Saves the current state of the game into an in-memory buffer.
+
+        Args:
+            buffer (io.BytesIO | None):
+                The buffer to overwrite, e.g. of a snapshot that is no longer needed.
+                If None, a new buffer is allocated.
+
+        Returns:
+            io.BytesIO:
+                The buffer with the saved state
+        """
+        if buffer is None:
+            buffer = io.BytesIO()
+        buffer.seek(0)
+        self.pyboy.save_state(buffer)
+        buffer.truncate()
+        return buffer
+
+    def restore(self, buffer: io.BytesIO):
+        """
+        Loads a state of the game that was saved with snapshot().
+
+        Args:
+            buffer (io.BytesIO):
+                The buffer with the saved state
+        """
+        buffer.seek(0)
+        self.pyboy.load_state(buffer)
+        self.ram.update()
+        if self.max_pool:
+            self._pool_screen(reset=True)
+
+    def perf_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the recorded time of each phase of step() and reset().
+
+        The phases are "action" (validating and pressing the buttons), "emulation"
+        (progressing the game), "observation" (observation() and info()), "reward",
+        "termination" (terminated() and truncated()) and "reset". The steps of
+        step_many() are recorded as well, where the actions are validated up front
+        (not part of "action") and "observation" is only recorded for the observed
+        steps.
+
+        Returns:
+            Dict[str, Dict[str, Any]]:
+                The stats of each phase (see PhaseProfiler.stats()) or an empty
+                dictionary if the environment was created with profile=False
+        """
+        if self.profiler is None:
+            return {}
+        return self.profiler.stats()
+
     def render(self) -> RenderFrame | list[RenderFrame] | None:
         return None
 
@@ -152,6 +517,10 @@ class PyBoyEnv(gym.Env, ABC):
         """Returns the current observation."""
         pass
 
+    def info(self) -> Dict[str, Any]:
+        """Returns the current info."""
+        return {}
+
     @abstractmethod
     def reward(self) -> float:
         """Returns the current reward."""
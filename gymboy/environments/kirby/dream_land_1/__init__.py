@@ -3,12 +3,14 @@
 from .kirby_dream_land_1 import (
     KirbyDreamLand1Flatten,
     KirbyDreamLand1FullImage,
+    KirbyDreamLand1GrayscaleImage,
     KirbyDreamLand1MinimalImage,
 )
 
 __all__ = [
     "KirbyDreamLand1Flatten",
     "KirbyDreamLand1FullImage",
+    "KirbyDreamLand1GrayscaleImage",
     "KirbyDreamLand1MinimalImage",
 ]
 
@@ -1,6 +1,8 @@
 # Memory ADRs:
 # https://datacrystal.tcrf.net/wiki/Kirby%27s_Dream_Land/RAM_map
 
+from gymboy.utils import Field, Schema
+
 # (4 Bytes) Score
 SCORE_ADDRESS = 0xD070
 
@@ -12,3 +14,13 @@ BOSS_HEALTH_ADDRESS = 0xD093
 
 # (1 Byte) Lives left
 LIVES_ADDRESS = 0xD089
+
+# Fields that are decoded once per step
+SCHEMA = Schema(
+    [
+        Field("score", SCORE_ADDRESS, width=4, encoding="reduced_bcd"),
+        Field("kirby_health", KIRBY_HEALTH_ADDRESS),
+        Field("boss_health", BOSS_HEALTH_ADDRESS),
+        Field("lives", LIVES_ADDRESS),
+    ]
+)
@@ -1,14 +1,24 @@
-from pyboy import PyBoy
+from typing import Dict
 
 import numpy as np
-from gymboy.utils.binary import reduced_bcds_to_integer
+from pyboy import PyBoy
+
+from ._constant import SCHEMA
+
+
+def _fields(pyboy: PyBoy) -> Dict[str, np.ndarray]:
+    """
+    Returns the decoded fields of the memory.
 
-from ._constant import (
-    BOSS_HEALTH_ADDRESS,
-    KIRBY_HEALTH_ADDRESS,
-    LIVES_ADDRESS,
-    SCORE_ADDRESS,
-)
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The decoded value of each field
+    """
+    return SCHEMA.extract(pyboy)
 
 
 def _score(pyboy: PyBoy) -> int:
@@ -23,7 +33,7 @@ def _score(pyboy: PyBoy) -> int:
         int:
             The current score of the game
     """
-    return 10 * reduced_bcds_to_integer(pyboy.memory[SCORE_ADDRESS : SCORE_ADDRESS + 4])
+    return 10 * int(_fields(pyboy)["score"])
 
 
 def _kirby_health(pyboy: PyBoy) -> int:
@@ -38,7 +48,7 @@ def _kirby_health(pyboy: PyBoy) -> int:
         int:
             The current health of kirby
     """
-    return pyboy.memory[KIRBY_HEALTH_ADDRESS]
+    return int(_fields(pyboy)["kirby_health"])
 
 
 def _boss_health(pyboy: PyBoy) -> int:
@@ -53,7 +63,7 @@ def _boss_health(pyboy: PyBoy) -> int:
         int:
             The current health of the boss
     """
-    return pyboy.memory[BOSS_HEALTH_ADDRESS]
+    return int(_fields(pyboy)["boss_health"])
 
 
 def _lives(pyboy: PyBoy) -> int:
@@ -68,7 +78,7 @@ def _lives(pyboy: PyBoy) -> int:
         int:
             The current number of lives of the game
     """
-    return pyboy.memory[LIVES_ADDRESS]
+    return int(_fields(pyboy)["lives"])
 
 
 def _game_over(pyboy: PyBoy) -> bool:
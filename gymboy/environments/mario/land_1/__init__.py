@@ -3,12 +3,14 @@
 from .super_mario_land_1 import (
     SuperMarioLand1Flatten,
     SuperMarioLand1FullImage,
+    SuperMarioLand1GrayscaleImage,
     SuperMarioLand1MinimalImage,
 )
 
 __all__ = [
     "SuperMarioLand1Flatten",
     "SuperMarioLand1FullImage",
+    "SuperMarioLand1GrayscaleImage",
     "SuperMarioLand1MinimalImage",
 ]
 
@@ -2,6 +2,8 @@
 # https://datacrystal.tcrf.net/wiki/Super_Mario_Land/RAM_map
 
 
+from gymboy.utils import Field, Schema
+
 # (3 Bytes) Score
 SCORE_ADDRESS = 0xC0A0
 
@@ -25,3 +27,17 @@ GAME_OVER_ADDRESS = 0xC0A4
 
 # (1 Byte) Level complete Flag
 LEVEL_COMPLETE = 0xFFB3
+
+# Fields that are decoded once per step
+SCHEMA = Schema(
+    [
+        Field("score", SCORE_ADDRESS, width=3, encoding="bcd", byteorder="little"),
+        Field("world_level", WORLD_LEVEL_ADDRESS),
+        Field("coins", COINS_ADDRESS, width=2, encoding="reduced_bcd"),
+        Field("lives", LIVES_ADDRESS, encoding="reduced_bcd"),
+        Field("time", TIMES_ADDRESS, width=3, encoding="reduced_bcd"),
+        Field("time_up", TIME_UP_ADDRESS),
+        Field("level_complete", LEVEL_COMPLETE),
+        Field("game_over", GAME_OVER_ADDRESS),
+    ]
+)
@@ -1,19 +1,24 @@
-from typing import Tuple
+from typing import Dict, Tuple
+
 import numpy as np
 from pyboy import PyBoy
 
-from gymboy.utils import bcds_to_integer, reduced_bcds_to_integer
+from ._constant import SCHEMA
+
+
+def _fields(pyboy: PyBoy) -> Dict[str, np.ndarray]:
+    """
+    Returns the decoded fields of the memory.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
 
-from ._constant import (
-    COINS_ADDRESS,
-    GAME_OVER_ADDRESS,
-    LEVEL_COMPLETE,
-    LIVES_ADDRESS,
-    SCORE_ADDRESS,
-    TIME_UP_ADDRESS,
-    TIMES_ADDRESS,
-    WORLD_LEVEL_ADDRESS,
-)
+    Returns:
+        Dict[str, np.ndarray]:
+            The decoded value of each field
+    """
+    return SCHEMA.extract(pyboy)
 
 
 def _score(pyboy: PyBoy) -> int:
@@ -28,7 +33,7 @@ def _score(pyboy: PyBoy) -> int:
         int:
             The current score of the game
     """
-    return bcds_to_integer(reversed(pyboy.memory[SCORE_ADDRESS : SCORE_ADDRESS + 3]))
+    return int(_fields(pyboy)["score"])
 
 
 def _world_level(pyboy: PyBoy) -> Tuple[int, int]:
@@ -43,10 +48,8 @@ def _world_level(pyboy: PyBoy) -> Tuple[int, int]:
         Tuple[int, int]:
             The current (world, level) of the game
     """
-    return (
-        pyboy.memory[WORLD_LEVEL_ADDRESS] >> 4,
-        pyboy.memory[WORLD_LEVEL_ADDRESS] & 0x0F,
-    )
+    world_level = int(_fields(pyboy)["world_level"])
+    return world_level >> 4, world_level & 0x0F
 
 
 def _coins(pyboy: PyBoy) -> int:
@@ -61,7 +64,7 @@ def _coins(pyboy: PyBoy) -> int:
         int:
             The current number of coins of the game
     """
-    return reduced_bcds_to_integer(pyboy.memory[COINS_ADDRESS : COINS_ADDRESS + 2])
+    return int(_fields(pyboy)["coins"])
 
 
 def _lives(pyboy: PyBoy) -> int:
@@ -76,7 +79,7 @@ def _lives(pyboy: PyBoy) -> int:
         int:
             The current number of lives of the game
     """
-    return reduced_bcds_to_integer([pyboy.memory[LIVES_ADDRESS]])
+    return int(_fields(pyboy)["lives"])
 
 
 def _time(pyboy: PyBoy) -> int:
@@ -91,7 +94,7 @@ def _time(pyboy: PyBoy) -> int:
         int:
             The current time of the game
     """
-    return reduced_bcds_to_integer(pyboy.memory[TIMES_ADDRESS : TIMES_ADDRESS + 3])
+    return int(_fields(pyboy)["time"])
 
 
 def _time_over(pyboy: PyBoy) -> bool:
@@ -106,7 +109,7 @@ def _time_over(pyboy: PyBoy) -> bool:
         bool:
             The time is over
     """
-    return pyboy.memory[TIME_UP_ADDRESS] == 0xFF
+    return int(_fields(pyboy)["time_up"]) == 0xFF
 
 
 def _level_finished(pyboy: PyBoy) -> bool:
@@ -121,7 +124,7 @@ def _level_finished(pyboy: PyBoy) -> bool:
         bool:
             The level is finished
     """
-    return 0x05 <= pyboy.memory[LEVEL_COMPLETE] <= 0x07
+    return 0x05 <= int(_fields(pyboy)["level_complete"]) <= 0x07
 
 
 def _game_over(pyboy: PyBoy) -> bool:
@@ -136,7 +139,7 @@ def _game_over(pyboy: PyBoy) -> bool:
         bool:
             The game is over
     """
-    return pyboy.memory[GAME_OVER_ADDRESS] == 0x39
+    return int(_fields(pyboy)["game_over"]) == 0x39
 
 
 def _game_area(pyboy: PyBoy) -> np.ndarray:
@@ -1,14 +1,22 @@
 """Super Mario Land 1 environments."""
 
 from abc import ABC
+from functools import cached_property
 
 import numpy as np
-import skimage as ski
 from gymnasium import spaces
+from pyboy import PyBoy
 
 
 from gymboy.environments.env import PyBoyEnv
+from gymboy.utils import (
+    downsampled_shape,
+    rgba_to_grayscale,
+    rgba_to_palette_index,
+    rgba_to_rgb,
+)
 
+from ._constant import SCHEMA
 from ._memory import (
     _coins,
     _game_area,
@@ -41,6 +49,27 @@ class SuperMarioLand1(PyBoyEnv, ABC):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
     """
 
     def __init__(
@@ -50,6 +79,11 @@ class SuperMarioLand1(PyBoyEnv, ABC):
         n_frameskip: int = 1,
         sound: bool = False,
         render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
     ):
         super().__init__(
             cartridge_title="SUPER MARIOLAND",
@@ -58,17 +92,23 @@ class SuperMarioLand1(PyBoyEnv, ABC):
             n_frameskip=n_frameskip,
             sound=sound,
             render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+            schema=SCHEMA,
         )
 
     def reward(self) -> float:
-        if _time_over(self.pyboy) or _game_over(self.pyboy):
+        if _time_over(self.ram) or _game_over(self.ram):
             return -1.0
-        if _level_finished(self.pyboy):
+        if _level_finished(self.ram):
             return 1.0
-        return _score(self.pyboy) / 999999
+        return _score(self.ram) / 999999
 
     def terminated(self) -> bool:
-        return _game_over(self.pyboy)
+        return _game_over(self.ram)
 
     def truncated(self) -> bool:
         return False
@@ -123,9 +163,41 @@ class SuperMarioLand1Flatten(SuperMarioLand1):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
     """
 
-    @property
+    _requires_rendering = False
+
+    _observation_layout = [
+        ("world", ()),
+        ("level", ()),
+        ("lives", ()),
+        ("coins", ()),
+        ("time", ()),
+        ("game_area", (16, 20)),
+    ]
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -135,15 +207,13 @@ class SuperMarioLand1Flatten(SuperMarioLand1):
         )
 
     def observation(self) -> np.ndarray:
-        world, level = _world_level(self.pyboy)
-        world, level = np.array([world]), np.array([level])
-        lives = np.array([_lives(self.pyboy)])
-        coins = np.array([_coins(self.pyboy)])
-        time = np.array([_time(self.pyboy)])
-        game_area = _game_area(self.pyboy).flatten()
-        return np.concatenate((world, level, lives, coins, time, game_area)).astype(
-            np.float32
-        )
+        observation = self.observation_buffer
+        observation["world"], observation["level"] = _world_level(self.ram)
+        observation["lives"] = _lives(self.ram)
+        observation["coins"] = _coins(self.ram)
+        observation["time"] = _time(self.ram)
+        observation["game_area"] = _game_area(self.ram)
+        return observation.get(copy=self.copy_observation)
 
 
 class SuperMarioLand1FullImage(SuperMarioLand1):
@@ -190,9 +260,30 @@ class SuperMarioLand1FullImage(SuperMarioLand1):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
     """
 
-    @property
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=0,
@@ -202,8 +293,7 @@ class SuperMarioLand1FullImage(SuperMarioLand1):
         )
 
     def observation(self) -> np.ndarray:
-        obs = ski.color.rgba2rgb(self.pyboy.screen.image)
-        return (255 * obs).clip(0, 255).astype(np.uint8)
+        return rgba_to_rgb(self.screen())
 
 
 class SuperMarioLand1MinimalImage(SuperMarioLand1):
@@ -250,9 +340,32 @@ class SuperMarioLand1MinimalImage(SuperMarioLand1):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
     """
 
-    @property
+    _requires_rendering = False
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -262,4 +375,130 @@ class SuperMarioLand1MinimalImage(SuperMarioLand1):
         )
 
     def observation(self) -> np.ndarray:
-        return _game_area(self.pyboy).astype(np.float32)
+        return _game_area(self.ram).astype(np.float32)
+
+
+class SuperMarioLand1GrayscaleImage(SuperMarioLand1):
+    """
+    The Super Mario Land 1 environment.
+
+    ## Action Space
+    The action space consists of 9 discrete actions:
+    - 0: No action
+    - 1: Press A
+    - 2: Press B
+    - 3: Press Left
+    - 4: Press Right
+    - 5: Press Up
+    - 6: Press Down
+    - 7: Press Start
+    - 8: Press Select
+
+    ## Observation Space
+    The observation is an (144 / downsample, 160 / downsample) array representing
+    the grayscale image of the game screen, which keeps every downsample-th row and
+    column of the screen.
+    With palette_index=True, each pixel is the index of its shade from 0 (white)
+    to 3 (black) instead.
+
+    ## Rewards
+    The reward is:
+    - -1.0 if the time or the game is over
+    - 1.0 if the level is finished
+    - otherwise the normalized score
+
+    ## Version History
+    - v1: Original version
+
+    Args:
+        rom_path (str):
+            The path to the ROM file.
+
+        init_state_path (str | None):
+            The path to the initial state file.
+
+        n_frameskip (int):
+            The number of frames to skip between each action
+
+        sound (bool):
+            The flag to dis-/enable the sound.
+
+        render_mode (str | None):
+            The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        downsample (int):
+            The factor to downsample the height and width of the screen, e.g. 2 for
+            a (72, 80) observation.
+
+        palette_index (bool):
+            The flag to return the index of the shade of each pixel instead of its
+            grayscale value.
+    """
+
+    def __init__(
+        self,
+        rom_path: str,
+        init_state_path: str | None = None,
+        n_frameskip: int = 1,
+        sound: bool = False,
+        render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        downsample: int = 1,
+        palette_index: bool = False,
+    ):
+        if downsample < 1:
+            raise ValueError(f"Invalid downsample factor {downsample}.")
+
+        self.downsample = downsample
+        self.palette_index = palette_index
+        super().__init__(
+            rom_path=rom_path,
+            init_state_path=init_state_path,
+            n_frameskip=n_frameskip,
+            sound=sound,
+            render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+        )
+
+    @cached_property
+    def observation_space(self) -> spaces.Space:
+        return spaces.Box(
+            low=0,
+            high=3 if self.palette_index else 255,
+            shape=downsampled_shape(self.downsample),
+            dtype=np.uint8,
+        )
+
+    def observation(self) -> np.ndarray:
+        if self.palette_index:
+            return rgba_to_palette_index(self.screen(), self.downsample)
+        return rgba_to_grayscale(self.screen(), self.downsample)
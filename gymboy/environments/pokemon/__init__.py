@@ -3,38 +3,48 @@
 from .gen_1 import (
     PokemonBlueFlatten,
     PokemonBlueFullImage,
+    PokemonBlueGrayscaleImage,
     PokemonBlueMinimalImage,
     PokemonRedFlatten,
     PokemonRedFullImage,
+    PokemonRedGrayscaleImage,
     PokemonRedMinimalImage,
     PokemonYellowFlatten,
     PokemonYellowFullImage,
+    PokemonYellowGrayscaleImage,
     PokemonYellowMinimalImage,
 )
 from .gen_2 import (
     PokemonGoldFlatten,
     PokemonGoldFullImage,
+    PokemonGoldGrayscaleImage,
     PokemonGoldMinimalImage,
     PokemonSilverFlatten,
     PokemonSilverFullImage,
+    PokemonSilverGrayscaleImage,
     PokemonSilverMinimalImage,
 )
 
 __all__ = [
     "PokemonBlueFlatten",
     "PokemonBlueFullImage",
+    "PokemonBlueGrayscaleImage",
     "PokemonBlueMinimalImage",
     "PokemonGoldFlatten",
     "PokemonGoldFullImage",
+    "PokemonGoldGrayscaleImage",
     "PokemonGoldMinimalImage",
     "PokemonRedFlatten",
     "PokemonRedFullImage",
+    "PokemonRedGrayscaleImage",
     "PokemonRedMinimalImage",
     "PokemonSilverFlatten",
     "PokemonSilverFullImage",
+    "PokemonSilverGrayscaleImage",
     "PokemonSilverMinimalImage",
     "PokemonYellowFlatten",
     "PokemonYellowFullImage",
+    "PokemonYellowGrayscaleImage",
     "PokemonYellowMinimalImage",
 ]
 
@@ -0,0 +1,75 @@
+from pyboy import PyBoy
+
+# Tile of the blinking arrow of a text box that waits for a button press
+DOWN_ARROW_TILE = 0xEE
+
+# Tile of the top left corner of a text box and of the cursor of a menu
+TEXT_BOX_CORNER_TILE = 0x79
+CURSOR_TILE = 0xED
+
+# Number of tiles of the text box at the bottom of the screen (6 rows of 20 tiles)
+TEXT_BOX_SIZE = 120
+
+# Number of frames of a single button press, where the button is pressed in the
+# first frame and released in the others
+PRESS_FRAMES = 2
+
+# Maximum number of frames to skip in a single step
+MAX_TEXT_FRAMES = 3600
+
+
+def _skip_text(
+    pyboy: PyBoy, prompt_address: int, text_box_address: int, render: bool
+) -> int:
+    """
+    Presses A through the text boxes and progresses the game while they print.
+
+    The game progresses without rendering as long as the text box at the bottom of
+    the screen is open without a menu cursor, so that it returns as soon as the
+    player can move or choose again.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+        prompt_address (int):
+            The address of the tile that shows the blinking arrow of a text box
+
+        text_box_address (int):
+            The address of the tile of the top left corner of the text box
+
+        render (bool):
+            The flag to render the last frame
+
+    Returns:
+        int:
+            The number of skipped frames
+    """
+    frames = 0
+    while frames < MAX_TEXT_FRAMES:
+        if pyboy.memory[prompt_address] == DOWN_ARROW_TILE:
+            pyboy.button("a")
+            pyboy.tick(PRESS_FRAMES, False)
+            frames += PRESS_FRAMES
+        elif _is_printing(pyboy, text_box_address):
+            # The text is printing or scrolling or the arrow is blinking
+            pyboy.tick(1, False)
+            frames += 1
+        else:
+            break
+    if frames == 0:
+        return 0
+
+    # Progress the frame in which the player gets back control
+    pyboy.tick(1, render)
+    return frames + 1
+
+
+def _is_printing(pyboy: PyBoy, text_box_address: int) -> bool:
+    """Returns True if the text box is open and shows no menu cursor."""
+    if pyboy.memory[text_box_address] != TEXT_BOX_CORNER_TILE:
+        return False
+    return (
+        CURSOR_TILE
+        not in pyboy.memory[text_box_address : text_box_address + TEXT_BOX_SIZE]
+    )
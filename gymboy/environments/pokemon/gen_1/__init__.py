@@ -1,22 +1,36 @@
 """Pokemon Gen 1 environments."""
 
-from .blue import PokemonBlueFlatten, PokemonBlueFullImage, PokemonBlueMinimalImage
-from .red import PokemonRedFlatten, PokemonRedFullImage, PokemonRedMinimalImage
+from .blue import (
+    PokemonBlueFlatten,
+    PokemonBlueFullImage,
+    PokemonBlueGrayscaleImage,
+    PokemonBlueMinimalImage,
+)
+from .red import (
+    PokemonRedFlatten,
+    PokemonRedFullImage,
+    PokemonRedGrayscaleImage,
+    PokemonRedMinimalImage,
+)
 from .yellow import (
     PokemonYellowFlatten,
     PokemonYellowFullImage,
+    PokemonYellowGrayscaleImage,
     PokemonYellowMinimalImage,
 )
 
 __all__ = [
     "PokemonBlueFlatten",
     "PokemonBlueFullImage",
+    "PokemonBlueGrayscaleImage",
     "PokemonBlueMinimalImage",
     "PokemonRedFlatten",
     "PokemonRedFullImage",
+    "PokemonRedGrayscaleImage",
     "PokemonRedMinimalImage",
     "PokemonYellowFlatten",
     "PokemonYellowFullImage",
+    "PokemonYellowGrayscaleImage",
     "PokemonYellowMinimalImage",
 ]
 
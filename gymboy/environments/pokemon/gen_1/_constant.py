@@ -7,6 +7,10 @@
 # Index Number of Moves:
 # https://bulbapedia.bulbagarden.net/wiki/List_of_moves
 
+import numpy as np
+
+from gymboy.utils import Field, Schema
+
 # (1 Byte) Number of pokemons in team
 TEAM_SIZE_ADDRESS = 0xD163
 
@@ -50,6 +54,75 @@ EVENT_FLAGS_START_ADDRESS = 0xD747
 EVENT_FLAGS_END_ADDRESS = 0xD886
 MUSEUM_TICKET_ADDRESS = 0xD754
 
+# (1 Byte) Tile at (18, 16) of the tilemap buffer at 0xC3A0, which shows a blinking
+# arrow while a text box waits for a button press
+TEXT_PROMPT_ADDRESS = 0xC4F2
+
+# (120 Bytes) Tiles of the rows 12 to 17 of the tilemap buffer at 0xC3A0, which show
+# the text box at the bottom of the screen
+TEXT_BOX_ADDRESS = 0xC490
+
+# Number of bytes between the data of two pokemons in the team
+PARTY_STRIDE = 0x2C
+
+# Fields that are decoded once per step
+SCHEMA = Schema(
+    [
+        Field("team_size", TEAM_SIZE_ADDRESS),
+        Field("badges", BADGE_COUNT_ADDRESS, encoding="popcount"),
+        Field("money", MONEY_ADDRESS, width=3, encoding="bcd"),
+        Field("pokemon_ids", POKEMON_IDS_ADDRESSES[0], count=6, stride=PARTY_STRIDE),
+        Field("levels", LEVELS_ADDRESSES[0], count=6, stride=PARTY_STRIDE),
+        Field(
+            "hps",
+            HP_ADDRESSES[0],
+            width=2,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field(
+            "max_hps",
+            MAX_HP_ADDRESSES[0],
+            width=2,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field(
+            "exps",
+            EXP_ADDRESSES[0],
+            width=3,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field("moves", MOVE_ADDRESSES[0], width=4, count=6, stride=PARTY_STRIDE),
+        Field("pps", PP_ADDRESSES[0], width=4, count=6, stride=PARTY_STRIDE),
+        Field(
+            "owned_pokemons",
+            POKEDEX_OWNED_START_ADDRESS,
+            width=POKEDEX_OWNED_END_ADDRESS - POKEDEX_OWNED_START_ADDRESS,
+            encoding="popcount",
+        ),
+        Field(
+            "seen_pokemons",
+            POKEDEX_SEEN_START_ADDRESS,
+            width=POKEDEX_SEEN_END_ADDRESS - POKEDEX_SEEN_START_ADDRESS,
+            encoding="popcount",
+        ),
+        Field(
+            "events",
+            EVENT_FLAGS_START_ADDRESS,
+            width=EVENT_FLAGS_END_ADDRESS - EVENT_FLAGS_START_ADDRESS,
+            encoding="popcount",
+        ),
+    ]
+)
+
+# Pokemon Yellow stores the same fields one byte earlier
+YELLOW_SCHEMA = Schema(SCHEMA.fields, offset=-1)
+
 
 # IDs:
 # https://github.com/pret/pokered/blob/91dc3c9f9c8fd529bb6e8307b58b96efa0bec67e/constants/move_constants.asm
@@ -223,3 +296,7 @@ MOVES_TO_MAX_PP = {
     0xA4: 10,  # SUBSTITUTE
     0xA5: 0,  # STRUGGLE
 }
+
+# Max PP of each move ID as lookup table, where unknown IDs have a max PP of 0
+MAX_PP_LUT = np.zeros(256, dtype=np.int64)
+MAX_PP_LUT[list(MOVES_TO_MAX_PP)] = list(MOVES_TO_MAX_PP.values())
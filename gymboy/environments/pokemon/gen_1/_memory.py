@@ -1,27 +1,29 @@
+from typing import Dict
+
 import numpy as np
 from pyboy import PyBoy
 
-from gymboy.utils import bcds_to_integer, bytes_bit_count, bytes_to_int
-
-from ._constant import (
-    BADGE_COUNT_ADDRESS,
-    EVENT_FLAGS_END_ADDRESS,
-    EVENT_FLAGS_START_ADDRESS,
-    EXP_ADDRESSES,
-    HP_ADDRESSES,
-    LEVELS_ADDRESSES,
-    MAX_HP_ADDRESSES,
-    MONEY_ADDRESS,
-    MOVE_ADDRESSES,
-    MOVES_TO_MAX_PP,
-    POKEDEX_OWNED_END_ADDRESS,
-    POKEDEX_OWNED_START_ADDRESS,
-    POKEDEX_SEEN_END_ADDRESS,
-    POKEDEX_SEEN_START_ADDRESS,
-    POKEMON_IDS_ADDRESSES,
-    PP_ADDRESSES,
-    TEAM_SIZE_ADDRESS,
-)
+from gymboy.utils import tilemap_game_area
+
+from ._constant import MAX_PP_LUT, SCHEMA, YELLOW_SCHEMA
+
+
+def _fields(pyboy: PyBoy, yellow: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Returns the decoded fields of the memory.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+        yellow (bool):
+            The flag to indicate if the game is Pokemon Yellow
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The decoded value of each field
+    """
+    return (YELLOW_SCHEMA if yellow else SCHEMA).extract(pyboy)
 
 
 def _badges(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -39,7 +41,7 @@ def _badges(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current number of badges
     """
-    return bytes_bit_count([pyboy.memory[BADGE_COUNT_ADDRESS - int(yellow)]])
+    return int(_fields(pyboy, yellow=yellow)["badges"])
 
 
 def _money(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -57,9 +59,7 @@ def _money(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current money
     """
-    return bcds_to_integer(
-        pyboy.memory[MONEY_ADDRESS - int(yellow) : MONEY_ADDRESS - int(yellow) + 3]
-    )
+    return int(_fields(pyboy, yellow=yellow)["money"])
 
 
 def _pokemon_ids(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -77,9 +77,7 @@ def _pokemon_ids(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current pokemon IDs in your team
     """
-    return np.array(
-        [pyboy.memory[pokemon_id - int(yellow)] for pokemon_id in POKEMON_IDS_ADDRESSES]
-    )
+    return _fields(pyboy, yellow=yellow)["pokemon_ids"]
 
 
 def _team_size(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -97,7 +95,7 @@ def _team_size(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current number of pokemons in your team
     """
-    return pyboy.memory[TEAM_SIZE_ADDRESS - int(yellow)]
+    return int(_fields(pyboy, yellow=yellow)["team_size"])
 
 
 def _levels(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -115,12 +113,7 @@ def _levels(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current levels of pokemons in your team
     """
-    return np.array(
-        [
-            pyboy.memory[level_address - int(yellow)]
-            for level_address in LEVELS_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["levels"]
 
 
 def _hps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -138,14 +131,7 @@ def _hps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current HPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(
-                pyboy.memory[hp_address - int(yellow) : hp_address - int(yellow) + 2]
-            )
-            for hp_address in HP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["hps"]
 
 
 def _max_hps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -163,16 +149,7 @@ def _max_hps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The max HPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(
-                pyboy.memory[
-                    max_hp_address - int(yellow) : max_hp_address - int(yellow) + 2
-                ]
-            )
-            for max_hp_address in MAX_HP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["max_hps"]
 
 
 def _exps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -190,14 +167,7 @@ def _exps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current EXPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(
-                pyboy.memory[exp_address - int(yellow) : exp_address - int(yellow) + 3]
-            )
-            for exp_address in EXP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["exps"]
 
 
 def _moves(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -215,12 +185,7 @@ def _moves(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current move IDs of pokemons in your team
     """
-    return np.array(
-        [
-            pyboy.memory[move_address - int(yellow) : move_address - int(yellow) + 4]
-            for move_address in MOVE_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["moves"]
 
 
 def _pps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -238,12 +203,7 @@ def _pps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The current PPs of pokemons in your team
     """
-    return np.array(
-        [
-            pyboy.memory[pp_address - int(yellow) : pp_address - int(yellow) + 4]
-            for pp_address in PP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy, yellow=yellow)["pps"]
 
 
 def _max_pps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -261,12 +221,38 @@ def _max_pps(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
         np.ndarray:
             The max PPs of pokemons in your team
     """
-    return np.array(
-        [
-            [MOVES_TO_MAX_PP[move] for move in pokemon]
-            for pokemon in _moves(pyboy, yellow=yellow)
-        ]
-    )
+    return MAX_PP_LUT.take(_moves(pyboy, yellow=yellow))
+
+
+def _party_battle_state(pyboy: PyBoy, yellow: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Returns the battle state of pokemons in your team.
+
+    All values are taken from the same decoded memory, so the max PPs are looked
+    up for the moves of this state.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+        yellow (bool):
+            The flag to indicate if the game is Pokemon Yellow
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The pokemon IDs, levels, HPs, max HPs, moves, PPs and max PPs of
+            pokemons in your team
+    """
+    fields = _fields(pyboy, yellow=yellow)
+    return {
+        "pokemon_ids": fields["pokemon_ids"],
+        "levels": fields["levels"],
+        "hps": fields["hps"],
+        "max_hps": fields["max_hps"],
+        "moves": fields["moves"],
+        "pps": fields["pps"],
+        "max_pps": MAX_PP_LUT.take(fields["moves"]),
+    }
 
 
 def _seen_pokemons(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -284,13 +270,7 @@ def _seen_pokemons(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current number of seen pokemons.
     """
-    return bytes_bit_count(
-        pyboy.memory[
-            POKEDEX_SEEN_START_ADDRESS
-            - int(yellow) : POKEDEX_SEEN_END_ADDRESS
-            - int(yellow)
-        ]
-    )
+    return int(_fields(pyboy, yellow=yellow)["seen_pokemons"])
 
 
 def _owned_pokemons(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -308,13 +288,7 @@ def _owned_pokemons(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current number of owned pokemons.
     """
-    return bytes_bit_count(
-        pyboy.memory[
-            POKEDEX_OWNED_START_ADDRESS
-            - int(yellow) : POKEDEX_OWNED_END_ADDRESS
-            - int(yellow)
-        ]
-    )
+    return int(_fields(pyboy, yellow=yellow)["owned_pokemons"])
 
 
 def _events(pyboy: PyBoy, yellow: bool = False) -> int:
@@ -332,13 +306,7 @@ def _events(pyboy: PyBoy, yellow: bool = False) -> int:
         int:
             The current number of occured events.
     """
-    return bytes_bit_count(
-        pyboy.memory[
-            EVENT_FLAGS_START_ADDRESS
-            - int(yellow) : EVENT_FLAGS_END_ADDRESS
-            - int(yellow)
-        ]
-    )
+    return int(_fields(pyboy, yellow=yellow)["events"])
 
 
 def _game_area(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
@@ -358,28 +326,4 @@ def _game_area(pyboy: PyBoy, yellow: bool = False) -> np.ndarray:
     """
     if not yellow:
         return pyboy.game_area()
-    else:
-        # Set the screen area
-        xx, yy, width, height = (0, 0, 20, 18)
-
-        # Get the tile matrix
-        area = np.ndarray(shape=(height, width), dtype=np.uint32)
-        for y in range(height):
-            SCX = pyboy.screen.tilemap_position_list[(yy + y) * 8][0] // 8
-            SCY = pyboy.screen.tilemap_position_list[(yy + y) * 8][1] // 8
-            for x in range(width):
-                _x = (xx + x + SCX) % 32
-                _y = (yy + y + SCY) % 32
-                area[y, x] = pyboy.tilemap_background.tile_identifier(_x, _y)
-
-        # Get the sprites
-        sprites = [pyboy.get_sprite(s) for s in range(40)]
-
-        # Add the sprites to the tile matrix
-        for s in sprites:
-            _x = (s.x // 8) - xx
-            _y = (s.y // 8) - yy
-            if 0 <= _y < height and 0 <= _x < width:
-                area[_y][_x] = s.tile_identifier
-
-        return area
+    return tilemap_game_area(pyboy)
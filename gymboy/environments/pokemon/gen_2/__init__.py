@@ -1,18 +1,26 @@
 """Pokemon Gen 2 environments."""
 
-from .gold import PokemonGoldFlatten, PokemonGoldFullImage, PokemonGoldMinimalImage
+from .gold import (
+    PokemonGoldFlatten,
+    PokemonGoldFullImage,
+    PokemonGoldGrayscaleImage,
+    PokemonGoldMinimalImage,
+)
 from .silver import (
     PokemonSilverFlatten,
     PokemonSilverFullImage,
+    PokemonSilverGrayscaleImage,
     PokemonSilverMinimalImage,
 )
 
 __all__ = [
     "PokemonGoldFlatten",
     "PokemonGoldFullImage",
+    "PokemonGoldGrayscaleImage",
     "PokemonGoldMinimalImage",
     "PokemonSilverFlatten",
     "PokemonSilverFullImage",
+    "PokemonSilverGrayscaleImage",
     "PokemonSilverMinimalImage",
 ]
 
@@ -5,6 +5,10 @@
 # Index Number of Moves:
 # https://bulbapedia.bulbagarden.net/wiki/List_of_moves
 
+import numpy as np
+
+from gymboy.utils import Field, Schema
+
 # (1 Byte) Number of badges obtained (Johto)
 JOHTO_BADGE_COUNT_ADDRESS = 0xD57C
 
@@ -49,6 +53,67 @@ POKEDEX_OWNED_END_ADDRESS = 0xDC04
 POKEDEX_SEEN_START_ADDRESS = 0xDC04
 POKEDEX_SEEN_END_ADDRESS = 0xDC24
 
+# (1 Byte) Tile at (18, 17) of the tilemap buffer at 0xC4A0, which shows a blinking
+# arrow while a text box waits for a button press
+TEXT_PROMPT_ADDRESS = 0xC606
+
+# (120 Bytes) Tiles of the rows 12 to 17 of the tilemap buffer at 0xC4A0, which show
+# the text box at the bottom of the screen
+TEXT_BOX_ADDRESS = 0xC590
+
+# Number of bytes between the data of two pokemons in the team
+PARTY_STRIDE = 0x30
+
+# Fields that are decoded once per step
+SCHEMA = Schema(
+    [
+        Field("team_size", TEAM_SIZE_ADDRESS),
+        Field("badges", JOHTO_BADGE_COUNT_ADDRESS, width=2, encoding="popcount"),
+        Field("own_money", OWN_MONEY_ADDRESS, width=3, encoding="int"),
+        Field("mother_money", MOTHER_MONEY_ADDRESS, width=3, encoding="int"),
+        Field("pokemon_ids", POKEMON_IDS_ADDRESSES[0], count=6, stride=PARTY_STRIDE),
+        Field("levels", LEVELS_ADDRESSES[0], count=6, stride=PARTY_STRIDE),
+        Field(
+            "hps",
+            HP_ADDRESSES[0],
+            width=2,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field(
+            "max_hps",
+            MAX_HP_ADDRESSES[0],
+            width=2,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field(
+            "exps",
+            EXP_ADDRESSES[0],
+            width=3,
+            encoding="int",
+            count=6,
+            stride=PARTY_STRIDE,
+        ),
+        Field("moves", MOVE_ADDRESSES[0], width=4, count=6, stride=PARTY_STRIDE),
+        Field("pps", PP_ADDRESSES[0], width=4, count=6, stride=PARTY_STRIDE),
+        Field(
+            "owned_pokemons",
+            POKEDEX_OWNED_START_ADDRESS,
+            width=POKEDEX_OWNED_END_ADDRESS - POKEDEX_OWNED_START_ADDRESS,
+            encoding="popcount",
+        ),
+        Field(
+            "seen_pokemons",
+            POKEDEX_SEEN_START_ADDRESS,
+            width=POKEDEX_SEEN_END_ADDRESS - POKEDEX_SEEN_START_ADDRESS,
+            encoding="popcount",
+        ),
+    ]
+)
+
 
 # IDs:
 # https://github.com/pret/pokegold/blob/master/constants/move_constants.asm
@@ -308,3 +373,7 @@ MOVES_TO_MAX_PP = {
     0xFA: 15,   # WHIRLPOOL
     0xFB: 10,   # BEAT_UP
 }
+
+# Max PP of each move ID as lookup table, where unknown IDs have a max PP of 0
+MAX_PP_LUT = np.zeros(256, dtype=np.int64)
+MAX_PP_LUT[list(MOVES_TO_MAX_PP)] = list(MOVES_TO_MAX_PP.values())
@@ -1,27 +1,26 @@
+from typing import Dict
+
 import numpy as np
 from pyboy import PyBoy
 
-from gymboy.utils import bytes_bit_count, bytes_to_int
-
-from ._constant import (
-    EXP_ADDRESSES,
-    HP_ADDRESSES,
-    JOHTO_BADGE_COUNT_ADDRESS,
-    KANTO_BADGE_COUNT_ADDRESS,
-    LEVELS_ADDRESSES,
-    MAX_HP_ADDRESSES,
-    OWN_MONEY_ADDRESS,
-    MOVE_ADDRESSES,
-    MOTHER_MONEY_ADDRESS,
-    MOVES_TO_MAX_PP,
-    POKEDEX_OWNED_END_ADDRESS,
-    POKEDEX_OWNED_START_ADDRESS,
-    POKEDEX_SEEN_END_ADDRESS,
-    POKEDEX_SEEN_START_ADDRESS,
-    POKEMON_IDS_ADDRESSES,
-    PP_ADDRESSES,
-    TEAM_SIZE_ADDRESS,
-)
+from gymboy.utils import tilemap_game_area
+
+from ._constant import MAX_PP_LUT, SCHEMA
+
+
+def _fields(pyboy: PyBoy) -> Dict[str, np.ndarray]:
+    """
+    Returns the decoded fields of the memory.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The decoded value of each field
+    """
+    return SCHEMA.extract(pyboy)
 
 
 def _badges(pyboy: PyBoy) -> int:
@@ -36,12 +35,7 @@ def _badges(pyboy: PyBoy) -> int:
         int:
             The current number of badges
     """
-    return bytes_bit_count(
-        [
-            pyboy.memory[JOHTO_BADGE_COUNT_ADDRESS],
-            pyboy.memory[KANTO_BADGE_COUNT_ADDRESS],
-        ]
-    )
+    return int(_fields(pyboy)["badges"])
 
 
 def _own_money(pyboy: PyBoy) -> int:
@@ -56,7 +50,7 @@ def _own_money(pyboy: PyBoy) -> int:
         int:
             The current money in your pocket
     """
-    return bytes_to_int(pyboy.memory[OWN_MONEY_ADDRESS : OWN_MONEY_ADDRESS + 3])
+    return int(_fields(pyboy)["own_money"])
 
 
 def _mother_money(pyboy: PyBoy) -> int:
@@ -71,7 +65,7 @@ def _mother_money(pyboy: PyBoy) -> int:
         int:
             The current money in your pocket
     """
-    return bytes_to_int(pyboy.memory[MOTHER_MONEY_ADDRESS : MOTHER_MONEY_ADDRESS + 3])
+    return int(_fields(pyboy)["mother_money"])
 
 
 def _money(pyboy: PyBoy) -> int:
@@ -104,7 +98,7 @@ def _pokemon_ids(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current pokemon IDs in your team
     """
-    return np.array([pyboy.memory[pokemon_id] for pokemon_id in POKEMON_IDS_ADDRESSES])
+    return _fields(pyboy)["pokemon_ids"]
 
 
 def _team_size(pyboy: PyBoy) -> int:
@@ -119,7 +113,7 @@ def _team_size(pyboy: PyBoy) -> int:
         int:
             The current number of pokemons in your team
     """
-    return pyboy.memory[TEAM_SIZE_ADDRESS]
+    return int(_fields(pyboy)["team_size"])
 
 
 def _levels(pyboy: PyBoy) -> np.ndarray:
@@ -134,7 +128,7 @@ def _levels(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current levels of pokemons in your team
     """
-    return np.array([pyboy.memory[level_address] for level_address in LEVELS_ADDRESSES])
+    return _fields(pyboy)["levels"]
 
 
 def _hps(pyboy: PyBoy) -> np.ndarray:
@@ -149,12 +143,7 @@ def _hps(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current HPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(pyboy.memory[hp_address : hp_address + 2])
-            for hp_address in HP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy)["hps"]
 
 
 def _max_hps(pyboy: PyBoy) -> np.ndarray:
@@ -169,12 +158,7 @@ def _max_hps(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The max HPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(pyboy.memory[max_hp_address : max_hp_address + 2])
-            for max_hp_address in MAX_HP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy)["max_hps"]
 
 
 def _exps(pyboy: PyBoy) -> np.ndarray:
@@ -189,12 +173,7 @@ def _exps(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current EXPs of pokemons in your team
     """
-    return np.array(
-        [
-            bytes_to_int(pyboy.memory[exp_address : exp_address + 3])
-            for exp_address in EXP_ADDRESSES
-        ]
-    )
+    return _fields(pyboy)["exps"]
 
 
 def _moves(pyboy: PyBoy) -> np.ndarray:
@@ -209,12 +188,7 @@ def _moves(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current move IDs of pokemons in your team
     """
-    return np.array(
-        [
-            pyboy.memory[move_address : move_address + 4]
-            for move_address in MOVE_ADDRESSES
-        ]
-    )
+    return _fields(pyboy)["moves"]
 
 
 def _pps(pyboy: PyBoy) -> np.ndarray:
@@ -229,9 +203,7 @@ def _pps(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current PPs of pokemons in your team
     """
-    return np.array(
-        [pyboy.memory[pp_address : pp_address + 4] for pp_address in PP_ADDRESSES]
-    )
+    return _fields(pyboy)["pps"]
 
 
 def _max_pps(pyboy: PyBoy) -> np.ndarray:
@@ -246,9 +218,35 @@ def _max_pps(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The max PPs of pokemons in your team
     """
-    return np.array(
-        [[MOVES_TO_MAX_PP[move] for move in pokemon] for pokemon in _moves(pyboy)]
-    )
+    return MAX_PP_LUT.take(_moves(pyboy))
+
+
+def _party_battle_state(pyboy: PyBoy) -> Dict[str, np.ndarray]:
+    """
+    Returns the battle state of pokemons in your team.
+
+    All values are taken from the same decoded memory, so the max PPs are looked
+    up for the moves of this state.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The pokemon IDs, levels, HPs, max HPs, moves, PPs and max PPs of
+            pokemons in your team
+    """
+    fields = _fields(pyboy)
+    return {
+        "pokemon_ids": fields["pokemon_ids"],
+        "levels": fields["levels"],
+        "hps": fields["hps"],
+        "max_hps": fields["max_hps"],
+        "moves": fields["moves"],
+        "pps": fields["pps"],
+        "max_pps": MAX_PP_LUT.take(fields["moves"]),
+    }
 
 
 def _seen_pokemons(pyboy: PyBoy) -> int:
@@ -263,9 +261,7 @@ def _seen_pokemons(pyboy: PyBoy) -> int:
         int:
             The current number of seen pokemons.
     """
-    return bytes_bit_count(
-        pyboy.memory[POKEDEX_SEEN_START_ADDRESS:POKEDEX_SEEN_END_ADDRESS]
-    )
+    return int(_fields(pyboy)["seen_pokemons"])
 
 
 def _owned_pokemons(pyboy: PyBoy) -> int:
@@ -280,9 +276,7 @@ def _owned_pokemons(pyboy: PyBoy) -> int:
         int:
             The current number of owned pokemons.
     """
-    return bytes_bit_count(
-        pyboy.memory[POKEDEX_OWNED_START_ADDRESS:POKEDEX_OWNED_END_ADDRESS]
-    )
+    return int(_fields(pyboy)["owned_pokemons"])
 
 
 def _game_area(pyboy: PyBoy) -> np.ndarray:
@@ -297,27 +291,4 @@ def _game_area(pyboy: PyBoy) -> np.ndarray:
         np.ndarray:
             The current game area
     """
-    # Set the screen area
-    xx, yy, width, height = (0, 0, 20, 18)
-
-    # Get the tile matrix
-    area = np.ndarray(shape=(height, width), dtype=np.uint32)
-    for y in range(height):
-        SCX = pyboy.screen.tilemap_position_list[(yy + y) * 8][0] // 8
-        SCY = pyboy.screen.tilemap_position_list[(yy + y) * 8][1] // 8
-        for x in range(width):
-            _x = (xx + x + SCX) % 32
-            _y = (yy + y + SCY) % 32
-            area[y, x] = pyboy.tilemap_background.tile_identifier(_x, _y)
-
-    # Get the sprites
-    sprites = [pyboy.get_sprite(s) for s in range(40)]
-
-    # Add the sprites to the tile matrix
-    for s in sprites:
-        _x = (s.x // 8) - xx
-        _y = (s.y // 8) - yy
-        if 0 <= _y < height and 0 <= _x < width:
-            area[_y][_x] = s.tile_identifier
-
-    return area
+    return tilemap_game_area(pyboy)
@@ -1,13 +1,18 @@
 """Pokemon Gold environments."""
 
 from abc import ABC
+from functools import cached_property
+from typing import Any, Dict
 
 import numpy as np
-import skimage as ski
 from gymnasium import spaces
+from pyboy import PyBoy
 
 from gymboy.environments.env import PyBoyEnv
+from gymboy.utils import downsampled_shape, rgba_to_grayscale, rgba_to_rgb
 
+from .._text import _skip_text
+from ._constant import SCHEMA, TEXT_BOX_ADDRESS, TEXT_PROMPT_ADDRESS
 from ._memory import (
     _badges,
     _game_area,
@@ -40,6 +45,32 @@ class PokemonGold(PyBoyEnv, ABC):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        skip_text (bool):
+            The flag to press A through text boxes without rendering, so that the
+            step only returns when the player can move or choose again.
+            The number of skipped frames is reported as "skipped_frames" in the info.
     """
 
     def __init__(
@@ -49,7 +80,14 @@ class PokemonGold(PyBoyEnv, ABC):
         n_frameskip: int = 1,
         sound: bool = False,
         render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        skip_text: bool = False,
     ):
+        self.skip_text = skip_text
         super().__init__(
             cartridge_title="POKEMON_GLDAAU",
             rom_path=rom_path,
@@ -57,13 +95,34 @@ class PokemonGold(PyBoyEnv, ABC):
             n_frameskip=n_frameskip,
             sound=sound,
             render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+            schema=SCHEMA,
+        )
+
+    def _fast_forward(self) -> int:
+        if not self.skip_text:
+            return 0
+        return _skip_text(
+            self.pyboy,
+            TEXT_PROMPT_ADDRESS,
+            TEXT_BOX_ADDRESS,
+            self._render_last_frame,
         )
 
+    def info(self) -> Dict[str, Any]:
+        if not self.skip_text:
+            return {}
+        return {"skipped_frames": self.skipped_frames}
+
     def reward(self) -> float:
-        badges = _badges(self.pyboy) / 16
-        money = _money(self.pyboy) / 999999
-        pokemon_levels = np.sum(_levels(self.pyboy)) / 600
-        pokemons_seen = _seen_pokemons(self.pyboy) / 251
+        badges = _badges(self.ram) / 16
+        money = _money(self.ram) / 999999
+        pokemon_levels = np.sum(_levels(self.ram)) / 600
+        pokemons_seen = _seen_pokemons(self.ram) / 251
         return badges + money + pokemon_levels + pokemons_seen
 
     def terminated(self) -> bool:
@@ -123,9 +182,46 @@ class PokemonGoldFlatten(PokemonGold):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        skip_text (bool):
+            The flag to press A through text boxes without rendering, so that the
+            step only returns when the player can move or choose again.
+            The number of skipped frames is reported as "skipped_frames" in the info.
     """
 
-    @property
+    _requires_rendering = False
+
+    _observation_layout = [
+        ("pokemon_ids", (6,)),
+        ("levels", (6,)),
+        ("hps", (6,)),
+        ("moves", (6, 4)),
+        ("pps", (6, 4)),
+        ("game_area", (18, 20)),
+    ]
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -135,15 +231,14 @@ class PokemonGoldFlatten(PokemonGold):
         )
 
     def observation(self) -> np.ndarray:
-        pokemon_ids = _pokemon_ids(self.pyboy)
-        levels = _levels(self.pyboy)
-        hps = _hps(self.pyboy)
-        moves = _moves(self.pyboy).flatten()
-        pps = _pps(self.pyboy).flatten()
-        game_area = _game_area(self.pyboy).flatten()
-        return np.concatenate((pokemon_ids, levels, hps, moves, pps, game_area)).astype(
-            np.float32
-        )
+        observation = self.observation_buffer
+        observation["pokemon_ids"] = _pokemon_ids(self.ram)
+        observation["levels"] = _levels(self.ram)
+        observation["hps"] = _hps(self.ram)
+        observation["moves"] = _moves(self.ram)
+        observation["pps"] = _pps(self.ram)
+        observation["game_area"] = _game_area(self.ram)
+        return observation.get(copy=self.copy_observation)
 
 
 class PokemonGoldFullImage(PokemonGold):
@@ -191,9 +286,35 @@ class PokemonGoldFullImage(PokemonGold):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        skip_text (bool):
+            The flag to press A through text boxes without rendering, so that the
+            step only returns when the player can move or choose again.
+            The number of skipped frames is reported as "skipped_frames" in the info.
     """
 
-    @property
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=0,
@@ -203,8 +324,7 @@ class PokemonGoldFullImage(PokemonGold):
         )
 
     def observation(self) -> np.ndarray:
-        obs = ski.color.rgba2rgb(self.pyboy.screen.image)
-        return (255 * obs).clip(0, 255).astype(np.uint8)
+        return rgba_to_rgb(self.screen())
 
 
 class PokemonGoldMinimalImage(PokemonGold):
@@ -252,9 +372,37 @@ class PokemonGoldMinimalImage(PokemonGold):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        skip_text (bool):
+            The flag to press A through text boxes without rendering, so that the
+            step only returns when the player can move or choose again.
+            The number of skipped frames is reported as "skipped_frames" in the info.
     """
 
-    @property
+    _requires_rendering = False
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -264,4 +412,128 @@ class PokemonGoldMinimalImage(PokemonGold):
         )
 
     def observation(self) -> np.ndarray:
-        return _game_area(self.pyboy).astype(np.float32)
+        return _game_area(self.ram).astype(np.float32)
+
+
+class PokemonGoldGrayscaleImage(PokemonGold):
+    """
+    The Pokemon Gold environment.
+
+    ## Action Space
+    The action space consists of 9 discrete actions:
+    - 0: No action
+    - 1: Press A
+    - 2: Press B
+    - 3: Press Left
+    - 4: Press Right
+    - 5: Press Up
+    - 6: Press Down
+    - 7: Press Start
+    - 8: Press Select
+
+    ## Observation Space
+    The observation is an (144 / downsample, 160 / downsample) array representing
+    the grayscale image of the game screen, which keeps every downsample-th row and
+    column of the screen.
+
+    ## Rewards
+    The reward is the sum of:
+    - The normalized number of badges
+    - The normalized amount of money
+    - The normalized sum of the levels of the pokemons
+    - The normalized number of pokemons seen
+
+    ## Version History
+    - v1: Original version
+
+    Args:
+        rom_path (str):
+            The path to the ROM file.
+
+        init_state_path (str | None):
+            The path to the initial state file.
+
+        n_frameskip (int):
+            The number of frames to skip between each action
+
+        sound (bool):
+            The flag to dis-/enable the sound.
+
+        render_mode (str | None):
+            The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        skip_text (bool):
+            The flag to press A through text boxes without rendering, so that the
+            step only returns when the player can move or choose again.
+            The number of skipped frames is reported as "skipped_frames" in the info.
+
+        downsample (int):
+            The factor to downsample the height and width of the screen, e.g. 2 for
+            a (72, 80) observation.
+    """
+
+    def __init__(
+        self,
+        rom_path: str,
+        init_state_path: str | None = None,
+        n_frameskip: int = 1,
+        sound: bool = False,
+        render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        skip_text: bool = False,
+        downsample: int = 1,
+    ):
+        if downsample < 1:
+            raise ValueError(f"Invalid downsample factor {downsample}.")
+
+        self.downsample = downsample
+        super().__init__(
+            rom_path=rom_path,
+            init_state_path=init_state_path,
+            n_frameskip=n_frameskip,
+            sound=sound,
+            render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+            skip_text=skip_text,
+        )
+
+    @cached_property
+    def observation_space(self) -> spaces.Space:
+        return spaces.Box(
+            low=0,
+            high=255,
+            shape=downsampled_shape(self.downsample),
+            dtype=np.uint8,
+        )
+
+    def observation(self) -> np.ndarray:
+        return rgba_to_grayscale(self.screen(), self.downsample)
@@ -1,7 +1,17 @@
 """Tetris environment."""
 
-from .tetris import TetrisFlatten, TetrisFullImage, TetrisMinimalImage
+from .tetris import (
+    TetrisFlatten,
+    TetrisFullImage,
+    TetrisGrayscaleImage,
+    TetrisMinimalImage,
+)
 
-__all__ = ["TetrisFlatten", "TetrisFullImage", "TetrisMinimalImage"]
+__all__ = [
+    "TetrisFlatten",
+    "TetrisFullImage",
+    "TetrisGrayscaleImage",
+    "TetrisMinimalImage",
+]
 
 assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
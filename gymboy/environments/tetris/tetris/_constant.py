@@ -1,6 +1,8 @@
 # Memory ADRs:
 # https://datacrystal.tcrf.net/wiki/Tetris_(Game_Boy)/RAM_map
 
+from gymboy.utils import Field, Schema
+
 # (3 Bytes) Score
 SCORE_ADDRESS = 0xC0A0
 
@@ -12,3 +14,30 @@ NEXT_BLOCK_ADDRESS = 0xC213
 
 # (1 Byte) Game over Flag
 GAME_OVER_ADDRESS = 0xFFE1
+
+# (1 Byte) Y-Position of the current block in pixels
+BLOCK_Y_ADDRESS = 0xC201
+
+# (1 Byte) X-Position of the current block in pixels
+BLOCK_X_ADDRESS = 0xC202
+
+# Number of rotations and columns of the placement actions
+N_ROTATIONS = 4
+N_COLUMNS = 10
+
+# Number of frames of a single move or rotation, where the button is pressed in the
+# first frame and released in the others
+PRESS_FRAMES = 2
+
+# Maximum number of frames to wait until the current block is locked
+MAX_DROP_FRAMES = 1200
+
+# Fields that are decoded once per step
+SCHEMA = Schema(
+    [
+        Field("score", SCORE_ADDRESS, width=3, encoding="bcd", byteorder="little"),
+        Field("level", LEVEL_ADDRESS),
+        Field("next_block", NEXT_BLOCK_ADDRESS),
+        Field("game_over", GAME_OVER_ADDRESS),
+    ]
+)
@@ -1,14 +1,24 @@
+from typing import Dict, Tuple
+
 import numpy as np
 from pyboy import PyBoy
 
-from gymboy.utils import bcds_to_integer
+from ._constant import BLOCK_X_ADDRESS, BLOCK_Y_ADDRESS, SCHEMA
+
 
-from ._constant import (
-    GAME_OVER_ADDRESS,
-    LEVEL_ADDRESS,
-    NEXT_BLOCK_ADDRESS,
-    SCORE_ADDRESS,
-)
+def _fields(pyboy: PyBoy) -> Dict[str, np.ndarray]:
+    """
+    Returns the decoded fields of the memory.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+    Returns:
+        Dict[str, np.ndarray]:
+            The decoded value of each field
+    """
+    return SCHEMA.extract(pyboy)
 
 
 def _score(pyboy: PyBoy) -> int:
@@ -23,7 +33,7 @@ def _score(pyboy: PyBoy) -> int:
         int:
             The current score of the game
     """
-    return bcds_to_integer(reversed(pyboy.memory[SCORE_ADDRESS : SCORE_ADDRESS + 3]))
+    return int(_fields(pyboy)["score"])
 
 
 def _level(pyboy: PyBoy) -> int:
@@ -38,7 +48,7 @@ def _level(pyboy: PyBoy) -> int:
         int:
             The current level of the game
     """
-    return pyboy.memory[LEVEL_ADDRESS]
+    return int(_fields(pyboy)["level"])
 
 
 def _next_block(pyboy: PyBoy) -> int:
@@ -53,7 +63,7 @@ def _next_block(pyboy: PyBoy) -> int:
         int:
             The next block of the game
     """
-    return pyboy.memory[NEXT_BLOCK_ADDRESS] & 0b11111100
+    return int(_fields(pyboy)["next_block"]) & 0b11111100
 
 
 def _game_over(pyboy: PyBoy) -> bool:
@@ -68,10 +78,25 @@ def _game_over(pyboy: PyBoy) -> bool:
         bool:
             The game is over
     """
-    return (
-        pyboy.memory[GAME_OVER_ADDRESS] == 0x0D
-        or pyboy.memory[GAME_OVER_ADDRESS] == 0x04
-    )
+    return int(_fields(pyboy)["game_over"]) in [0x0D, 0x04]
+
+
+def _block_position(pyboy: PyBoy) -> Tuple[int, int]:
+    """
+    Returns the position of the current block.
+
+    The position is read from the live memory, so it can be used between the frames
+    of a single step.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+    Returns:
+        Tuple[int, int]:
+            The (x, y) position of the current block in pixels
+    """
+    return pyboy.memory[BLOCK_X_ADDRESS], pyboy.memory[BLOCK_Y_ADDRESS]
 
 
 def _game_area(pyboy: PyBoy) -> np.ndarray:
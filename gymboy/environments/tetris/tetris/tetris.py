@@ -1,14 +1,36 @@
 """Tetris environments."""
 
 from abc import ABC
+from functools import cached_property
 
 import numpy as np
-import skimage as ski
 from gymnasium import spaces
+from gymnasium.core import ActType
+from pyboy import PyBoy
 
 from gymboy.environments.env import PyBoyEnv
-
-from ._memory import _game_area, _game_over, _level, _next_block, _score
+from gymboy.utils import (
+    downsampled_shape,
+    rgba_to_grayscale,
+    rgba_to_palette_index,
+    rgba_to_rgb,
+)
+
+from ._constant import (
+    MAX_DROP_FRAMES,
+    N_COLUMNS,
+    N_ROTATIONS,
+    PRESS_FRAMES,
+    SCHEMA,
+)
+from ._memory import (
+    _block_position,
+    _game_area,
+    _game_over,
+    _level,
+    _next_block,
+    _score,
+)
 
 
 class Tetris(PyBoyEnv, ABC):
@@ -30,6 +52,32 @@ class Tetris(PyBoyEnv, ABC):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        action_mode (str):
+            The mode of the actions.
+            Can be either "button" (press a single button) or "placement" (place the
+            current block with a rotation and column).
     """
 
     def __init__(
@@ -39,7 +87,17 @@ class Tetris(PyBoyEnv, ABC):
         n_frameskip: int = 1,
         sound: bool = False,
         render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        action_mode: str = "button",
     ):
+        if action_mode not in ["button", "placement"]:
+            raise ValueError(f"Invalid action mode '{action_mode}'.")
+
+        self.action_mode = action_mode
         super().__init__(
             cartridge_title="TETRIS",
             rom_path=rom_path,
@@ -47,15 +105,79 @@ class Tetris(PyBoyEnv, ABC):
             n_frameskip=n_frameskip,
             sound=sound,
             render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+            schema=SCHEMA,
         )
 
+    @cached_property
+    def action_space(self) -> spaces.Space:
+        if self.action_mode == "placement":
+            return spaces.Discrete(n=N_ROTATIONS * N_COLUMNS)
+        return spaces.Discrete(n=len(self.actions))
+
+    def _dispatch(self, action: ActType):
+        if self.action_mode == "button":
+            super()._dispatch(action)
+            return
+
+        # Rotate and move the current block
+        rotation, column = divmod(int(action), N_COLUMNS)
+        for _ in range(rotation):
+            self._press("a")
+        self._move(column)
+
+    def _progress(self):
+        if self.action_mode == "button":
+            super()._progress()
+            return
+
+        # Drop the block until the next block appears or the game is over
+        next_block = _next_block(self.pyboy)
+        _, y = _block_position(self.pyboy)
+        self.pyboy.button_press("down")
+        for _ in range(MAX_DROP_FRAMES):
+            self.pyboy.tick(1, False)
+            _, new_y = _block_position(self.pyboy)
+            if (
+                _game_over(self.pyboy)
+                or _next_block(self.pyboy) != next_block
+                or new_y < y
+            ):
+                break
+            y = new_y
+        self.pyboy.button_release("down")
+
+        # Progress the game by one frame to render the new block
+        self._tick(1)
+        self.ram.update()
+
+    def _press(self, button: str) -> bool:
+        """Presses the button once and returns True if the current block moved."""
+        position = _block_position(self.pyboy)
+        self.pyboy.button(button)
+        self.pyboy.tick(PRESS_FRAMES, False)
+        return _block_position(self.pyboy) != position
+
+    def _move(self, column: int):
+        """Moves the current block to the left wall and then column times right."""
+        for _ in range(N_COLUMNS):
+            if not self._press("left"):
+                break
+        for _ in range(column):
+            if not self._press("right"):
+                break
+
     def reward(self) -> float:
-        if _game_over(self.pyboy):
+        if _game_over(self.ram):
             return -1.0
-        return _score(self.pyboy) / 999999
+        return _score(self.ram) / 999999
 
     def terminated(self) -> bool:
-        return _game_over(self.pyboy)
+        return _game_over(self.ram)
 
     def truncated(self) -> bool:
         return False
@@ -77,6 +199,11 @@ class TetrisFlatten(Tetris):
     - 7: Press Start
     - 8: Press Select
 
+    With action_mode="placement", the action space consists of 40 discrete actions
+    10 * rotation + column. Each action rotates the current block rotation times,
+    moves it column times to the right of the left wall and drops it until the next
+    block appears.
+
     ## Observation Space
     The observation is an (182,) array that consists:
     - [0]: The current level
@@ -106,9 +233,39 @@ class TetrisFlatten(Tetris):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        action_mode (str):
+            The mode of the actions.
+            Can be either "button" (press a single button) or "placement" (place the
+            current block with a rotation and column).
     """
 
-    @property
+    _requires_rendering = False
+
+    _observation_layout = [("level", ()), ("next_block", ()), ("game_area", (18, 10))]
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -118,10 +275,11 @@ class TetrisFlatten(Tetris):
         )
 
     def observation(self) -> np.ndarray:
-        level = np.array([_level(self.pyboy)])
-        next_block = np.array([_next_block(self.pyboy)])
-        game_area = _game_area(self.pyboy).flatten()
-        return np.concatenate((level, next_block, game_area)).astype(np.float32)
+        observation = self.observation_buffer
+        observation["level"] = _level(self.ram)
+        observation["next_block"] = _next_block(self.ram)
+        observation["game_area"] = _game_area(self.ram)
+        return observation.get(copy=self.copy_observation)
 
 
 class TetrisFullImage(Tetris):
@@ -140,6 +298,11 @@ class TetrisFullImage(Tetris):
     - 7: Press Start
     - 8: Press Select
 
+    With action_mode="placement", the action space consists of 40 discrete actions
+    10 * rotation + column. Each action rotates the current block rotation times,
+    moves it column times to the right of the left wall and drops it until the next
+    block appears.
+
     ## Observation Space
     The observation is an (144, 160, 3) array representing the RGB image of the game
     screen.
@@ -167,9 +330,35 @@ class TetrisFullImage(Tetris):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        action_mode (str):
+            The mode of the actions.
+            Can be either "button" (press a single button) or "placement" (place the
+            current block with a rotation and column).
     """
 
-    @property
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=0,
@@ -179,8 +368,7 @@ class TetrisFullImage(Tetris):
         )
 
     def observation(self) -> np.ndarray:
-        obs = ski.color.rgba2rgb(self.pyboy.screen.image)
-        return (255 * obs).clip(0, 255).astype(np.uint8)
+        return rgba_to_rgb(self.screen())
 
 
 class TetrisMinimalImage(Tetris):
@@ -199,6 +387,11 @@ class TetrisMinimalImage(Tetris):
     - 7: Press Start
     - 8: Press Select
 
+    With action_mode="placement", the action space consists of 40 discrete actions
+    10 * rotation + column. Each action rotates the current block rotation times,
+    moves it column times to the right of the left wall and drops it until the next
+    block appears.
+
     ## Observation Space
     The observation is an (18, 10) array representing a simplified view of the game
     screen.
@@ -226,9 +419,37 @@ class TetrisMinimalImage(Tetris):
 
         render_mode (str | None):
             The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        action_mode (str):
+            The mode of the actions.
+            Can be either "button" (press a single button) or "placement" (place the
+            current block with a rotation and column).
     """
 
-    @property
+    _requires_rendering = False
+
+    @cached_property
     def observation_space(self) -> spaces.Space:
         return spaces.Box(
             low=-np.inf,
@@ -238,4 +459,141 @@ class TetrisMinimalImage(Tetris):
         )
 
     def observation(self) -> np.ndarray:
-        return _game_area(self.pyboy).astype(np.float32)
+        return _game_area(self.ram).astype(np.float32)
+
+
+class TetrisGrayscaleImage(Tetris):
+    """
+    The Tetris environment.
+
+    ## Action Space
+    The action space consists of 9 discrete actions:
+    - 0: No action
+    - 1: Press A
+    - 2: Press B
+    - 3: Press Left
+    - 4: Press Right
+    - 5: Press Up
+    - 6: Press Down
+    - 7: Press Start
+    - 8: Press Select
+
+    With action_mode="placement", the action space consists of 40 discrete actions
+    10 * rotation + column. Each action rotates the current block rotation times,
+    moves it column times to the right of the left wall and drops it until the next
+    block appears.
+
+    ## Observation Space
+    The observation is an (144 / downsample, 160 / downsample) array representing
+    the grayscale image of the game screen, which keeps every downsample-th row and
+    column of the screen.
+    With palette_index=True, each pixel is the index of its shade from 0 (white)
+    to 3 (black) instead.
+
+    ## Rewards
+    The reward is:
+    - -1.0 if the game is over
+    - otherwise the normalized score
+
+    ## Version History
+    - v1: Original version
+
+    Args:
+        rom_path (str):
+            The path to the ROM file.
+
+        init_state_path (str | None):
+            The path to the initial state file.
+
+        n_frameskip (int):
+            The number of frames to skip between each action
+
+        sound (bool):
+            The flag to dis-/enable the sound.
+
+        render_mode (str | None):
+            The mode in which the game will be rendered.
+
+        render_policy (str):
+            The policy for rendering the screen after each step.
+            Can be either "auto", "always" or "never".
+
+        init_state (bytes | None):
+            The initial state as bytes, e.g. shared by multiple environments.
+            If given, it is used instead of reading the initial state file.
+
+        copy_observation (bool):
+            The flag to return a copy of the observation buffer.
+            If False, the observation of the *Flatten environments is a view of the
+            buffer, which is overwritten by the next call of step() or reset().
+
+        profile (bool):
+            The flag to record the time of each phase of step() and reset(), which
+            are returned by perf_stats().
+
+        pyboy (PyBoy | None):
+            The game boy instance to use instead of creating one from the ROM file,
+            e.g. a gymboy.testing.FakePyBoy. If given, the ROM file is not read.
+
+        action_mode (str):
+            The mode of the actions.
+            Can be either "button" (press a single button) or "placement" (place the
+            current block with a rotation and column).
+
+        downsample (int):
+            The factor to downsample the height and width of the screen, e.g. 2 for
+            a (72, 80) observation.
+
+        palette_index (bool):
+            The flag to return the index of the shade of each pixel instead of its
+            grayscale value.
+    """
+
+    def __init__(
+        self,
+        rom_path: str,
+        init_state_path: str | None = None,
+        n_frameskip: int = 1,
+        sound: bool = False,
+        render_mode: str | None = None,
+        render_policy: str = "auto",
+        init_state: bytes | None = None,
+        copy_observation: bool = True,
+        profile: bool = False,
+        pyboy: PyBoy | None = None,
+        action_mode: str = "button",
+        downsample: int = 1,
+        palette_index: bool = False,
+    ):
+        if downsample < 1:
+            raise ValueError(f"Invalid downsample factor {downsample}.")
+
+        self.downsample = downsample
+        self.palette_index = palette_index
+        super().__init__(
+            rom_path=rom_path,
+            init_state_path=init_state_path,
+            n_frameskip=n_frameskip,
+            sound=sound,
+            render_mode=render_mode,
+            render_policy=render_policy,
+            init_state=init_state,
+            copy_observation=copy_observation,
+            profile=profile,
+            pyboy=pyboy,
+            action_mode=action_mode,
+        )
+
+    @cached_property
+    def observation_space(self) -> spaces.Space:
+        return spaces.Box(
+            low=0,
+            high=3 if self.palette_index else 255,
+            shape=downsampled_shape(self.downsample),
+            dtype=np.uint8,
+        )
+
+    def observation(self) -> np.ndarray:
+        if self.palette_index:
+            return rgba_to_palette_index(self.screen(), self.downsample)
+        return rgba_to_grayscale(self.screen(), self.downsample)
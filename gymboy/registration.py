@@ -1,35 +1,103 @@
 """An version of OpenAI's infamous env.make(env_name)."""
 
-from typing import Callable
+import importlib
+import os
+from typing import Callable, Type
 
 import gymnasium as gym
 
-from .environments import (
-    KirbyDreamLand1Flatten,
-    KirbyDreamLand1FullImage,
-    KirbyDreamLand1MinimalImage,
-    PokemonBlueFlatten,
-    PokemonBlueFullImage,
-    PokemonBlueMinimalImage,
-    PokemonGoldFlatten,
-    PokemonGoldFullImage,
-    PokemonGoldMinimalImage,
-    PokemonRedFlatten,
-    PokemonRedFullImage,
-    PokemonRedMinimalImage,
-    PokemonSilverFlatten,
-    PokemonSilverFullImage,
-    PokemonSilverMinimalImage,
-    PokemonYellowFlatten,
-    PokemonYellowFullImage,
-    PokemonYellowMinimalImage,
-    SuperMarioLand1Flatten,
-    SuperMarioLand1FullImage,
-    SuperMarioLand1MinimalImage,
-    TetrisFlatten,
-    TetrisFullImage,
-    TetrisMinimalImage,
-)
+# Maps each environment ID to the entry point "module:class" of the environment.
+# The modules are only imported when the environment is created.
+_REGISTRY = {
+    "Kirby-Dream-Land-1-flatten-v1": "gymboy.environments.kirby:KirbyDreamLand1Flatten",
+    "Kirby-Dream-Land-1-full-image-v1": (
+        "gymboy.environments.kirby:KirbyDreamLand1FullImage"
+    ),
+    "Kirby-Dream-Land-1-grayscale-image-v1": (
+        "gymboy.environments.kirby:KirbyDreamLand1GrayscaleImage"
+    ),
+    "Kirby-Dream-Land-1-minimal-image-v1": (
+        "gymboy.environments.kirby:KirbyDreamLand1MinimalImage"
+    ),
+    "Pokemon-Blue-flatten-v1": "gymboy.environments.pokemon:PokemonBlueFlatten",
+    "Pokemon-Blue-full-image-v1": "gymboy.environments.pokemon:PokemonBlueFullImage",
+    "Pokemon-Blue-grayscale-image-v1": (
+        "gymboy.environments.pokemon:PokemonBlueGrayscaleImage"
+    ),
+    "Pokemon-Blue-minimal-image-v1": (
+        "gymboy.environments.pokemon:PokemonBlueMinimalImage"
+    ),
+    "Pokemon-Gold-flatten-v1": "gymboy.environments.pokemon:PokemonGoldFlatten",
+    "Pokemon-Gold-full-image-v1": "gymboy.environments.pokemon:PokemonGoldFullImage",
+    "Pokemon-Gold-grayscale-image-v1": (
+        "gymboy.environments.pokemon:PokemonGoldGrayscaleImage"
+    ),
+    "Pokemon-Gold-minimal-image-v1": (
+        "gymboy.environments.pokemon:PokemonGoldMinimalImage"
+    ),
+    "Pokemon-Red-flatten-v1": "gymboy.environments.pokemon:PokemonRedFlatten",
+    "Pokemon-Red-full-image-v1": "gymboy.environments.pokemon:PokemonRedFullImage",
+    "Pokemon-Red-grayscale-image-v1": (
+        "gymboy.environments.pokemon:PokemonRedGrayscaleImage"
+    ),
+    "Pokemon-Red-minimal-image-v1": (
+        "gymboy.environments.pokemon:PokemonRedMinimalImage"
+    ),
+    "Pokemon-Silver-flatten-v1": "gymboy.environments.pokemon:PokemonSilverFlatten",
+    "Pokemon-Silver-full-image-v1": (
+        "gymboy.environments.pokemon:PokemonSilverFullImage"
+    ),
+    "Pokemon-Silver-grayscale-image-v1": (
+        "gymboy.environments.pokemon:PokemonSilverGrayscaleImage"
+    ),
+    "Pokemon-Silver-minimal-image-v1": (
+        "gymboy.environments.pokemon:PokemonSilverMinimalImage"
+    ),
+    "Pokemon-Yellow-flatten-v1": "gymboy.environments.pokemon:PokemonYellowFlatten",
+    "Pokemon-Yellow-full-image-v1": (
+        "gymboy.environments.pokemon:PokemonYellowFullImage"
+    ),
+    "Pokemon-Yellow-grayscale-image-v1": (
+        "gymboy.environments.pokemon:PokemonYellowGrayscaleImage"
+    ),
+    "Pokemon-Yellow-minimal-image-v1": (
+        "gymboy.environments.pokemon:PokemonYellowMinimalImage"
+    ),
+    "Super-Mario-Land-1-flatten-v1": "gymboy.environments.mario:SuperMarioLand1Flatten",
+    "Super-Mario-Land-1-full-image-v1": (
+        "gymboy.environments.mario:SuperMarioLand1FullImage"
+    ),
+    "Super-Mario-Land-1-grayscale-image-v1": (
+        "gymboy.environments.mario:SuperMarioLand1GrayscaleImage"
+    ),
+    "Super-Mario-Land-1-minimal-image-v1": (
+        "gymboy.environments.mario:SuperMarioLand1MinimalImage"
+    ),
+    "Tetris-flatten-v1": "gymboy.environments.tetris:TetrisFlatten",
+    "Tetris-full-image-v1": "gymboy.environments.tetris:TetrisFullImage",
+    "Tetris-grayscale-image-v1": "gymboy.environments.tetris:TetrisGrayscaleImage",
+    "Tetris-minimal-image-v1": "gymboy.environments.tetris:TetrisMinimalImage",
+}
+
+registered_envs = list(_REGISTRY)
+
+assert registered_envs == sorted(registered_envs)
+
+
+def _load_entry_point(entry_point: str) -> Type[gym.Env]:
+    """
+    Imports the class of an entry point "module:class".
+
+    Args:
+        entry_point (str):
+            The entry point of the environment
+
+    Returns:
+        Type[gym.Env]:
+            The class of the environment
+    """
+    module_name, class_name = entry_point.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def make(
@@ -49,121 +117,18 @@ def make(
         gym.Env:
             The Gymboy environment
     """
-    if env_id not in registered_envs:
+    if env_id not in _REGISTRY:
         raise ValueError(f"{env_id} is not in registered gymboy environments.")
 
-    # 1. Kirby environments
-    if env_id == "Kirby-Dream-Land-1-flatten-v1":
-        env = KirbyDreamLand1Flatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Kirby-Dream-Land-1-full-image-v1":
-        env = KirbyDreamLand1FullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Kirby-Dream-Land-1-minimal-image-v1":
-        env = KirbyDreamLand1MinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-
-    # 2. Pokemon environments
-    elif env_id == "Pokemon-Blue-flatten-v1":
-        env = PokemonBlueFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Blue-full-image-v1":
-        env = PokemonBlueFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Blue-minimal-image-v1":
-        env = PokemonBlueMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Gold-flatten-v1":
-        env = PokemonGoldFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Gold-full-image-v1":
-        env = PokemonGoldFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Gold-minimal-image-v1":
-        env = PokemonGoldMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Red-flatten-v1":
-        env = PokemonRedFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Red-full-image-v1":
-        env = PokemonRedFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Red-minimal-image-v1":
-        env = PokemonRedMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Silver-flatten-v1":
-        env = PokemonSilverFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Silver-full-image-v1":
-        env = PokemonSilverFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Silver-minimal-image-v1":
-        env = PokemonSilverMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Yellow-flatten-v1":
-        env = PokemonYellowFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Yellow-full-image-v1":
-        env = PokemonYellowFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Pokemon-Yellow-minimal-image-v1":
-        env = PokemonYellowMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-
-    # 3. Mario environments
-    elif env_id == "Super-Mario-Land-1-flatten-v1":
-        env = SuperMarioLand1Flatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Super-Mario-Land-1-full-image-v1":
-        env = SuperMarioLand1FullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Super-Mario-Land-1-minimal-image-v1":
-        env = SuperMarioLand1MinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-
-    # 4. Tetris environments
-    elif env_id == "Tetris-flatten-v1":
-        env = TetrisFlatten(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Tetris-full-image-v1":
-        env = TetrisFullImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    elif env_id == "Tetris-minimal-image-v1":
-        env = TetrisMinimalImage(
-            rom_path=rom_path, init_state_path=init_state_path, **env_kwargs
-        )
-    else:
-        raise ValueError("Environment ID is not registered.")
-    return env
+    env_cls = _load_entry_point(_REGISTRY[env_id])
+    return env_cls(rom_path=rom_path, init_state_path=init_state_path, **env_kwargs)
 
 
 def make_vec(
     env_id: str,
     num_envs: int = 1,
     vectorization_mode: str = "sync",
+    num_workers: int | None = None,
     **env_kwargs,
 ) -> gym.vector.VectorEnv:
     """
@@ -178,7 +143,13 @@ def make_vec(
 
         vectorization_mode (str):
             The vectorization mmode used.
-            Can be either "async" or "sync".
+            Can be either "async", "sync", "shared_memory", "fork_server",
+            "double_buffer" or "work_stealing".
+
+        num_workers (int | None):
+            The number of worker processes of the "shared_memory" and
+            "work_stealing" modes or the number of groups of the "double_buffer" mode.
+            If None, the number of CPU cores (at least 2 groups) is used.
 
     Returns:
         gym.vector.VectorEnv:
@@ -186,7 +157,14 @@ def make_vec(
     """
     if num_envs <= 0:
         raise ValueError("Number of environments must be greater than 0.")
-    if vectorization_mode not in ["async", "sync"]:
+    if vectorization_mode not in [
+        "async",
+        "sync",
+        "shared_memory",
+        "fork_server",
+        "double_buffer",
+        "work_stealing",
+    ]:
         raise ValueError("Invalid vectorization mode.")
 
     def create_env(_: int) -> Callable[[], gym.Env]:
@@ -199,35 +177,30 @@ def make_vec(
 
     if vectorization_mode == "async":
         return gym.vector.AsyncVectorEnv(env_fns)
+    elif vectorization_mode == "shared_memory":
+        from .vector import SharedMemoryVectorEnv
+
+        return SharedMemoryVectorEnv(env_fns, num_workers=num_workers)
+    elif vectorization_mode == "fork_server":
+        from .vector import ForkServerVectorEnv
+
+        return ForkServerVectorEnv(env_fns[0], num_envs)
+    elif vectorization_mode == "double_buffer":
+        from .vector import DoubleBufferVectorEnv
+
+        if num_workers is None:
+            num_workers = min(max(os.cpu_count() or 1, 2), num_envs)
+        return DoubleBufferVectorEnv(env_fns, num_groups=num_workers)
+    elif vectorization_mode == "work_stealing":
+        from .vector import WorkStealingVectorEnv
+
+        return WorkStealingVectorEnv(env_fns, num_workers=num_workers)
     else:
         return gym.vector.SyncVectorEnv(env_fns)
 
 
-registered_envs = [
-    "Kirby-Dream-Land-1-flatten-v1",
-    "Kirby-Dream-Land-1-full-image-v1",
-    "Kirby-Dream-Land-1-minimal-image-v1",
-    "Pokemon-Blue-flatten-v1",
-    "Pokemon-Blue-full-image-v1",
-    "Pokemon-Blue-minimal-image-v1",
-    "Pokemon-Gold-flatten-v1",
-    "Pokemon-Gold-full-image-v1",
-    "Pokemon-Gold-minimal-image-v1",
-    "Pokemon-Red-flatten-v1",
-    "Pokemon-Red-full-image-v1",
-    "Pokemon-Red-minimal-image-v1",
-    "Pokemon-Silver-flatten-v1",
-    "Pokemon-Silver-full-image-v1",
-    "Pokemon-Silver-minimal-image-v1",
-    "Pokemon-Yellow-flatten-v1",
-    "Pokemon-Yellow-full-image-v1",
-    "Pokemon-Yellow-minimal-image-v1",
-    "Super-Mario-Land-1-flatten-v1",
-    "Super-Mario-Land-1-full-image-v1",
-    "Super-Mario-Land-1-minimal-image-v1",
-    "Tetris-flatten-v1",
-    "Tetris-full-image-v1",
-    "Tetris-minimal-image-v1",
-]
-
-assert registered_envs == sorted(registered_envs)
+# Register the environments in gymnasium under the "gymboy" namespace,
+# e.g. gym.make("gymboy/Tetris-flatten-v1", rom_path=...)
+for env_id, entry_point in _REGISTRY.items():
+    if f"gymboy/{env_id}" not in gym.registry:
+        gym.register(id=f"gymboy/{env_id}", entry_point=entry_point)
@@ -0,0 +1,55 @@
+"""A scriptable in-process stand-in for PyBoy to test and profile without ROMs."""
+
+from typing import Callable
+
+import gymnasium as gym
+
+from gymboy.registration import make, registered_envs
+from gymboy.utils.fake_pyboy import (
+    CARTRIDGE_TITLES,
+    FakeGameWrapper,
+    FakeMemory,
+    FakePyBoy,
+    FakeScreen,
+    make_fake_pyboy,
+)
+
+__all__ = [
+    "CARTRIDGE_TITLES",
+    "FakeGameWrapper",
+    "FakeMemory",
+    "FakePyBoy",
+    "FakeScreen",
+    "make_fake",
+]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
+
+
+def make_fake(
+    env_id: str,
+    script: Callable[[FakePyBoy], None] | None = None,
+    **env_kwargs,
+) -> gym.Env:
+    """
+    Creates a registered environment that runs on a FakePyBoy.
+
+    Args:
+        env_id (str):
+            A string identifier for the environment
+
+        script (Callable[[FakePyBoy], None] | None):
+            The function that is called with the fake after each frame
+
+        **env_kwargs:
+            Keyword arguments to pass to the environment
+
+    Returns:
+        gym.Env:
+            The Gymboy environment
+    """
+    if env_id not in registered_envs:
+        raise ValueError(f"{env_id} is not in registered gymboy environments.")
+
+    pyboy = make_fake_pyboy(env_id, script=script)
+    return make(env_id, rom_path=f"{env_id}.gb", pyboy=pyboy, **env_kwargs)
@@ -2,16 +2,52 @@
 
 from .binary import (
     bcds_to_integer,
+    bcds_to_integer_array,
     bytes_bit_count,
+    bytes_bit_count_array,
     bytes_to_int,
+    bytes_to_int_array,
     reduced_bcds_to_integer,
+    reduced_bcds_to_integer_array,
 )
+from .fake_pyboy import FakePyBoy, make_fake_pyboy
+from .image import (
+    downsampled_shape,
+    rgba_to_grayscale,
+    rgba_to_palette_index,
+    rgba_to_rgb,
+)
+from .memory import PyBoySnapshot, SnapshotMemory
+from .observation import ObservationBuffer
+from .profiler import PhaseProfiler, merge_perf_stats
+from .schema import Field, Schema
+from .snapshot import SnapshotStore
+from .tilemap import tilemap_game_area
 
 __all__ = [
+    "FakePyBoy",
+    "Field",
+    "ObservationBuffer",
+    "PhaseProfiler",
+    "PyBoySnapshot",
+    "Schema",
+    "SnapshotMemory",
+    "SnapshotStore",
     "bcds_to_integer",
+    "bcds_to_integer_array",
     "bytes_bit_count",
+    "bytes_bit_count_array",
     "bytes_to_int",
+    "bytes_to_int_array",
+    "downsampled_shape",
+    "make_fake_pyboy",
+    "merge_perf_stats",
     "reduced_bcds_to_integer",
+    "reduced_bcds_to_integer_array",
+    "rgba_to_grayscale",
+    "rgba_to_palette_index",
+    "rgba_to_rgb",
+    "tilemap_game_area",
 ]
 
 assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
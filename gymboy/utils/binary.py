@@ -1,3 +1,17 @@
+import numpy as np
+
+# Number of bits set to 1 of each byte
+POPCOUNT_LUT = np.array([byte.bit_count() for byte in range(256)], dtype=np.int64)
+
+# Decimal value of each byte as BCD number (0x12 -> 12)
+BCD_LUT = np.array(
+    [(byte >> 4) * 10 + (byte & 0x0F) for byte in range(256)], dtype=np.int64
+)
+
+# Decimal value of each byte as reduced BCD number (0x02 -> 2)
+REDUCED_BCD_LUT = np.array([byte & 0x0F for byte in range(256)], dtype=np.int64)
+
+
 def bytes_bit_count(numbers: list[int]) -> int:
     """
     Counts the number of bits set to 1.
@@ -35,7 +49,7 @@ def bytes_to_int(numbers: list[int]) -> int:
 
     Examples:
         >>> bytes_to_int([0x00, 0x01])
-        0
+        1
         >>> bytes_to_int([0x12, 0x34])
         4660
         >>> bytes_to_int([0xFF, 0xFF])
@@ -105,3 +119,89 @@ def reduced_bcds_to_integer(numbers: list[int]) -> int:
         low_hex = byte & 0x0F  # 0xB
         result = result * 10 + low_hex
     return result
+
+
+def _digit_weights(n_digits: int, base: int) -> np.ndarray:
+    """Returns the weights base^(n-1), ..., base^0 of n big-endian digits."""
+    return base ** np.arange(n_digits - 1, -1, -1, dtype=np.int64)
+
+
+def bytes_bit_count_array(numbers: np.ndarray) -> np.ndarray:
+    """
+    Counts the number of bits set to 1 along the last axis.
+
+    Args:
+        numbers (np.ndarray):
+            The byte values of shape (..., n_bytes)
+
+    Returns:
+        np.ndarray:
+            The number of bits set to 1 of shape (...)
+
+    Examples:
+        >>> bytes_bit_count_array(np.array([[0x00, 0x00], [0x12, 0x34]], np.uint8))
+        array([0, 5])
+    """
+    return POPCOUNT_LUT[np.asarray(numbers, dtype=np.uint8)].sum(axis=-1)
+
+
+def bytes_to_int_array(numbers: np.ndarray) -> np.ndarray:
+    """
+    Converts bytes in big-endian order along the last axis to integers.
+
+    Args:
+        numbers (np.ndarray):
+            The byte values of shape (..., n_bytes) with n_bytes <= 7
+
+    Returns:
+        np.ndarray:
+            The integer values of shape (...)
+
+    Examples:
+        >>> bytes_to_int_array(np.array([[0x00, 0x01], [0x12, 0x34]], np.uint8))
+        array([   1, 4660])
+    """
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    if numbers.shape[-1] > 7:
+        raise ValueError(f"Too many bytes for int64, got {numbers.shape[-1]}.")
+    return numbers @ _digit_weights(numbers.shape[-1], 256)
+
+
+def bcds_to_integer_array(numbers: np.ndarray) -> np.ndarray:
+    """
+    Converts BCD numbers along the last axis to integers.
+
+    Args:
+        numbers (np.ndarray):
+            The BCD numbers of shape (..., n_bytes)
+
+    Returns:
+        np.ndarray:
+            The integer values of shape (...)
+
+    Examples:
+        >>> bcds_to_integer_array(np.array([[0x00, 0x31, 0x75]], np.uint8))
+        array([3175])
+    """
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    return BCD_LUT[numbers] @ _digit_weights(numbers.shape[-1], 100)
+
+
+def reduced_bcds_to_integer_array(numbers: np.ndarray) -> np.ndarray:
+    """
+    Converts reduced BCD numbers along the last axis to integers.
+
+    Args:
+        numbers (np.ndarray):
+            The reduced BCD numbers of shape (..., n_bytes)
+
+    Returns:
+        np.ndarray:
+            The integer values of shape (...)
+
+    Examples:
+        >>> reduced_bcds_to_integer_array(np.array([[0x00, 0x03, 0x00]], np.uint8))
+        array([30])
+    """
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    return REDUCED_BCD_LUT[numbers] @ _digit_weights(numbers.shape[-1], 10)
@@ -0,0 +1,265 @@
+import io
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+# Cartridge title of each game, i.e. each prefix of the registered environment IDs
+CARTRIDGE_TITLES = {
+    "Kirby-Dream-Land-1": "KIRBY DREAM LAN",
+    "Pokemon-Blue": "POKEMON BLUE",
+    "Pokemon-Gold": "POKEMON_GLDAAU",
+    "Pokemon-Red": "POKEMON RED",
+    "Pokemon-Silver": "POKEMON_SLVAAX",
+    "Pokemon-Yellow": "POKEMON YELLOW",
+    "Super-Mario-Land-1": "SUPER MARIOLAND",
+    "Tetris": "TETRIS",
+}
+
+# Shape of pyboy.game_area() of each cartridge title, where all other games use
+# the whole screen of (18, 20) tiles
+GAME_AREA_SHAPES = {
+    "KIRBY DREAM LAN": (16, 20),
+    "SUPER MARIOLAND": (16, 20),
+    "TETRIS": (18, 10),
+}
+
+# Address of the object attribute memory (OAM) and number of sprites
+OAM_ADDRESS = 0xFE00
+N_SPRITES = 40
+
+
+class FakeMemory:
+    """
+    The memory of a FakePyBoy, which is indexed like pyboy.memory.
+
+    Args:
+        array (np.ndarray):
+            The (0x10000,) uint8 array with the value of each address
+    """
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def __getitem__(self, key: int | slice) -> int | List[int]:
+        if isinstance(key, slice):
+            return self.array[key].tolist()
+        return self.array.item(key)
+
+    def __setitem__(self, key: int | slice, value: int | List[int]):
+        self.array[key] = value
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+
+class FakeScreen:
+    """
+    The screen of a FakePyBoy, which has the same attributes as pyboy.screen.
+
+    Args:
+        memory (FakeMemory):
+            The memory with the scroll registers of the game boy
+    """
+
+    def __init__(self, memory: FakeMemory):
+        self.memory = memory
+        self.ndarray = np.zeros((144, 160, 4), dtype=np.uint8)
+        self.ndarray[..., 3] = 255
+
+    @property
+    def tilemap_position_list(self) -> List[List[int]]:
+        """Returns the [SCX, SCY, WX - 7, WY] registers of each scanline."""
+        scy, scx = self.memory[0xFF42], self.memory[0xFF43]
+        wy, wx = self.memory[0xFF4A], self.memory[0xFF4B]
+        return [[scx, scy, wx - 7, wy] for _ in range(144)]
+
+
+class FakeGameWrapper:
+    """
+    The game wrapper of a FakePyBoy.
+
+    Args:
+        pyboy (FakePyBoy):
+            The fake game boy instance
+    """
+
+    def __init__(self, pyboy: "FakePyBoy"):
+        self.pyboy = pyboy
+        self.is_game_over = False
+        self.n_resets = 0
+        self.seed = None
+
+    def reset_game(self, seed: int | None = None):
+        self.n_resets += 1
+        self.seed = seed
+        self.is_game_over = False
+
+    def _set_timer_div(self, seed: int | None = None):
+        self.seed = seed
+
+    def game_over(self) -> bool:
+        return self.is_game_over
+
+    def game_area(self) -> np.ndarray:
+        return self.pyboy.game_area()
+
+
+class FakePyBoy:
+    """
+    A scriptable stand-in for a PyBoy instance without emulation.
+
+    The memory, game area, screen and sprites are settable, so the memory readers
+    under gymboy/environments/**/_memory.py and the environments (with the pyboy
+    argument) run on it without ROM files. Each tick only counts the frame, releases
+    the buttons and calls the script, which can change the state like a game.
+
+    Args:
+        cartridge_title (str):
+            The cartridge title of the game
+
+        script (Callable[[FakePyBoy], None] | None):
+            The function that is called with the fake after each frame
+
+        cgb (bool):
+            The flag to mark the game as game boy color game
+
+    Examples:
+        >>> pyboy = FakePyBoy("TETRIS")
+        >>> pyboy.memory[0xC0A0] = 0x12
+        >>> pyboy.tick(3)
+        True
+        >>> pyboy.frame_count, pyboy.memory[0xC0A0]
+        (3, 18)
+    """
+
+    def __init__(
+        self,
+        cartridge_title: str,
+        script: Callable[["FakePyBoy"], None] | None = None,
+        cgb: bool = False,
+    ):
+        self.cartridge_title = cartridge_title
+        self.script = script
+
+        self.memory = FakeMemory(np.zeros(0x10000, dtype=np.uint8))
+        if cgb:
+            self.memory[0x0143] = 0x80
+        # LCD on with unsigned tile indices
+        self.memory[0xFF40] = 0b10010001
+        self.screen = FakeScreen(self.memory)
+        self.game_area_array = np.zeros(
+            GAME_AREA_SHAPES.get(cartridge_title, (18, 20)), dtype=np.uint32
+        )
+        self.game_wrapper = FakeGameWrapper(self)
+
+        self.frame_count = 0
+        self.rendered_frames = 0
+        self.emulation_speed = 1
+        self.held_buttons = {}
+        self.pressed_buttons: List[Tuple[int, str]] = []
+        self.stopped = False
+
+    def tick(self, count: int = 1, render: bool = True, sound: bool = True) -> bool:
+        for _ in range(count):
+            self.frame_count += 1
+            for button, release_frame in list(self.held_buttons.items()):
+                if release_frame is not None and release_frame <= self.frame_count:
+                    del self.held_buttons[button]
+            if self.script is not None:
+                self.script(self)
+        if render and count > 0:
+            self.rendered_frames += 1
+        return not self.stopped
+
+    def button(self, input: str, delay: int = 1):
+        """Presses the button and releases it after delay frames."""
+        self.pressed_buttons.append((self.frame_count, input))
+        self.held_buttons[input] = self.frame_count + delay
+
+    def button_press(self, input: str):
+        """Presses the button until button_release() is called."""
+        self.pressed_buttons.append((self.frame_count, input))
+        self.held_buttons[input] = None
+
+    def button_release(self, input: str):
+        """Releases the button."""
+        self.held_buttons.pop(input, None)
+
+    def game_area(self) -> np.ndarray:
+        """Returns a copy of game_area_array."""
+        return self.game_area_array.copy()
+
+    def get_sprite(self, sprite_index: int) -> SimpleNamespace:
+        """Returns the sprite with the attributes of the OAM entry of the index."""
+        if not 0 <= sprite_index < N_SPRITES:
+            raise ValueError(f"Invalid sprite index {sprite_index}.")
+        y, x, tile, attr = self.memory[
+            OAM_ADDRESS + 4 * sprite_index : OAM_ADDRESS + 4 * sprite_index + 4
+        ]
+        cgb_bank = (attr >> 3) & 1 if self.memory[0x0143] & 0x80 else 0
+        return SimpleNamespace(
+            sprite_index=sprite_index,
+            x=x - 8,
+            y=y - 16,
+            tile_identifier=tile + 384 * cgb_bank,
+            on_screen=-8 < x - 8 < 160 and -16 < y - 16 < 144,
+            attr_cgb_bank_number=cgb_bank,
+        )
+
+    def set_sprite(self, sprite_index: int, x: int, y: int, tile_identifier: int):
+        """Writes the OAM entry of a sprite at the (x, y) screen position."""
+        if not 0 <= sprite_index < N_SPRITES:
+            raise ValueError(f"Invalid sprite index {sprite_index}.")
+        start = OAM_ADDRESS + 4 * sprite_index
+        self.memory[start : start + 3] = [y + 16, x + 8, tile_identifier]
+
+    def set_emulation_speed(self, target_speed: int):
+        self.emulation_speed = target_speed
+
+    def save_state(self, file_like_object: io.BufferedIOBase):
+        """Saves the memory, game area, screen and frame count."""
+        file_like_object.write(self.frame_count.to_bytes(8, "little"))
+        file_like_object.write(self.memory.array.tobytes())
+        file_like_object.write(self.game_area_array.tobytes())
+        file_like_object.write(self.screen.ndarray.tobytes())
+
+    def load_state(self, file_like_object: io.BufferedIOBase):
+        """Loads a state that was saved with save_state()."""
+        self.frame_count = int.from_bytes(file_like_object.read(8), "little")
+        for array in [self.memory.array, self.game_area_array, self.screen.ndarray]:
+            array[...] = np.frombuffer(
+                file_like_object.read(array.nbytes), dtype=array.dtype
+            ).reshape(array.shape)
+
+    def stop(self, save: bool = True):
+        self.stopped = True
+
+
+def make_fake_pyboy(
+    env_id: str, script: Callable[[FakePyBoy], None] | None = None
+) -> FakePyBoy:
+    """
+    Returns a FakePyBoy with the cartridge of the game of an environment.
+
+    Args:
+        env_id (str):
+            A string identifier for the environment
+
+        script (Callable[[FakePyBoy], None] | None):
+            The function that is called with the fake after each frame
+
+    Returns:
+        FakePyBoy:
+            The fake game boy instance
+    """
+    game = next(
+        (game for game in CARTRIDGE_TITLES if env_id.startswith(f"{game}-")), None
+    )
+    if game is None:
+        raise ValueError(f"No cartridge title of {env_id}.")
+    return FakePyBoy(
+        CARTRIDGE_TITLES[game],
+        script=script,
+        cgb=game in ["Pokemon-Gold", "Pokemon-Silver", "Pokemon-Yellow"],
+    )
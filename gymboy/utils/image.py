@@ -0,0 +1,138 @@
+from typing import Tuple
+
+import numpy as np
+
+# Maps each channel value to the value that skimage.color.rgba2rgb followed by
+# (255 * obs).clip(0, 255).astype(np.uint8) returns for an opaque pixel.
+# The float64 round trip truncates 24 of the 256 values by one.
+RGBA_TO_RGB_LUT = (255 * (np.arange(256) * (1 / 255))).astype(np.uint8)
+
+
+def rgba_to_rgb(rgba: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Converts an opaque RGBA image to an RGB image.
+
+    The result is bit-identical to the float64 conversion with skimage.color.rgba2rgb,
+    but only touches uint8 buffers.
+
+    Args:
+        rgba (np.ndarray):
+            The (H, W, 4) RGBA image, e.g. pyboy.screen.ndarray
+
+        out (np.ndarray | None):
+            The (H, W, 3) uint8 buffer to write the RGB image into
+
+    Returns:
+        np.ndarray:
+            The (H, W, 3) RGB image
+
+    Examples:
+        >>> rgba_to_rgb(np.array([[[0, 33, 255, 255]]], dtype=np.uint8))
+        array([[[  0,  32, 255]]], dtype=uint8)
+    """
+    return np.take(RGBA_TO_RGB_LUT, rgba[..., :3], out=out, mode="clip")
+
+
+# Maps each red, green and blue channel value to its share of the luminance with the
+# ITU-R BT.601 weights 77, 150 and 29 (/ 256). The sum of the three shares is the
+# grayscale value, which is at most 255 and therefore never overflows uint8.
+GRAYSCALE_LUTS = ((np.arange(256) * np.array([[77], [150], [29]]) + 128) // 256).astype(
+    np.uint8
+)
+
+# Shades of the default DMG palette of PyBoy from the lightest to the darkest
+DMG_SHADES = np.array([0xFF, 0x99, 0x55, 0x00])
+
+# Maps each grayscale value to the index of the nearest shade of DMG_SHADES
+GRAYSCALE_TO_PALETTE_INDEX_LUT = (
+    np.abs(np.arange(256)[:, None] - DMG_SHADES).argmin(axis=1).astype(np.uint8)
+)
+
+
+def downsampled_shape(downsample: int) -> Tuple[int, int]:
+    """
+    Returns the shape of the game boy screen after downsampling.
+
+    Args:
+        downsample (int):
+            The factor to downsample the height and width of the screen
+
+    Returns:
+        Tuple[int, int]:
+            The (height, width) of the downsampled screen
+    """
+    if downsample < 1:
+        raise ValueError(f"downsample must be greater than 0, got {downsample}.")
+    return -(-144 // downsample), -(-160 // downsample)
+
+
+def rgba_to_grayscale(
+    rgba: np.ndarray, downsample: int = 1, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Converts an opaque RGBA image to a downsampled grayscale image.
+
+    The image is downsampled by keeping every downsample-th row and column, before
+    the luminance of each remaining pixel is summed up from GRAYSCALE_LUTS.
+
+    Args:
+        rgba (np.ndarray):
+            The (H, W, 4) RGBA image, e.g. pyboy.screen.ndarray
+
+        downsample (int):
+            The factor to downsample the height and width of the image
+
+        out (np.ndarray | None):
+            The (ceil(H / downsample), ceil(W / downsample)) uint8 buffer to write
+            the grayscale image into
+
+    Returns:
+        np.ndarray:
+            The (ceil(H / downsample), ceil(W / downsample)) grayscale image
+
+    Examples:
+        >>> rgba = np.array([[[255, 0, 0, 255], [0, 255, 0, 255]]], dtype=np.uint8)
+        >>> rgba_to_grayscale(rgba)
+        array([[ 77, 149]], dtype=uint8)
+    """
+    rgba = rgba[::downsample, ::downsample]
+    grayscale = np.take(GRAYSCALE_LUTS[0], rgba[..., 0], out=out, mode="clip")
+    grayscale += np.take(GRAYSCALE_LUTS[1], rgba[..., 1], mode="clip")
+    grayscale += np.take(GRAYSCALE_LUTS[2], rgba[..., 2], mode="clip")
+    return grayscale
+
+
+def rgba_to_palette_index(
+    rgba: np.ndarray, downsample: int = 1, out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Converts an RGBA image of a game boy (DMG) game to the indices of its shades.
+
+    A game boy renders each pixel in one of the four gray DMG_SHADES, so the red
+    channel alone determines the index from 0 (lightest) to 3 (darkest).
+
+    Args:
+        rgba (np.ndarray):
+            The (H, W, 4) RGBA image, e.g. pyboy.screen.ndarray
+
+        downsample (int):
+            The factor to downsample the height and width of the image
+
+        out (np.ndarray | None):
+            The (ceil(H / downsample), ceil(W / downsample)) uint8 buffer to write
+            the indices into
+
+    Returns:
+        np.ndarray:
+            The (ceil(H / downsample), ceil(W / downsample)) shade indices
+
+    Examples:
+        >>> rgba_to_palette_index(np.array([[[153, 153, 153, 255]]], dtype=np.uint8))
+        array([[1]], dtype=uint8)
+    """
+    return np.take(
+        GRAYSCALE_TO_PALETTE_INDEX_LUT,
+        rgba[::downsample, ::downsample, 0],
+        out=out,
+        mode="clip",
+    )
@@ -0,0 +1,126 @@
+from typing import TYPE_CHECKING, Any, List, Tuple
+
+import numpy as np
+from pyboy import PyBoy
+
+if TYPE_CHECKING:
+    from .schema import Schema
+
+
+class SnapshotMemory:
+    """
+    A bulk copy of selected address ranges of the game boy memory.
+
+    Reads that lie inside the copied ranges are served from a numpy buffer, all
+    other reads fall back to the live memory of the emulator. The buffer is indexed
+    by the address itself, so buffer[address] is the copied byte at that address.
+
+    Args:
+        memory (Any):
+            The live memory of the game boy, i.e. pyboy.memory
+
+        address_ranges (List[Tuple[int, int]]):
+            The [start, end) address ranges to copy on each update
+    """
+
+    def __init__(self, memory: Any, address_ranges: List[Tuple[int, int]]):
+        self.memory = memory
+        self.address_ranges = _merge_ranges(address_ranges)
+        self.buffer = np.zeros(0x10000, dtype=np.uint8)
+
+        # Index of the (merged) address range of each address or -1
+        self._range_ids = np.full(0x10000, -1, dtype=np.int16)
+        for i, (start, end) in enumerate(self.address_ranges):
+            self._range_ids[start:end] = i
+
+    def update(self):
+        """Copies the address ranges from the live memory into the buffer."""
+        for start, end in self.address_ranges:
+            self.buffer[start:end] = bytearray(self.memory[start:end])
+
+    def covers(self, start: int, end: int) -> bool:
+        """Returns True if the [start, end) addresses are part of the copy."""
+        if not 0 <= start < end <= 0x10000:
+            return False
+        range_id = self._range_ids.item(start)
+        return range_id != -1 and range_id == self._range_ids.item(end - 1)
+
+    def __getitem__(self, key: int | slice) -> int | List[int]:
+        if isinstance(key, slice):
+            if key.step is None and self.covers(key.start, key.stop):
+                return self.buffer[key].tolist()
+            return self.memory[key]
+        if self._range_ids.item(key) != -1:
+            return self.buffer.item(key)
+        return self.memory[key]
+
+
+class PyBoySnapshot:
+    """
+    A stand-in for a PyBoy instance whose memory is a SnapshotMemory.
+
+    The memory readers under gymboy/environments/**/_memory.py accept it in place of
+    the PyBoy instance, so a single bulk copy per step serves all of them. All other
+    attributes (game_area(), screen, game_wrapper, ...) are forwarded to the live
+    PyBoy instance.
+
+    If a schema is given, its address ranges are part of the copy and its fields are
+    decoded once per update into the fields attribute.
+
+    Args:
+        pyboy (PyBoy):
+            The game boy instance
+
+        address_ranges (List[Tuple[int, int]]):
+            The [start, end) address ranges to copy on each update
+
+        schema (Schema | None):
+            The schema of the fields to decode on each update
+    """
+
+    def __init__(
+        self,
+        pyboy: PyBoy,
+        address_ranges: List[Tuple[int, int]],
+        schema: "Schema | None" = None,
+    ):
+        if schema is not None:
+            address_ranges = address_ranges + schema.address_ranges
+        self.pyboy = pyboy
+        self.memory = SnapshotMemory(pyboy.memory, address_ranges)
+        self.schema = schema
+        self.fields = {}
+
+    def update(self):
+        """Takes a new copy of the memory of the game boy."""
+        self.memory.update()
+        if self.schema is not None:
+            self.fields = self.schema.read(self.memory.buffer)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pyboy, name)
+
+
+def _merge_ranges(address_ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merges overlapping and adjacent address ranges.
+
+    Args:
+        address_ranges (List[Tuple[int, int]]):
+            The [start, end) address ranges
+
+    Returns:
+        List[Tuple[int, int]]:
+            The sorted and merged [start, end) address ranges
+
+    Examples:
+        >>> _merge_ranges([(0xD000, 0xD004), (0xC000, 0xC001), (0xD002, 0xD008)])
+        [(49152, 49153), (53248, 53256)]
+    """
+    merged = []
+    for start, end in sorted(address_ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
@@ -0,0 +1,76 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class ObservationBuffer:
+    """
+    A preallocated float32 observation with a fixed layout of named slices.
+
+    Each slice is a view of the observation with the shape of its part, e.g.
+    (18, 20) for the game area, so every part is written in place without
+    temporary arrays for flattening, concatenating and casting the parts.
+
+    Args:
+        layout (List[Tuple[str, Tuple[int, ...]]]):
+            The name and shape of each part in the order of the observation
+
+    Examples:
+        >>> buffer = ObservationBuffer([("level", ()), ("game_area", (2, 2))])
+        >>> buffer.slices["game_area"]
+        slice(1, 5, None)
+        >>> buffer["level"] = 3
+        >>> buffer["game_area"] = [[1, 2], [3, 4]]
+        >>> buffer.get()
+        array([3., 1., 2., 3., 4.], dtype=float32)
+    """
+
+    def __init__(self, layout: List[Tuple[str, Tuple[int, ...]]]):
+        self.slices = {}
+        start = 0
+        for name, shape in layout:
+            if name in self.slices:
+                raise ValueError(f"Duplicated part '{name}'.")
+            size = int(np.prod(shape))
+            if size <= 0:
+                raise ValueError(f"Invalid shape {shape} of part '{name}'.")
+            self.slices[name] = slice(start, start + size)
+            start += size
+
+        self.array = np.zeros(start, dtype=np.float32)
+        self.views = {
+            name: self.array[self.slices[name]].reshape(shape) for name, shape in layout
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickled views would be copies, so they are rebuilt from the layout
+        layout = [(name, view.shape) for name, view in self.views.items()]
+        return {"layout": layout, "array": self.array}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["layout"])
+        self.array[...] = state["array"]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.views[name]
+
+    def __setitem__(self, name: str, value: Any):
+        self.views[name][...] = value
+
+    def get(self, copy: bool = True) -> np.ndarray:
+        """
+        Returns the observation.
+
+        Args:
+            copy (bool):
+                The flag to return a copy of the observation.
+                If False, the buffer itself is returned, which is overwritten by the
+                next observation.
+
+        Returns:
+            np.ndarray:
+                The observation
+        """
+        if copy:
+            return self.array.copy()
+        return self.array
@@ -0,0 +1,118 @@
+import time
+from bisect import bisect_right
+from typing import Any, Dict, List, Sequence
+
+# Upper edges (in seconds) of the histogram bins, doubling from 1us to about 1s,
+# where the last bin counts all durations above the last edge
+HISTOGRAM_EDGES = [1e-6 * 2**i for i in range(21)]
+
+
+class PhaseProfiler:
+    """
+    Records the cumulative time and a histogram of the durations of each phase.
+
+    Args:
+        phases (Sequence[str]):
+            The names of the phases
+
+    Examples:
+        >>> profiler = PhaseProfiler(["emulation"])
+        >>> start = profiler.record("emulation", time.perf_counter())
+        >>> profiler.stats()["emulation"]["count"]
+        1
+    """
+
+    def __init__(self, phases: Sequence[str]):
+        if len(set(phases)) != len(phases):
+            raise ValueError(f"Duplicated phases in {phases}.")
+
+        self.phases = list(phases)
+        self.reset()
+
+    def reset(self):
+        """Clears all recorded durations."""
+        self.counts = {phase: 0 for phase in self.phases}
+        self.totals = {phase: 0.0 for phase in self.phases}
+        self.histograms = {
+            phase: [0 for _ in range(len(HISTOGRAM_EDGES) + 1)] for phase in self.phases
+        }
+
+    def record(self, phase: str, start: float) -> float:
+        """
+        Records the duration of a phase from start until now.
+
+        Args:
+            phase (str):
+                The name of the phase
+
+            start (float):
+                The time.perf_counter() at the start of the phase
+
+        Returns:
+            float:
+                The time.perf_counter() at the end of the phase, i.e. the start of
+                the next phase
+        """
+        end = time.perf_counter()
+        duration = end - start
+        self.counts[phase] += 1
+        self.totals[phase] += duration
+        self.histograms[phase][bisect_right(HISTOGRAM_EDGES, duration)] += 1
+        return end
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the recorded durations of each phase.
+
+        Returns:
+            Dict[str, Dict[str, Any]]:
+                The number of calls under "count", the cumulative time in seconds
+                under "total_s", the mean time in microseconds under "mean_us" and
+                the number of calls of each bin of HISTOGRAM_EDGES under "histogram"
+                of each phase
+        """
+        return {
+            phase: _phase_stats(
+                self.counts[phase], self.totals[phase], list(self.histograms[phase])
+            )
+            for phase in self.phases
+        }
+
+
+def _phase_stats(count: int, total: float, histogram: List[int]) -> Dict[str, Any]:
+    """Returns the stats of a phase."""
+    return {
+        "count": count,
+        "total_s": total,
+        "mean_us": 1e6 * total / count if count > 0 else 0.0,
+        "histogram": histogram,
+    }
+
+
+def merge_perf_stats(
+    stats: Sequence[Dict[str, Dict[str, Any]]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Merges the stats of multiple profilers, e.g. of each environment of a vector
+    environment.
+
+    Args:
+        stats (Sequence[Dict[str, Dict[str, Any]]]):
+            The stats of each profiler, see PhaseProfiler.stats()
+
+    Returns:
+        Dict[str, Dict[str, Any]]:
+            The summed up stats of each phase
+    """
+    merged = {}
+    for env_stats in stats:
+        for phase, phase_stats in env_stats.items():
+            if phase not in merged:
+                merged[phase] = (0, 0.0, [0 for _ in range(len(HISTOGRAM_EDGES) + 1)])
+            count, total, histogram = merged[phase]
+            merged[phase] = (
+                count + phase_stats["count"],
+                total + phase_stats["total_s"],
+                [a + b for a, b in zip(histogram, phase_stats["histogram"])],
+            )
+    return {phase: _phase_stats(*merged[phase]) for phase in merged}
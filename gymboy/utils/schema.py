@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .binary import BCD_LUT, POPCOUNT_LUT, REDUCED_BCD_LUT
+from .memory import PyBoySnapshot, SnapshotMemory, _merge_ranges
+
+# Encodings of a field and the decoded value of each single byte,
+# where ENCODING_LUTS[256 * i + byte] belongs to the i-th encoding
+ENCODINGS = ["raw", "int", "bcd", "reduced_bcd", "popcount"]
+ENCODING_LUTS = np.concatenate(
+    [
+        np.arange(256, dtype=np.int64),
+        np.arange(256, dtype=np.int64),
+        BCD_LUT,
+        REDUCED_BCD_LUT,
+        POPCOUNT_LUT,
+    ]
+)
+
+# Base of each digit in the encoded value
+ENCODING_BASES = {"raw": 1, "int": 256, "bcd": 100, "reduced_bcd": 10, "popcount": 1}
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    A value stored in the memory of the game boy.
+
+    Args:
+        name (str):
+            The name of the field
+
+        address (int):
+            The address of the (first) value
+
+        width (int):
+            The number of bytes of each value
+
+        encoding (str):
+            The encoding of the bytes of each value.
+            Can be either "raw", "int", "bcd", "reduced_bcd" or "popcount".
+
+        byteorder (str):
+            The order of the bytes of each value.
+            Can be either "big" or "little".
+
+        count (int):
+            The number of values, e.g. one for each pokemon in the team
+
+        stride (int | None):
+            The number of bytes between two values.
+            If None, the values are stored right after each other.
+    """
+
+    name: str
+    address: int
+    width: int = 1
+    encoding: str = "raw"
+    byteorder: str = "big"
+    count: int = 1
+    stride: int | None = None
+
+    def __post_init__(self):
+        if self.encoding not in ENCODINGS:
+            raise ValueError(f"Invalid encoding '{self.encoding}'.")
+        if self.byteorder not in ["big", "little"]:
+            raise ValueError(f"Invalid byteorder '{self.byteorder}'.")
+        if self.width < 1 or self.count < 1:
+            raise ValueError(f"Invalid width or count of field '{self.name}'.")
+
+    @property
+    def addresses(self) -> List[int]:
+        """The start addresses of each value."""
+        stride = self.width if self.stride is None else self.stride
+        return [self.address + i * stride for i in range(self.count)]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """The shape of the decoded field."""
+        shape = ()
+        if self.count > 1:
+            shape += (self.count,)
+        if self.encoding == "raw" and self.width > 1:
+            shape += (self.width,)
+        return shape
+
+
+class Schema:
+    """
+    A set of fields compiled into a single gather-and-decode plan.
+
+    All bytes of all fields are gathered with one fancy indexing operation.
+    Each byte is decoded with the lookup table of its encoding and weighted with
+    the base of its digit, then the digits of each value are summed up with one
+    reduction. Raw fields have one value per byte.
+
+    Args:
+        fields (List[Field]):
+            The fields of the schema
+
+        offset (int):
+            The offset that is added to all addresses, e.g. -1 for Pokemon Yellow
+    """
+
+    def __init__(self, fields: List[Field], offset: int = 0):
+        names = [field.name for field in fields]
+        if len(names) != len(set(names)):
+            raise ValueError("The names of the fields must be unique.")
+
+        self.fields = fields
+        self.offset = offset
+        self.address_ranges = _merge_ranges(
+            [
+                (address + offset, address + offset + field.width)
+                for field in fields
+                for address in field.addresses
+            ]
+        )
+
+        # Compile the gather-and-decode plan
+        indices, encodings, weights, starts, self._layout = [], [], [], [], []
+        for field in fields:
+            begin = len(starts)
+            encoding = 256 * ENCODINGS.index(field.encoding)
+            base = ENCODING_BASES[field.encoding]
+            for address in field.addresses:
+                digits = range(field.width)
+                if field.byteorder == "little":
+                    digits = reversed(digits)
+                for i, digit in enumerate(digits):
+                    if field.encoding == "raw" or i == 0:
+                        starts.append(len(indices))
+                    indices.append(address + offset + digit)
+                    encodings.append(encoding)
+                    weights.append(base ** (field.width - 1 - i))
+            if field.shape:
+                self._layout.append(
+                    (field.name, slice(begin, len(starts)), field.shape)
+                )
+            else:
+                self._layout.append((field.name, begin, field.shape))
+
+        self._indices = np.array(indices, dtype=np.intp)
+        self._lut_offsets = np.array(encodings, dtype=np.intp)
+        self._weights = np.array(weights, dtype=np.int64)
+        self._starts = np.array(starts, dtype=np.intp)
+
+        # Positions of the addresses in the concatenated address ranges
+        lengths = [end - start for start, end in self.address_ranges]
+        range_offsets = np.cumsum([0] + lengths[:-1])
+        compact_indices = self._indices.copy()
+        for (start, end), range_offset in zip(self.address_ranges, range_offsets):
+            in_range = (start <= self._indices) & (self._indices < end)
+            compact_indices[in_range] = self._indices[in_range] - start + range_offset
+        self._compact_indices = compact_indices
+
+    def read(self, memory: Any) -> Dict[str, np.ndarray]:
+        """
+        Reads and decodes all fields of the schema.
+
+        Args:
+            memory (Any):
+                The memory of the game boy, i.e. pyboy.memory, a SnapshotMemory or a
+                numpy array indexed by the address. Numpy arrays can have additional
+                leading (batch) dimensions.
+
+        Returns:
+            Dict[str, np.ndarray]:
+                The decoded value of each field
+        """
+        if isinstance(memory, SnapshotMemory) and all(
+            memory.covers(start, end) for start, end in self.address_ranges
+        ):
+            data = memory.buffer[self._indices]
+        elif isinstance(memory, np.ndarray):
+            data = memory[..., self._indices]
+        else:
+            data = np.concatenate(
+                [
+                    np.asarray(memory[start:end], dtype=np.uint8)
+                    for start, end in self.address_ranges
+                ]
+            )[self._compact_indices]
+
+        values = np.add.reduceat(
+            ENCODING_LUTS.take(self._lut_offsets + data) * self._weights,
+            self._starts,
+            axis=-1,
+        )
+        if values.ndim == 1:
+            return {
+                name: values[index].reshape(shape) if shape else values[index]
+                for name, index, shape in self._layout
+            }
+        batch_shape = values.shape[:-1]
+        return {
+            name: values[..., index].reshape(batch_shape + shape)
+            for name, index, shape in self._layout
+        }
+
+    def extract(self, pyboy: Any) -> Dict[str, np.ndarray]:
+        """
+        Returns the decoded fields of the game boy.
+
+        The fields of a PyBoySnapshot with this schema are decoded once per update,
+        so they are reused instead of decoded again.
+
+        Args:
+            pyboy (Any):
+                The game boy instance or a PyBoySnapshot of it
+
+        Returns:
+            Dict[str, np.ndarray]:
+                The decoded value of each field
+        """
+        if isinstance(pyboy, PyBoySnapshot) and pyboy.schema is self:
+            return pyboy.fields
+        return self.read(pyboy.memory)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class SnapshotStore:
+    """
+    A store of game states with a bounded size for tree search.
+
+    The states are saved with env.snapshot() and loaded with env.restore(). If the
+    store is full, the least recently used state is evicted and its buffer is reused
+    for the next saved state, so no new buffers are allocated.
+
+    Args:
+        env (Any):
+            The environment, i.e. a PyBoyEnv
+
+        max_size (int):
+            The maximum number of stored states
+    """
+
+    def __init__(self, env: Any, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be greater than 0, got {max_size}.")
+
+        self.env = env
+        self.max_size = max_size
+        self._buffers = OrderedDict()
+
+    def save(self, key: Hashable):
+        """
+        Saves the current state of the environment under the given key.
+
+        Args:
+            key (Hashable):
+                The key of the state, e.g. the node of a search tree
+        """
+        if key in self._buffers:
+            buffer = self._buffers.pop(key)
+        elif len(self._buffers) >= self.max_size:
+            _, buffer = self._buffers.popitem(last=False)
+        else:
+            buffer = None
+        self._buffers[key] = self.env.snapshot(buffer)
+
+    def restore(self, key: Hashable):
+        """
+        Loads the state with the given key into the environment.
+
+        Args:
+            key (Hashable):
+                The key of the state
+        """
+        buffer = self._buffers[key]
+        self._buffers.move_to_end(key)
+        self.env.restore(buffer)
+
+    def discard(self, key: Hashable):
+        """
+        Removes the state with the given key (if it exists).
+
+        Args:
+            key (Hashable):
+                The key of the state
+        """
+        self._buffers.pop(key, None)
+
+    def clear(self):
+        """Removes all states."""
+        self._buffers.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._buffers
+
+    def __len__(self) -> int:
+        return len(self._buffers)
@@ -0,0 +1,79 @@
+from typing import Any
+
+import numpy as np
+
+# Addresses of the LCD control register, the object attribute memory (OAM) and the
+# cartridge header byte with the game boy color flag
+LCDC_ADDRESS = 0xFF40
+OAM_ADDRESS = 0xFE00
+CGB_FLAG_ADDRESS = 0x0143
+
+# Start addresses of the low and high background tilemap
+LOW_TILEMAP_ADDRESS = 0x9800
+HIGH_TILEMAP_ADDRESS = 0x9C00
+
+# Number of tiles in each VRAM bank
+N_TILES = 384
+
+
+def _read(memory: Any, start: int, end: int) -> np.ndarray:
+    """Returns the [start, end) addresses of the memory as an uint8 array."""
+    return np.frombuffer(bytearray(memory[start:end]), dtype=np.uint8)
+
+
+def tilemap_game_area(pyboy: Any, width: int = 20, height: int = 18) -> np.ndarray:
+    """
+    Returns the tile identifiers of the background and sprites on the screen.
+
+    The whole background tilemap and OAM are read at once and the per-scanline
+    scroll offsets (SCX, SCY) are applied with numpy indexing, so the result is
+    identical to reading each tile with pyboy.tilemap_background.tile_identifier()
+    and each sprite with pyboy.get_sprite().
+
+    Args:
+        pyboy (Any):
+            The game boy instance or a PyBoySnapshot of it
+
+        width (int):
+            The number of tile columns of the game area
+
+        height (int):
+            The number of tile rows of the game area
+
+    Returns:
+        np.ndarray:
+            The (height, width) tile identifiers of the game area
+    """
+    memory = pyboy.memory
+
+    # Get the tile matrix
+    lcdc = memory[LCDC_ADDRESS]
+    start = HIGH_TILEMAP_ADDRESS if lcdc & 0b1000 else LOW_TILEMAP_ADDRESS
+    tilemap = _read(memory, start, start + 0x400).astype(np.uint32)
+    if not lcdc & 0b10000:
+        # Signed tile indices refer to the tiles 128-383
+        tilemap = (tilemap ^ 0x80) + 128
+
+    positions = np.array(pyboy.screen.tilemap_position_list[: 8 * height : 8])
+    scx, scy = positions[:, 0:1] // 8, positions[:, 1:2] // 8
+    rows = (np.arange(height)[:, None] + scy) % 32
+    columns = (np.arange(width) + scx) % 32
+    area = tilemap.take(32 * rows + columns)
+
+    # Get the sprites
+    oam = _read(memory, OAM_ADDRESS, OAM_ADDRESS + 160).reshape(40, 4).astype(np.int64)
+    ys = (oam[:, 0] - 16) // 8
+    xs = (oam[:, 1] - 8) // 8
+    tiles = oam[:, 2]
+    if memory[CGB_FLAG_ADDRESS] & 0x80:
+        # Tiles of the second VRAM bank
+        tiles = tiles + N_TILES * ((oam[:, 3] >> 3) & 1)
+
+    # Add the sprites to the tile matrix, where later sprites overwrite earlier ones
+    visible = (0 <= ys) & (ys < height) & (0 <= xs) & (xs < width)
+    owners = np.full(height * width, -1)
+    np.maximum.at(owners, (ys * width + xs)[visible], np.flatnonzero(visible))
+    cells = np.flatnonzero(owners >= 0)
+    area.flat[cells] = tiles[owners[cells]]
+
+    return area
@@ -0,0 +1,17 @@
+"""Imports of vectorized environments."""
+
+from .double_buffer import DoubleBufferVectorEnv
+from .fork_server import ForkServerVectorEnv
+from .multi_game import MultiGameVectorEnv
+from .shared_memory import SharedMemoryVectorEnv
+from .work_stealing import WorkStealingVectorEnv
+
+__all__ = [
+    "DoubleBufferVectorEnv",
+    "ForkServerVectorEnv",
+    "MultiGameVectorEnv",
+    "SharedMemoryVectorEnv",
+    "WorkStealingVectorEnv",
+]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
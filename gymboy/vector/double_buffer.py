@@ -0,0 +1,236 @@
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.core import ActType, ObsType
+from gymnasium.vector.utils import batch_space
+
+from .shared_memory import SharedMemoryVectorEnv
+
+
+class DoubleBufferVectorEnv(SharedMemoryVectorEnv):
+    """
+    Vectorized environment that steps groups of environments asynchronously.
+
+    The environments are split into num_groups groups, each with its own worker
+    process. send() dispatches the actions of a group without waiting for the step
+    and recv() returns the results of the group that finished first (like the async
+    batches of EnvPool). While the policy computes the actions of one group, the
+    other groups are emulated:
+
+        envs.async_reset(seed=0)
+        while True:
+            observations, rewards, terminated, truncated, infos = envs.recv()
+            envs.send(policy(observations), infos["env_id"])
+
+    The results of recv() only contain the environments of the group, whose
+    indices are stored under "env_id" of the infos. step() and reset() still step
+    all environments in lockstep, but only if no group is running.
+
+    Args:
+        env_fns (Sequence[Callable[[], gym.Env]]):
+            The functions that create the environments
+
+        num_groups (int):
+            The number of groups (and worker processes).
+            Must be at least 2.
+
+        copy (bool):
+            The flag to return a copy of the observations.
+            If False, the observations are a view of the shared memory, which is
+            overwritten by the next step of the group.
+
+        context (str | None):
+            The start method of the worker processes, e.g. "fork" or "spawn".
+            If None, the default start method is used.
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        num_groups: int = 2,
+        copy: bool = True,
+        context: str | None = None,
+    ):
+        if num_groups < 2:
+            raise ValueError(f"num_groups must be at least 2, got {num_groups}.")
+        if num_groups > len(env_fns):
+            raise ValueError(
+                f"num_groups must be at most the number of environments, got "
+                f"{num_groups} > {len(env_fns)}."
+            )
+
+        super().__init__(env_fns, num_workers=num_groups, copy=copy, context=context)
+        self.num_groups = self.num_workers
+
+        # The group of each environment and the running command of each group
+        self._groups = np.empty(self.num_envs, dtype=np.int64)
+        for group, env_ids in enumerate(self.env_ids):
+            self._groups[env_ids] = group
+        self._running: List[str | None] = [None for _ in range(self.num_groups)]
+
+        # The dispatch number of each group, so that recv() returns the finished
+        # group that was dispatched first and no group starves
+        self._dispatches = 0
+        self._dispatched = np.zeros(self.num_groups, dtype=np.int64)
+
+        # The action space of each group, so that send() does not build it per call
+        self._group_action_spaces = [
+            batch_space(self.single_action_space, len(env_ids))
+            for env_ids in self.env_ids
+        ]
+
+    def async_reset(
+        self,
+        *,
+        seed: int | List[int | None] | None = None,
+        options: Dict[str, Any] | None = None,
+    ):
+        """
+        Resets all environments without waiting, where the initial observations of
+        each group are returned by recv().
+
+        Args:
+            seed (int | List[int | None] | None):
+                The seed of the first environment or of each environment
+
+            options (Dict[str, Any] | None):
+                The options of the resets
+        """
+        seed = self._seeds(seed)
+        self._check_idle(range(self.num_groups))
+        for group, (pipe, env_ids) in enumerate(zip(self.parent_pipes, self.env_ids)):
+            pipe.send(("reset", ([seed[env_id] for env_id in env_ids], options)))
+            self._dispatch(group, "reset")
+
+    def send(self, actions: ActType, env_ids: Sequence[int] | None = None):
+        """
+        Dispatches the actions of one or more groups without waiting for the step.
+
+        Args:
+            actions (ActType):
+                The actions of the environments of env_ids
+
+            env_ids (Sequence[int] | None):
+                The indices of the environments of whole groups, e.g. "env_id" of
+                the infos of recv(). If None, the actions of all environments.
+        """
+        env_ids = np.arange(self.num_envs) if env_ids is None else np.asarray(env_ids)
+        groups = np.unique(self._groups[env_ids])
+        if not np.array_equal(
+            np.sort(env_ids), np.concatenate([self.env_ids[g] for g in groups])
+        ):
+            raise ValueError(f"{env_ids} are not the environments of whole groups.")
+        self._check_idle(groups)
+
+        # Validate the batch once, so that the environments trust their actions
+        actions = np.asarray(actions)
+        if actions.shape[:1] != (len(env_ids),):
+            raise ValueError(f"Expected {len(env_ids)} actions, got {actions.shape}.")
+        for group in groups:
+            group_actions = (
+                actions if len(groups) == 1 else actions[self._groups[env_ids] == group]
+            )
+            if not self._group_action_spaces[group].contains(group_actions):
+                raise ValueError(f"{actions} ({actions.dtype}) invalid.")
+
+        self._actions[env_ids] = actions
+        for group in groups:
+            self.parent_pipes[group].send(("step", None))
+            self._dispatch(group, "step")
+
+    def recv(
+        self,
+    ) -> Tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        """
+        Waits for the group that finishes first, where of several finished groups
+        the one that was dispatched first is returned.
+
+        Returns:
+            Tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+                The observations, rewards, terminated and truncated flags and the
+                infos of the environments of the group, where "env_id" of the infos
+                are the indices of the environments
+        """
+        running = [group for group in range(self.num_groups) if self._running[group]]
+        if not running:
+            raise ValueError("No group is running, call send() or async_reset().")
+
+        ready = wait([self.parent_pipes[group] for group in running])
+        group = min(
+            (g for g in running if self.parent_pipes[g] in ready),
+            key=lambda g: self._dispatched[g],
+        )
+        result, success = self.parent_pipes[group].recv()
+        command, self._running[group] = self._running[group], None
+        if not success:
+            raise RuntimeError(f"Worker {group} failed:\n{result}")
+
+        env_ids = self.env_ids[group]
+        envs = slice(env_ids[0], env_ids[-1] + 1)
+        if command == "reset":
+            self._rewards[envs] = 0.0
+            self._terminations[envs] = False
+            self._truncations[envs] = False
+
+        infos = {}
+        for env_id, info in result:
+            infos = self._add_info(infos, info, env_id)
+        infos = _slice_infos(infos, envs)
+        infos["env_id"] = env_ids.copy()
+
+        observations = self._observations[envs]
+        return (
+            observations.copy() if self.copy else observations,
+            self._rewards[envs].copy(),
+            self._terminations[envs].copy(),
+            self._truncations[envs].copy(),
+            infos,
+        )
+
+    def reset(
+        self,
+        *,
+        seed: int | List[int | None] | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Tuple[ObsType, Dict[str, Any]]:
+        self._check_idle(range(self.num_groups))
+        return super().reset(seed=seed, options=options)
+
+    def step(
+        self, actions: ActType
+    ) -> Tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        self._check_idle(range(self.num_groups))
+        return super().step(actions)
+
+    def close_extras(self, **kwargs: Any):
+        # Wait for the running groups before closing the workers
+        for group, pipe in enumerate(self.parent_pipes):
+            if self._running[group]:
+                try:
+                    pipe.recv()
+                except EOFError:
+                    pass
+                self._running[group] = None
+        super().close_extras(**kwargs)
+
+    def _dispatch(self, group: int, command: str):
+        """Marks the group as running the command."""
+        self._running[group] = command
+        self._dispatched[group] = self._dispatches
+        self._dispatches += 1
+
+    def _check_idle(self, groups: Sequence[int]):
+        """Raises a ValueError if one of the groups is running."""
+        for group in groups:
+            if self._running[group]:
+                raise ValueError(f"Group {group} is still running, call recv() first.")
+
+
+def _slice_infos(infos: Dict[str, Any], envs: slice) -> Dict[str, Any]:
+    """Returns the infos of the environments of the slice."""
+    return {
+        key: _slice_infos(value, envs) if isinstance(value, dict) else value[envs]
+        for key, value in infos.items()
+    }
@@ -0,0 +1,122 @@
+import multiprocessing as mp
+import os
+from multiprocessing.connection import Connection
+from typing import Any, Callable, List, Sequence, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from .shared_memory import SharedMemoryVectorEnv, _worker
+
+
+class ForkServerVectorEnv(SharedMemoryVectorEnv):
+    """
+    Vectorized environment that forks N copies of one fully initialized environment.
+
+    The environment is only created once. A fork server process inherits it and
+    forks one worker process per environment, whose copy is ready to step without
+    reading the ROM, booting PyBoy or reading the state file again. The ROM, the
+    initial state and the imported modules are shared copy-on-write between all
+    workers. Like the SharedMemoryVectorEnv, the observations, rewards, terminated
+    and truncated flags are stored in shared memory.
+
+    Requires the "fork" start method, i.e. it is not available on Windows.
+
+    Args:
+        env_fn (Callable[[], gym.Env]):
+            The function that creates the template environment
+
+        num_envs (int):
+            The number of environments
+
+        copy (bool):
+            The flag to return a copy of the observations.
+            If False, the observations are a view of the shared memory, which is
+            overwritten by the next call of step() or reset().
+    """
+
+    def __init__(
+        self,
+        env_fn: Callable[[], gym.Env],
+        num_envs: int,
+        copy: bool = True,
+    ):
+        if "fork" not in mp.get_all_start_methods():
+            raise ValueError("ForkServerVectorEnv requires the 'fork' start method.")
+
+        super().__init__(
+            [env_fn for _ in range(num_envs)],
+            num_workers=num_envs,
+            copy=copy,
+            context="fork",
+        )
+
+    def _start_workers(
+        self,
+        ctx: mp.context.BaseContext,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        dummy_env: gym.Env,
+        shared_memory: Tuple[Any, ...],
+    ):
+        """Starts the fork server, which forks a worker process per environment."""
+        self.env_ids = [np.array([env_id]) for env_id in range(self.num_envs)]
+        pipes = [ctx.Pipe() for _ in range(self.num_envs)]
+        self.parent_pipes = [parent_pipe for parent_pipe, _ in pipes]
+        server = ctx.Process(
+            target=_fork_server,
+            name="gymboy-fork-server",
+            args=(
+                dummy_env,
+                pipes,
+                self.single_observation_space,
+                self.single_action_space,
+                self.num_envs,
+                shared_memory,
+            ),
+            daemon=True,
+        )
+        self.processes = [server]
+        server.start()
+        for _, child_pipe in pipes:
+            child_pipe.close()
+
+
+def _fork_server(
+    template_env: gym.Env,
+    pipes: List[Tuple[Connection, Connection]],
+    observation_space: spaces.Space,
+    action_space: spaces.Space,
+    num_envs: int,
+    shared_memory: Tuple[Any, ...],
+):
+    """Forks a worker process with a copy of the template environment per pipe."""
+    for parent_pipe, _ in pipes:
+        parent_pipe.close()
+
+    pids = []
+    for env_id, (parent_pipe, child_pipe) in enumerate(pipes):
+        pid = os.fork()
+        if pid == 0:
+            # Only keep the pipe of this worker open
+            for _, other_pipe in pipes[env_id + 1 :]:
+                other_pipe.close()
+            try:
+                _worker(
+                    [lambda: template_env],
+                    [env_id],
+                    child_pipe,
+                    parent_pipe,
+                    observation_space,
+                    action_space,
+                    num_envs,
+                    shared_memory,
+                )
+            finally:
+                os._exit(0)
+        child_pipe.close()
+        pids.append(pid)
+
+    # Wait until all workers are closed
+    for pid in pids:
+        os.waitpid(pid, 0)
@@ -0,0 +1,167 @@
+from typing import Any, List, Sequence, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from gymboy.registration import make
+from gymboy.utils import make_fake_pyboy
+
+from .work_stealing import WorkStealingVectorEnv
+
+
+class MultiGameVectorEnv(WorkStealingVectorEnv):
+    """
+    Vectorized environment that runs groups of different games in one worker pool.
+
+    Each group (env_id, rom_path, init_state_path, count) adds count environments,
+    where the environments of a group have contiguous indices. The observations of
+    all games are zero-padded at the end of each axis to a common shape, e.g. the
+    *Flatten observations of Tetris (182,) and Pokemon (426,) to (426,). split()
+    returns the observations of each group without padding. The action space holds
+    the number of actions of each environment.
+
+    Like the WorkStealingVectorEnv, the workers steal environments of slow games
+    from each other, so one pool serves all games at full utilization.
+
+    Args:
+        groups (Sequence[Tuple[str, str, str | None, int]]):
+            The ID of the environment, the path to the ROM file, the path to the
+            initial state file and the number of environments of each group
+
+        num_workers (int | None):
+            The number of worker processes.
+            If None, the number of CPU cores is used.
+
+        copy (bool):
+            The flag to return a copy of the observations.
+            If False, the observations are a view of the shared memory, which is
+            overwritten by the next call of step() or reset().
+
+        context (str | None):
+            The start method of the worker processes, e.g. "fork" or "spawn".
+            If None, the default start method is used.
+
+        rebalance_interval (int):
+            The number of steps between two rebalances
+
+        tolerance (float):
+            The difference between the highest and lowest load of the workers
+            (relative to the mean load) up to which no environment is migrated
+
+        **env_kwargs:
+            Keyword arguments to pass to all environments
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[Tuple[str, str, str | None, int]],
+        num_workers: int | None = None,
+        copy: bool = True,
+        context: str | None = None,
+        rebalance_interval: int = 100,
+        tolerance: float = 0.25,
+        **env_kwargs,
+    ):
+        if len(groups) == 0:
+            raise ValueError("Number of groups must be greater than 0.")
+        for env_id, _, _, count in groups:
+            if count <= 0:
+                raise ValueError(f"Count of {env_id} must be greater than 0.")
+
+        # The spaces of each group determine the common observation space, where
+        # a FakePyBoy gives the spaces without booting the emulator
+        self.groups = [tuple(group) for group in groups]
+        self.group_observation_spaces, self.group_action_spaces = [], []
+        for env_id, rom_path, _, _ in self.groups:
+            pyboy = make_fake_pyboy(env_id)
+            env = make(env_id, rom_path, pyboy=pyboy, **env_kwargs)
+            self.group_observation_spaces.append(env.observation_space)
+            self.group_action_spaces.append(env.action_space)
+            env.close()
+        self._check_spaces()
+
+        # The group of each environment
+        self.group_ids = np.repeat(
+            np.arange(len(self.groups)), [count for *_, count in self.groups]
+        )
+
+        def create_env(group: int):
+            env_id, rom_path, init_state_path, _ = self.groups[group]
+
+            def _make_env():
+                return make(env_id, rom_path, init_state_path, **env_kwargs)
+
+            return _make_env
+
+        super().__init__(
+            [create_env(group) for group in self.group_ids],
+            num_workers=num_workers,
+            copy=copy,
+            context=context,
+            rebalance_interval=rebalance_interval,
+            tolerance=tolerance,
+        )
+        self.action_space = spaces.MultiDiscrete(
+            [self.group_action_spaces[group].n for group in self.group_ids]
+        )
+
+    def split(self, observations: np.ndarray) -> List[np.ndarray]:
+        """
+        Splits the padded observations into the observations of each group.
+
+        Args:
+            observations (np.ndarray):
+                The observations of all environments, e.g. returned by step()
+
+        Returns:
+            List[np.ndarray]:
+                The observations (a view without padding) of each group
+        """
+        result, start = [], 0
+        for (*_, count), space in zip(self.groups, self.group_observation_spaces):
+            index = tuple(slice(0, size) for size in space.shape)
+            result.append(observations[(slice(start, start + count), *index)])
+            start += count
+        return result
+
+    def _check_spaces(self):
+        """Raises a ValueError if the spaces of the groups cannot be combined."""
+        observation_space = self.group_observation_spaces[0]
+        for space in self.group_observation_spaces:
+            if not isinstance(space, spaces.Box):
+                raise ValueError(f"Observation space {space} is not a Box space.")
+            if space.dtype != observation_space.dtype:
+                raise ValueError(
+                    f"Observation spaces with different dtypes, got {space.dtype} "
+                    f"and {observation_space.dtype}."
+                )
+            if len(space.shape) != len(observation_space.shape):
+                raise ValueError(
+                    f"Observation spaces with different dimensions, got "
+                    f"{space.shape} and {observation_space.shape}."
+                )
+        for space in self.group_action_spaces:
+            if not isinstance(space, spaces.Discrete) or space.start != 0:
+                raise ValueError(f"Action space {space} is not a Discrete space.")
+
+    def _single_spaces(self, dummy_env: gym.Env) -> Tuple[spaces.Space, spaces.Space]:
+        # The common shape holds the observations of all groups
+        shape = np.max([space.shape for space in self.group_observation_spaces], 0)
+        dtype = self.group_observation_spaces[0].dtype
+        low = np.zeros(shape, dtype=dtype)
+        high = np.zeros(shape, dtype=dtype)
+        for space in self.group_observation_spaces:
+            index = tuple(slice(0, size) for size in space.shape)
+            low[index] = np.minimum(low[index], space.low)
+            high[index] = np.maximum(high[index], space.high)
+        observation_space = spaces.Box(low=low, high=high, dtype=dtype)
+
+        n = max(space.n for space in self.group_action_spaces)
+        return observation_space, spaces.Discrete(n=int(n))
+
+    def _observation_indices(self) -> List[Any]:
+        return [
+            tuple(slice(0, size) for size in self.group_observation_spaces[group].shape)
+            for group in self.group_ids
+        ]
@@ -0,0 +1,495 @@
+import multiprocessing as mp
+import os
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from gymnasium.core import ActType, ObsType
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import (
+    CloudpickleWrapper,
+    batch_space,
+    create_shared_memory,
+    read_from_shared_memory,
+)
+
+from gymboy.utils import merge_perf_stats
+
+
+class SharedMemoryVectorEnv(VectorEnv):
+    """
+    Vectorized environment that runs N environments in K worker processes.
+
+    Each worker process owns a contiguous chunk of the environments. The actions,
+    observations, rewards, terminated and truncated flags of all environments are
+    stored in preallocated shared memory, so only short commands and non-empty
+    infos are sent over the pipes. Finished environments are reset on the next
+    step (autoreset mode "NextStep"). The actions are validated once per batch, so
+    the PyBoy environments skip their own validation (see PyBoyEnv.trust_actions).
+
+    Args:
+        env_fns (Sequence[Callable[[], gym.Env]]):
+            The functions that create the environments
+
+        num_workers (int | None):
+            The number of worker processes.
+            If None, the number of CPU cores is used.
+
+        copy (bool):
+            The flag to return a copy of the observations.
+            If False, the observations are a view of the shared memory, which is
+            overwritten by the next call of step() or reset().
+
+        context (str | None):
+            The start method of the worker processes, e.g. "fork" or "spawn".
+            If None, the default start method is used.
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        num_workers: int | None = None,
+        copy: bool = True,
+        context: str | None = None,
+    ):
+        if len(env_fns) == 0:
+            raise ValueError("Number of environments must be greater than 0.")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if num_workers <= 0:
+            raise ValueError(f"num_workers must be greater than 0, got {num_workers}.")
+
+        self.num_envs = len(env_fns)
+        self.num_workers = min(num_workers, self.num_envs)
+        self.copy = copy
+
+        # Get the spaces from a dummy environment
+        dummy_env = env_fns[0]()
+        self.metadata = dict(dummy_env.metadata)
+        self.metadata["autoreset_mode"] = AutoresetMode.NEXT_STEP
+        self.render_mode = dummy_env.render_mode
+        self.single_observation_space, self.single_action_space = self._single_spaces(
+            dummy_env
+        )
+
+        self.observation_space = batch_space(
+            self.single_observation_space, self.num_envs
+        )
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+
+        # Allocate the shared memory
+        ctx = mp.get_context(context)
+        shared_memory = (
+            create_shared_memory(self.single_observation_space, self.num_envs, ctx),
+            create_shared_memory(self.single_action_space, self.num_envs, ctx),
+            ctx.RawArray("d", self.num_envs),
+            ctx.RawArray("b", self.num_envs),
+            ctx.RawArray("b", self.num_envs),
+        )
+        (
+            self._observations,
+            self._actions,
+            self._rewards,
+            self._terminations,
+            self._truncations,
+        ) = _shared_memory_views(
+            self.single_observation_space,
+            self.single_action_space,
+            self.num_envs,
+            shared_memory,
+        )
+
+        # Start the worker processes
+        self.closed = False
+        self._start_workers(ctx, env_fns, dummy_env, shared_memory)
+        dummy_env.close()
+        del dummy_env
+
+        # Wait until all environments are created
+        self._receive()
+
+    def _single_spaces(self, dummy_env: gym.Env) -> Tuple[spaces.Space, spaces.Space]:
+        """
+        Returns the observation and action space of a single environment.
+
+        Args:
+            dummy_env (gym.Env):
+                The environment that was created for the spaces
+
+        Returns:
+            Tuple[spaces.Space, spaces.Space]:
+                The observation and action space
+        """
+        return dummy_env.observation_space, dummy_env.action_space
+
+    def _start_workers(
+        self,
+        ctx: mp.context.BaseContext,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        dummy_env: gym.Env,
+        shared_memory: Tuple[Any, ...],
+    ):
+        """
+        Starts the worker processes, each with a contiguous chunk of environments.
+
+        Args:
+            ctx (mp.context.BaseContext):
+                The context of the worker processes
+
+            env_fns (Sequence[Callable[[], gym.Env]]):
+                The functions that create the environments
+
+            dummy_env (gym.Env):
+                The environment that was created for the spaces
+
+            shared_memory (Tuple[Any, ...]):
+                The shared memory of the observations, actions, rewards, terminated
+                and truncated flags
+        """
+        self.env_ids = np.array_split(np.arange(self.num_envs), self.num_workers)
+        self.parent_pipes, self.processes = [], []
+        for worker_id, env_ids in enumerate(self.env_ids):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                name=f"gymboy-worker-{worker_id}",
+                args=(
+                    [CloudpickleWrapper(env_fns[env_id]) for env_id in env_ids],
+                    env_ids.tolist(),
+                    child_pipe,
+                    parent_pipe,
+                    self.single_observation_space,
+                    self.single_action_space,
+                    self.num_envs,
+                    shared_memory,
+                ),
+                daemon=True,
+            )
+            self.parent_pipes.append(parent_pipe)
+            self.processes.append(process)
+            process.start()
+            child_pipe.close()
+
+    def reset(
+        self,
+        *,
+        seed: int | List[int | None] | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Tuple[ObsType, Dict[str, Any]]:
+        seed = self._seeds(seed)
+        for pipe, env_ids in zip(self.parent_pipes, self.env_ids):
+            pipe.send(("reset", ([seed[env_id] for env_id in env_ids], options)))
+        infos = self._merge_infos(self._receive())
+
+        return self._observation(), infos
+
+    def step(
+        self, actions: ActType
+    ) -> Tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        # Validate the batch once, so that the environments trust their actions
+        actions = np.asarray(actions)
+        if not self.action_space.contains(actions):
+            raise ValueError(f"{actions} ({actions.dtype}) invalid.")
+
+        self._actions[:] = actions
+        for pipe in self.parent_pipes:
+            pipe.send(("step", None))
+        infos = self._merge_infos(self._receive())
+
+        return (
+            self._observation(),
+            self._rewards.copy(),
+            self._terminations.copy(),
+            self._truncations.copy(),
+            infos,
+        )
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        """
+        Calls a method (or gets an attribute) of each environment.
+
+        Args:
+            name (str):
+                The name of the method or attribute
+
+            *args:
+                The positional arguments of the method
+
+            **kwargs:
+                The keyword arguments of the method
+
+        Returns:
+            Tuple[Any, ...]:
+                The result of each environment
+        """
+        for pipe in self.parent_pipes:
+            pipe.send(("call", (name, args, kwargs)))
+        return tuple(result for results in self._receive() for result in results)
+
+    def get_attr(self, name: str) -> Tuple[Any, ...]:
+        """
+        Gets an attribute of each environment.
+
+        Args:
+            name (str):
+                The name of the attribute
+
+        Returns:
+            Tuple[Any, ...]:
+                The attribute of each environment
+        """
+        return self.call(name)
+
+    def set_attr(self, name: str, values: List[Any] | Tuple[Any, ...] | Any):
+        """
+        Sets an attribute of each environment.
+
+        Args:
+            name (str):
+                The name of the attribute
+
+            values (List[Any] | Tuple[Any, ...] | Any):
+                The value for each environment or one value for all environments
+        """
+        if not isinstance(values, (list, tuple)):
+            values = [values for _ in range(self.num_envs)]
+        if len(values) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} values, got {len(values)} values instead."
+            )
+        for pipe, env_ids in zip(self.parent_pipes, self.env_ids):
+            pipe.send(("set_attr", (name, [values[env_id] for env_id in env_ids])))
+        self._receive()
+
+    def perf_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the recorded time of each phase summed up over all environments.
+
+        Returns:
+            Dict[str, Dict[str, Any]]:
+                The merged stats of each phase (see PyBoyEnv.perf_stats())
+        """
+        return merge_perf_stats(self.call("perf_stats"))
+
+    def close_extras(self, **kwargs: Any):
+        for pipe in self.parent_pipes:
+            try:
+                pipe.send(("close", None))
+                pipe.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for pipe in self.parent_pipes:
+            pipe.close()
+
+    def _seeds(self, seed: int | List[int | None] | None) -> List[int | None]:
+        """Returns the seed of each environment."""
+        if seed is None:
+            seed = [None for _ in range(self.num_envs)]
+        elif isinstance(seed, int):
+            seed = [seed + i for i in range(self.num_envs)]
+        if len(seed) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} seeds, got {len(seed)} seeds instead."
+            )
+        return seed
+
+    def _observation(self) -> ObsType:
+        """Returns the observations of all environments."""
+        if self.copy:
+            return self._observations.copy()
+        return self._observations
+
+    def _receive(self) -> List[Any]:
+        """Returns the results of all worker processes."""
+        results, errors = [], []
+        for worker_id, pipe in enumerate(self.parent_pipes):
+            result, success = pipe.recv()
+            if success:
+                results.append(result)
+            else:
+                errors.append(f"Worker {worker_id} failed:\n{result}")
+        if errors:
+            raise RuntimeError("\n".join(errors))
+        return results
+
+    def _merge_infos(
+        self, results: List[List[Tuple[int, Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """Merges the non-empty infos of all worker processes."""
+        infos = {}
+        for env_infos in results:
+            for env_id, info in env_infos:
+                infos = self._add_info(infos, info, env_id)
+        return infos
+
+
+def _shared_memory_views(
+    observation_space: spaces.Space,
+    action_space: spaces.Space,
+    num_envs: int,
+    shared_memory: Tuple[Any, ...],
+) -> Tuple[np.ndarray, ...]:
+    """Returns numpy views of the shared memory."""
+    observations, actions, rewards, terminations, truncations = shared_memory
+    return (
+        read_from_shared_memory(observation_space, observations, num_envs),
+        read_from_shared_memory(action_space, actions, num_envs),
+        np.frombuffer(rewards, dtype=np.float64),
+        np.frombuffer(terminations, dtype=np.bool_),
+        np.frombuffer(truncations, dtype=np.bool_),
+    )
+
+
+def _worker(
+    env_fns: List[CloudpickleWrapper],
+    env_ids: List[int],
+    pipe: Connection,
+    parent_pipe: Connection,
+    observation_space: spaces.Space,
+    action_space: spaces.Space,
+    num_envs: int,
+    shared_memory: Tuple[Any, ...],
+):
+    """Runs the environments of one worker process."""
+    parent_pipe.close()
+    views = _shared_memory_views(
+        observation_space, action_space, num_envs, shared_memory
+    )
+
+    # The environments and autoreset flags by index, iterated in ascending order
+    envs: Dict[int, gym.Env] = {}
+    try:
+        for env_id, env_fn in zip(env_ids, env_fns):
+            envs[env_id] = _create_env(env_fn)
+        autoreset = {env_id: False for env_id in envs}
+        pipe.send((None, True))
+
+        _serve(
+            pipe,
+            {
+                "step": lambda _: _step(envs, autoreset, views),
+                "reset": lambda data: _reset(envs, autoreset, views, *data),
+                "call": lambda data: _call(envs, *data),
+                "set_attr": lambda data: _set_attr(envs, *data),
+            },
+        )
+    except Exception:
+        pipe.send((traceback.format_exc(), False))
+    finally:
+        for env in envs.values():
+            env.close()
+        pipe.close()
+
+
+def _create_env(env_fn: Callable[[], gym.Env]) -> gym.Env:
+    """Creates an environment that trusts the actions validated by the main process."""
+    env = env_fn()
+    if hasattr(env.unwrapped, "trust_actions"):
+        env.unwrapped.trust_actions = True
+    return env
+
+
+def _serve(pipe: Connection, handlers: Dict[str, Callable[[Any], Any]]):
+    """Answers the commands of the main process until it sends "close"."""
+    while True:
+        command, data = pipe.recv()
+        if command == "close":
+            pipe.send((None, True))
+            break
+        try:
+            if command not in handlers:
+                raise ValueError(f"Invalid command '{command}'.")
+            pipe.send((handlers[command](data), True))
+        except Exception:
+            pipe.send((traceback.format_exc(), False))
+
+
+def _step(
+    envs: Dict[int, gym.Env],
+    autoreset: Dict[int, bool],
+    views: Tuple[np.ndarray, ...],
+    observation_indices: List[Any] | None = None,
+    costs: List[float] | None = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Steps the environments and writes their results to the shared memory.
+
+    If costs is given, the step time of each environment is appended to it.
+    """
+    observations, actions, rewards, terminations, truncations = views
+    infos = []
+    for env_id, env in envs.items():
+        start = time.perf_counter()
+        if autoreset[env_id]:
+            observation, info = env.reset()
+            reward, terminated, truncated = 0.0, False, False
+        else:
+            observation, reward, terminated, truncated, info = env.step(actions[env_id])
+        autoreset[env_id] = terminated or truncated
+        _write_observation(observations, env_id, observation, observation_indices)
+        rewards[env_id] = reward
+        terminations[env_id] = terminated
+        truncations[env_id] = truncated
+        if costs is not None:
+            costs.append(time.perf_counter() - start)
+        if info:
+            infos.append((env_id, info))
+    return infos
+
+
+def _reset(
+    envs: Dict[int, gym.Env],
+    autoreset: Dict[int, bool],
+    views: Tuple[np.ndarray, ...],
+    seeds: List[int | None],
+    options: Dict[str, Any] | None,
+    observation_indices: List[Any] | None = None,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Resets the environments and writes their observations to the shared memory."""
+    observations = views[0]
+    infos = []
+    for (env_id, env), seed in zip(envs.items(), seeds):
+        observation, info = env.reset(seed=seed, options=options)
+        autoreset[env_id] = False
+        _write_observation(observations, env_id, observation, observation_indices)
+        if info:
+            infos.append((env_id, info))
+    return infos
+
+
+def _write_observation(
+    observations: np.ndarray,
+    env_id: int,
+    observation: ObsType,
+    observation_indices: List[Any] | None,
+):
+    """Writes the observation to its index in the shared memory, if given."""
+    if observation_indices is None:
+        observations[env_id] = observation
+    else:
+        observations[env_id][observation_indices[env_id]] = observation
+
+
+def _call(
+    envs: Dict[int, gym.Env], name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> List[Any]:
+    """Returns the attribute or the result of the method of each environment."""
+    results = []
+    for env in envs.values():
+        attr = env.get_wrapper_attr(name)
+        results.append(attr(*args, **kwargs) if callable(attr) else attr)
+    return results
+
+
+def _set_attr(envs: Dict[int, gym.Env], name: str, values: List[Any]):
+    """Sets the attribute of each environment."""
+    for env, value in zip(envs.values(), values):
+        env.set_wrapper_attr(name, value)
@@ -0,0 +1,348 @@
+import io
+import multiprocessing as mp
+import time
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from gymnasium.core import ActType, ObsType
+from gymnasium.vector.utils import CloudpickleWrapper
+
+from .shared_memory import (
+    SharedMemoryVectorEnv,
+    _call,
+    _create_env,
+    _reset,
+    _serve,
+    _set_attr,
+    _shared_memory_views,
+    _step,
+)
+
+
+class WorkStealingVectorEnv(SharedMemoryVectorEnv):
+    """
+    Vectorized environment that balances uneven step durations over K workers.
+
+    Like the SharedMemoryVectorEnv, each environment is owned by one worker process
+    (affinity), so its emulator never leaves the process between steps. The workers
+    measure the step time of each of their environments. Every rebalance_interval
+    steps, the least loaded worker steals one environment from the most loaded
+    worker if their loads differ by more than tolerance times the mean load. The
+    stolen environment is migrated with a snapshot of its emulator state (see
+    PyBoyEnv.snapshot()) and all its other attributes, so a straggler, e.g. a
+    worker with several slow Pokemon environments, does not leave the other cores
+    idle. Environments without snapshot(), e.g. wrapped environments, are never
+    migrated.
+
+    utilization() returns the fraction of the step time each worker was busy.
+
+    Args:
+        env_fns (Sequence[Callable[[], gym.Env]]):
+            The functions that create the environments
+
+        num_workers (int | None):
+            The number of worker processes.
+            If None, the number of CPU cores is used.
+
+        copy (bool):
+            The flag to return a copy of the observations.
+            If False, the observations are a view of the shared memory, which is
+            overwritten by the next call of step() or reset().
+
+        context (str | None):
+            The start method of the worker processes, e.g. "fork" or "spawn".
+            If None, the default start method is used.
+
+        rebalance_interval (int):
+            The number of steps between two rebalances
+
+        tolerance (float):
+            The difference between the highest and lowest load of the workers
+            (relative to the mean load) up to which no environment is migrated
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        num_workers: int | None = None,
+        copy: bool = True,
+        context: str | None = None,
+        rebalance_interval: int = 100,
+        tolerance: float = 0.25,
+    ):
+        if rebalance_interval <= 0:
+            raise ValueError(
+                f"rebalance_interval must be greater than 0, got {rebalance_interval}."
+            )
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be non-negative, got {tolerance}.")
+
+        super().__init__(env_fns, num_workers=num_workers, copy=copy, context=context)
+        self.rebalance_interval = rebalance_interval
+        self.tolerance = tolerance
+        self.migrations = 0
+
+        # The smoothed step time of each environment and the busy and elapsed time
+        # of each worker over all steps
+        self._costs = np.zeros(self.num_envs, dtype=np.float64)
+        self._busy_time = np.zeros(self.num_workers, dtype=np.float64)
+        self._elapsed_time = 0.0
+        self._steps = 0
+        self._pinned: Set[int] = set()
+
+    def _start_workers(
+        self,
+        ctx: mp.context.BaseContext,
+        env_fns: Sequence[Callable[[], gym.Env]],
+        dummy_env: gym.Env,
+        shared_memory: Tuple[Any, ...],
+    ):
+        """Starts the worker processes, each able to create every environment."""
+        self.env_ids = np.array_split(np.arange(self.num_envs), self.num_workers)
+        env_fns = [CloudpickleWrapper(env_fn) for env_fn in env_fns]
+        self.parent_pipes, self.processes = [], []
+        for worker_id, env_ids in enumerate(self.env_ids):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                name=f"gymboy-worker-{worker_id}",
+                args=(
+                    env_fns,
+                    env_ids.tolist(),
+                    child_pipe,
+                    parent_pipe,
+                    self.single_observation_space,
+                    self.single_action_space,
+                    self.num_envs,
+                    shared_memory,
+                    self._observation_indices(),
+                ),
+                daemon=True,
+            )
+            self.parent_pipes.append(parent_pipe)
+            self.processes.append(process)
+            process.start()
+            child_pipe.close()
+
+    def _observation_indices(self) -> List[Any]:
+        """Returns the index of the observation in the shared memory of each env."""
+        return [Ellipsis for _ in range(self.num_envs)]
+
+    def step(
+        self, actions: ActType
+    ) -> Tuple[ObsType, np.ndarray, np.ndarray, np.ndarray, Dict[str, Any]]:
+        # Validate the batch once, so that the environments trust their actions
+        actions = np.asarray(actions)
+        if not self.action_space.contains(actions):
+            raise ValueError(f"{actions} ({actions.dtype}) invalid.")
+
+        start = time.perf_counter()
+        self._actions[:] = actions
+        for pipe in self.parent_pipes:
+            pipe.send(("step", None))
+        results = self._receive()
+        self._elapsed_time += time.perf_counter() - start
+
+        # Exponential moving average, so that single spikes (resets) are smoothed
+        for worker_id, (env_ids, (_, costs)) in enumerate(zip(self.env_ids, results)):
+            self._costs[env_ids] += 0.1 * (np.asarray(costs) - self._costs[env_ids])
+            self._busy_time[worker_id] += sum(costs)
+        infos = self._merge_infos([infos for infos, _ in results])
+
+        self._steps += 1
+        if self._steps % self.rebalance_interval == 0:
+            self._rebalance()
+
+        return (
+            self._observation(),
+            self._rewards.copy(),
+            self._terminations.copy(),
+            self._truncations.copy(),
+            infos,
+        )
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Tuple[Any, ...]:
+        for pipe in self.parent_pipes:
+            pipe.send(("call", (name, args, kwargs)))
+
+        # The workers do not own contiguous chunks after a migration
+        results = [None for _ in range(self.num_envs)]
+        for env_ids, worker_results in zip(self.env_ids, self._receive()):
+            for env_id, result in zip(env_ids, worker_results):
+                results[env_id] = result
+        return tuple(results)
+
+    def utilization(self) -> np.ndarray:
+        """
+        Returns the fraction of the time of all steps each worker was stepping its
+        environments.
+
+        Returns:
+            np.ndarray:
+                The utilization in [0, 1] of each worker
+        """
+        if self._elapsed_time == 0.0:
+            return np.zeros(self.num_workers, dtype=np.float64)
+        return np.clip(self._busy_time / self._elapsed_time, 0.0, 1.0)
+
+    def worker_loads(self) -> np.ndarray:
+        """
+        Returns the smoothed time per step of the environments of each worker.
+
+        Returns:
+            np.ndarray:
+                The load in seconds of each worker
+        """
+        return np.array([self._costs[env_ids].sum() for env_ids in self.env_ids])
+
+    def _rebalance(self):
+        """Migrates one environment from the most to the least loaded worker."""
+        loads = self.worker_loads()
+        source, target = int(np.argmax(loads)), int(np.argmin(loads))
+        gap = loads[source] - loads[target]
+        if gap <= self.tolerance * loads.mean() or len(self.env_ids[source]) <= 1:
+            return
+
+        # Only migrate environments that reduce the load of the most loaded worker
+        candidates = [
+            env_id
+            for env_id in self.env_ids[source]
+            if env_id not in self._pinned and self._costs[env_id] < gap
+        ]
+        if not candidates:
+            return
+
+        # The best environment halves the gap between both workers
+        env_id = min(candidates, key=lambda i: abs(self._costs[i] - gap / 2))
+        self._migrate(int(env_id), target)
+
+    def _migrate(self, env_id: int, target: int):
+        """
+        Moves an environment to another worker with a snapshot of its state.
+
+        Args:
+            env_id (int):
+                The index of the environment
+
+            target (int):
+                The index of the worker that takes over the environment
+        """
+        source = next(w for w, env_ids in enumerate(self.env_ids) if env_id in env_ids)
+        if source == target:
+            return
+
+        self.parent_pipes[source].send(("release", env_id))
+        state, success = self.parent_pipes[source].recv()
+        if not success:
+            raise RuntimeError(f"Worker {source} failed:\n{state}")
+        if state is None:
+            # The environment has no snapshot() and stays on its worker
+            self._pinned.add(env_id)
+            return
+
+        self.parent_pipes[target].send(("adopt", (env_id, state)))
+        result, success = self.parent_pipes[target].recv()
+        if not success:
+            raise RuntimeError(f"Worker {target} failed:\n{result}")
+
+        self.env_ids[source] = self.env_ids[source][self.env_ids[source] != env_id]
+        self.env_ids[target] = np.sort(np.append(self.env_ids[target], env_id))
+        self.migrations += 1
+
+
+# The attributes of a PyBoyEnv that are bound to its emulator and not migrated
+_EMULATOR_ATTRIBUTES = ("pyboy", "ram")
+
+
+def _worker(
+    env_fns: List[CloudpickleWrapper],
+    env_ids: List[int],
+    pipe: Connection,
+    parent_pipe: Connection,
+    observation_space: spaces.Space,
+    action_space: spaces.Space,
+    num_envs: int,
+    shared_memory: Tuple[Any, ...],
+    observation_indices: List[Any],
+):
+    """Runs the environments of one worker process and measures their step time."""
+    parent_pipe.close()
+    views = _shared_memory_views(
+        observation_space, action_space, num_envs, shared_memory
+    )
+
+    # The environments and autoreset flags by index, iterated in ascending order
+    envs: Dict[int, gym.Env] = {}
+    try:
+        for env_id in env_ids:
+            envs[env_id] = _create_env(env_fns[env_id])
+        autoreset = {env_id: False for env_id in envs}
+        pipe.send((None, True))
+
+        def _measured_step(_) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[float]]:
+            costs = []
+            return _step(envs, autoreset, views, observation_indices, costs), costs
+
+        _serve(
+            pipe,
+            {
+                "step": _measured_step,
+                "reset": lambda data: _reset(
+                    envs, autoreset, views, *data, observation_indices
+                ),
+                "call": lambda data: _call(envs, *data),
+                "set_attr": lambda data: _set_attr(envs, *data),
+                "release": lambda env_id: _release(envs, autoreset, env_id),
+                "adopt": lambda data: _adopt(envs, autoreset, env_fns, *data),
+            },
+        )
+    except Exception:
+        pipe.send((traceback.format_exc(), False))
+    finally:
+        for env in envs.values():
+            env.close()
+        pipe.close()
+
+
+def _release(
+    envs: Dict[int, gym.Env], autoreset: Dict[int, bool], env_id: int
+) -> Tuple[bytes, Dict[str, Any], bool] | None:
+    """Closes the environment and returns its state, if it has snapshot()."""
+    env = envs[env_id]
+    if not hasattr(env, "snapshot"):
+        return None
+    # All attributes except the emulator, e.g. the ones changed by set_attr() or
+    # the recorded times of the profiler
+    attributes = {
+        name: value
+        for name, value in vars(env).items()
+        if name not in _EMULATOR_ATTRIBUTES
+    }
+    state = (env.snapshot().getvalue(), attributes, autoreset.pop(env_id))
+    envs.pop(env_id).close()
+    return state
+
+
+def _adopt(
+    envs: Dict[int, gym.Env],
+    autoreset: Dict[int, bool],
+    env_fns: List[CloudpickleWrapper],
+    env_id: int,
+    state: Tuple[bytes, Dict[str, Any], bool],
+):
+    """Creates the environment and restores the state returned by _release()."""
+    snapshot, attributes, needs_reset = state
+    env = _create_env(env_fns[env_id])
+    vars(env).update(attributes)
+    env.restore(io.BytesIO(snapshot))
+    envs[env_id] = env
+    autoreset[env_id] = needs_reset
+
+    # Keep the ascending order of the environments
+    items = sorted(envs.items())
+    envs.clear()
+    envs.update(items)
@@ -0,0 +1,7 @@
+"""Imports of environment wrappers."""
+
+from .frame_stack import FrameStack
+
+__all__ = ["FrameStack"]
+
+assert __all__ == sorted(__all__), f"__all__ needs to be sorted into {sorted(__all__)}!"
@@ -0,0 +1,104 @@
+from typing import Any, Dict, SupportsFloat, Tuple
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from gymnasium.core import ActType
+
+from gymboy.environments.env import PyBoyEnv
+
+
+class FrameStack(gym.Wrapper):
+    """
+    Stacks the last k observations of a *FullImage or *MinimalImage environment.
+
+    The observations are stored twice in a preallocated ring buffer of 2k frames,
+    so the last k observations are always a contiguous slice of it. Each step only
+    writes the new observation instead of copying the whole stack, and the stacked
+    observation is a (k, ...) view of the ring buffer.
+
+    With max_pool, each observation of a *FullImage environment is the maximum of
+    the last two frames of the step, e.g. to remove flickering sprites.
+
+    Args:
+        env (gym.Env):
+            The environment to wrap
+
+        n_frames (int):
+            The number of stacked observations
+
+        max_pool (bool):
+            The flag to max-pool the last two frames of each step.
+            Requires an environment with the screen as observation (*FullImage).
+
+        copy (bool):
+            The flag to return a copy of the stacked observation.
+            If False, the stacked observation is a view of the ring buffer, which is
+            overwritten by the next call of step() or reset().
+    """
+
+    def __init__(
+        self,
+        env: gym.Env,
+        n_frames: int = 4,
+        max_pool: bool = False,
+        copy: bool = False,
+    ):
+        if not isinstance(env.unwrapped, PyBoyEnv):
+            raise ValueError(f"{env.unwrapped} is not a PyBoy environment.")
+        if not isinstance(env.observation_space, spaces.Box):
+            raise ValueError(
+                f"Observation space {env.observation_space} is not a Box space."
+            )
+        if n_frames <= 0:
+            raise ValueError(f"n_frames must be greater than 0, got {n_frames}.")
+        if max_pool and not env.unwrapped._requires_rendering:
+            raise ValueError("max_pool requires the screen as observation.")
+
+        super().__init__(env)
+        self.n_frames = n_frames
+        self.copy = copy
+        self.env.unwrapped.max_pool = max_pool
+
+        single_space = env.observation_space
+        self.observation_space = spaces.Box(
+            low=np.repeat(single_space.low[None], n_frames, axis=0),
+            high=np.repeat(single_space.high[None], n_frames, axis=0),
+            dtype=single_space.dtype,
+        )
+
+        # Ring buffer, where frame t is stored at index t % n and t % n + n
+        self.frames = np.zeros(
+            (2 * n_frames, *single_space.shape), dtype=single_space.dtype
+        )
+        self.index = 0
+
+    def step(
+        self, action: ActType
+    ) -> Tuple[np.ndarray, SupportsFloat, bool, bool, Dict[str, Any]]:
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        self.index = (self.index + 1) % self.n_frames
+        self.frames[self.index] = observation
+        self.frames[self.index + self.n_frames] = observation
+        return self._observation(), reward, terminated, truncated, info
+
+    def reset(
+        self,
+        *,
+        seed: int | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        observation, info = self.env.reset(seed=seed, options=options)
+
+        # All stacked observations are the initial observation
+        self.frames[...] = observation
+        self.index = 0
+        return self._observation(), info
+
+    def _observation(self) -> np.ndarray:
+        """Returns the last n_frames observations from the oldest to the newest."""
+        start = self.index + 1
+        observation = self.frames[start : start + self.n_frames]
+        if self.copy:
+            return observation.copy()
+        return observation
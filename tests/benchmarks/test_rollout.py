@@ -0,0 +1,70 @@
+"""Tests benchmarks/rollout.py."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from pyboy import PyBoy
+
+from gymboy import registered_envs
+from gymboy.benchmarks.rollout import GAMES, run, split_env_id, synthetic_rom
+
+
+class TestRollout(unittest.TestCase):
+    """Tests the rollout benchmark."""
+
+    def test_split_env_id(self):
+        """Tests the split_env_id() method."""
+        self.assertEqual(("Tetris", "flatten"), split_env_id("Tetris-flatten-v1"))
+        self.assertEqual(
+            ("Pokemon-Red", "minimal-image"),
+            split_env_id("Pokemon-Red-minimal-image-v1"),
+        )
+        self.assertRaises(ValueError, split_env_id, "Tetris-v1")
+
+    def test_games(self):
+        """Tests that each registered environment has a game."""
+        for env_id in registered_envs:
+            game, _ = split_env_id(env_id)
+            self.assertIn(game, GAMES)
+
+    def test_synthetic_rom(self):
+        """Tests the synthetic_rom() method."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rom_path = os.path.join(tmp_dir, "pokemon_gold.gbc")
+            init_state_path = synthetic_rom("POKEMON_GLDAAU", rom_path)
+            self.assertTrue(os.path.exists(init_state_path))
+
+            pyboy = PyBoy(rom_path, window="null", sound_emulated=False)
+            self.assertEqual("POKEMON_GLDAAU", pyboy.cartridge_title)
+            pyboy.stop(save=False)
+
+    def test_run(self):
+        """Tests the run() method."""
+        results = run(
+            env_ids=["Tetris-flatten-v1"],
+            n_steps=10,
+            n_resets=2,
+            num_envs=[2],
+            vectorization_modes=["sync"],
+        )
+        json.dumps(results)
+        self.assertTrue(results["metadata"]["synthetic"])
+
+        result = results["envs"]["Tetris-flatten-v1"]
+        self.assertEqual("flatten", result["variant"])
+        self.assertGreater(result["steps_per_second"], 0)
+        self.assertGreater(result["reset_ms"], 0)
+        self.assertEqual(1, len(result["vector"]))
+        self.assertEqual(2, result["vector"][0]["num_envs"])
+        self.assertGreater(result["vector"][0]["steps_per_second"], 0)
+        self.assertGreater(result["vector"][0]["startup_s"], 0)
+
+    def test_run_invalid_env_id(self):
+        """Tests the run() method with an invalid environment ID."""
+        self.assertRaises(ValueError, run, env_ids=["Tetris-v0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+"""Tests benchmarks/step.py."""
+
+import unittest
+
+from gymboy.benchmarks.step import run
+
+
+class TestStep(unittest.TestCase):
+    """Tests the step benchmark."""
+
+    def test_run(self):
+        """Tests the run() method."""
+        results = run(env_id="Tetris-flatten-v1", number=100)
+        self.assertEqual({"legacy_us", "validated_us", "trusted_us"}, set(results))
+        for value in results.values():
+            self.assertGreater(value, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
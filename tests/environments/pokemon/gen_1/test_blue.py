@@ -204,6 +204,128 @@ class TestPokemonBlueFullImage(unittest.TestCase):
         vectorized_env.close()
 
 
+class TestPokemonBlueGrayscaleImage(unittest.TestCase):
+    """Tests the PokemonBlueGrayscaleImage class."""
+
+    def setUp(self):
+        self.env_id = "Pokemon-Blue-grayscale-image-v1"
+        self.rom_path = "./resources/roms/pokemon/gen_1/pokemon_blue.gb"
+        self.init_state_path = (
+            "./resources/states/pokemon/gen_1/pokemon_blue_after_first_order.state"
+        )
+        self.num_envs = 3
+        self.vectorization_mode = "sync"
+        self.env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        self.env.reset()
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_step(self):
+        """Tests the step() method."""
+        obs, reward, terminated, truncated, info = self.env.step(0)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = self.env.step(1)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+    def test_reset(self):
+        """Tests the reset() method."""
+        obs, _ = self.env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_observation(self):
+        """Tests the observation() method."""
+        obs = self.env.observation()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_palette_index(self):
+        """Tests the downsample and palette_index arguments."""
+        env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            downsample=2,
+            palette_index=True,
+        )
+        obs, _ = env.reset()
+        self.assertEqual((72, 80), obs.shape)
+        self.assertTrue(np.all(obs <= 3))
+        env.close()
+
+    def test_invalid_downsample(self):
+        """Tests the downsample argument with an invalid value."""
+        with self.assertRaises(ValueError):
+            gymboy.make(
+                env_id=self.env_id,
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                downsample=0,
+            )
+
+    def test_reward(self):
+        """Tests the reward() method."""
+        self.assertIsInstance(self.env.reward(), float)
+
+    def test_vectorized_env(self):
+        """Tests the vectorized environment."""
+        vectorized_env = gymboy.make_vec(
+            env_id=self.env_id,
+            num_envs=self.num_envs,
+            vectorization_mode=self.vectorization_mode,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+
+        obs, info = vectorized_env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [0] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [1] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        vectorized_env.close()
+
+
 class TestPokemonBlueMinimalImage(unittest.TestCase):
     """Tests the PokemonBlueMinimalImage class."""
 
@@ -17,6 +17,7 @@ from gymboy.environments.pokemon.gen_1._memory import (
     _money,
     _moves,
     _owned_pokemons,
+    _party_battle_state,
     _pokemon_ids,
     _pps,
     _seen_pokemons,
@@ -239,6 +240,21 @@ class TestMemory(unittest.TestCase):
             _max_pps(self.pyboy3, yellow=False),
         )
 
+    def test_party_battle_state(self):
+        """Tests the party_battle_state() method."""
+        for pyboy in [self.pyboy1, self.pyboy2, self.pyboy3]:
+            state = _party_battle_state(pyboy, yellow=False)
+            for key, reader in [
+                ("pokemon_ids", _pokemon_ids),
+                ("levels", _levels),
+                ("hps", _hps),
+                ("max_hps", _max_hps),
+                ("moves", _moves),
+                ("pps", _pps),
+                ("max_pps", _max_pps),
+            ]:
+                np.testing.assert_array_equal(reader(pyboy, yellow=False), state[key])
+
     def test_seen_pokemons(self):
         """Tests the seen_pokemons() method."""
         self.assertEqual(0, _seen_pokemons(self.pyboy1, yellow=False))
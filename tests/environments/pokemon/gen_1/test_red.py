@@ -204,6 +204,128 @@ class TestPokemonRedFullImage(unittest.TestCase):
         vectorized_env.close()
 
 
+class TestPokemonRedGrayscaleImage(unittest.TestCase):
+    """Tests the PokemonRedGrayscaleImage class."""
+
+    def setUp(self):
+        self.env_id = "Pokemon-Red-grayscale-image-v1"
+        self.rom_path = "./resources/roms/pokemon/gen_1/pokemon_red.gb"
+        self.init_state_path = (
+            "./resources/states/pokemon/gen_1/pokemon_red_after_second_order.state"
+        )
+        self.num_envs = 3
+        self.vectorization_mode = "sync"
+        self.env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        self.env.reset()
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_step(self):
+        """Tests the step() method."""
+        obs, reward, terminated, truncated, info = self.env.step(0)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = self.env.step(1)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+    def test_reset(self):
+        """Tests the reset() method."""
+        obs, _ = self.env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_observation(self):
+        """Tests the observation() method."""
+        obs = self.env.observation()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_palette_index(self):
+        """Tests the downsample and palette_index arguments."""
+        env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            downsample=2,
+            palette_index=True,
+        )
+        obs, _ = env.reset()
+        self.assertEqual((72, 80), obs.shape)
+        self.assertTrue(np.all(obs <= 3))
+        env.close()
+
+    def test_invalid_downsample(self):
+        """Tests the downsample argument with an invalid value."""
+        with self.assertRaises(ValueError):
+            gymboy.make(
+                env_id=self.env_id,
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                downsample=0,
+            )
+
+    def test_reward(self):
+        """Tests the reward() method."""
+        self.assertIsInstance(self.env.reward(), float)
+
+    def test_vectorized_env(self):
+        """Tests the vectorized environment."""
+        vectorized_env = gymboy.make_vec(
+            env_id=self.env_id,
+            num_envs=self.num_envs,
+            vectorization_mode=self.vectorization_mode,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+
+        obs, info = vectorized_env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [0] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [1] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        vectorized_env.close()
+
+
 class TestPokemonRedMinimalImage(unittest.TestCase):
     """Tests the PokemonRedMinimalImage class."""
 
@@ -302,5 +424,50 @@ class TestPokemonRedMinimalImage(unittest.TestCase):
         vectorized_env.close()
 
 
+class TestPokemonRedSkipText(unittest.TestCase):
+    """Tests the text fast-forward mode of the PokemonRed environments."""
+
+    def setUp(self):
+        self.env_id = "Pokemon-Red-flatten-v1"
+        self.rom_path = "./resources/roms/pokemon/gen_1/pokemon_red.gb"
+        self.init_state_path = (
+            "./resources/states/pokemon/gen_1/pokemon_red_after_second_order.state"
+        )
+        self.env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            skip_text=True,
+        )
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_reset(self):
+        """Tests the reset() method."""
+        _, info = self.env.reset()
+        self.assertEqual({"skipped_frames": 0}, info)
+
+    def test_step(self):
+        """Tests the step() method."""
+        self.env.reset()
+        for action in range(self.env.action_space.n):
+            _, _, _, _, info = self.env.step(action)
+            self.assertIsInstance(info["skipped_frames"], int)
+            self.assertGreaterEqual(info["skipped_frames"], 0)
+
+    def test_step_without_skip_text(self):
+        """Tests that the info is empty without the text fast-forward mode."""
+        env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env.reset()
+        _, _, _, _, info = env.step(0)
+        self.assertEqual({}, info)
+        env.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,108 @@
+"""Tests pokemon/_text.py."""
+
+import unittest
+
+import numpy as np
+
+from gymboy.environments.pokemon._text import (
+    CURSOR_TILE,
+    DOWN_ARROW_TILE,
+    MAX_TEXT_FRAMES,
+    PRESS_FRAMES,
+    TEXT_BOX_CORNER_TILE,
+    _skip_text,
+)
+
+PROMPT_ADDRESS = 0xC4F2
+TEXT_BOX_ADDRESS = 0xC490
+
+
+class FakeTextPyBoy:
+    """
+    A fake game boy that shows n_boxes text boxes, each closed by pressing A, where
+    the text of the next box prints for text_frames frames.
+    """
+
+    def __init__(self, n_boxes: int, text_frames: int = 5):
+        self.memory = np.zeros(0x10000, dtype=np.uint8)
+        self.memory[PROMPT_ADDRESS] = DOWN_ARROW_TILE
+        self.memory[TEXT_BOX_ADDRESS] = TEXT_BOX_CORNER_TILE
+        self.n_boxes = n_boxes
+        self.text_frames = text_frames
+        self.countdown = 0
+        self.presses = 0
+        self.frames = 0
+        self.rendered = []
+
+    def button(self, button: str):
+        assert button == "a"
+        self.presses += 1
+        self.n_boxes -= 1
+        self.memory[PROMPT_ADDRESS] = 0
+        if self.n_boxes > 0:
+            self.countdown = self.text_frames
+        else:
+            # The last press closes the text box
+            self.countdown = -1
+            self.memory[TEXT_BOX_ADDRESS] = 0
+
+    def tick(self, count: int = 1, render: bool = True):
+        for _ in range(count):
+            self.frames += 1
+            self.countdown -= 1
+            if self.countdown == 0:
+                self.memory[PROMPT_ADDRESS] = DOWN_ARROW_TILE
+        self.rendered.append(render)
+
+
+class TestSkipText(unittest.TestCase):
+    """Tests the _skip_text() method."""
+
+    def test_no_text(self):
+        """Tests the _skip_text() method without a text box."""
+        pyboy = FakeTextPyBoy(n_boxes=0)
+        pyboy.memory[PROMPT_ADDRESS] = 0
+        pyboy.memory[TEXT_BOX_ADDRESS] = 0
+        self.assertEqual(
+            0, _skip_text(pyboy, PROMPT_ADDRESS, TEXT_BOX_ADDRESS, render=True)
+        )
+        self.assertEqual(0, pyboy.frames)
+
+    def test_menu(self):
+        """Tests the _skip_text() method with a menu cursor in the text box."""
+        pyboy = FakeTextPyBoy(n_boxes=1)
+        pyboy.memory[PROMPT_ADDRESS] = 0
+        pyboy.memory[TEXT_BOX_ADDRESS + 21] = CURSOR_TILE
+        self.assertEqual(
+            0, _skip_text(pyboy, PROMPT_ADDRESS, TEXT_BOX_ADDRESS, render=True)
+        )
+        self.assertEqual(0, pyboy.frames)
+
+    def test_text(self):
+        """Tests the _skip_text() method with multiple text boxes."""
+        pyboy = FakeTextPyBoy(n_boxes=3)
+        frames = _skip_text(pyboy, PROMPT_ADDRESS, TEXT_BOX_ADDRESS, render=True)
+        self.assertEqual(3, pyboy.presses)
+        self.assertEqual(pyboy.frames, frames)
+        # The text of the second and third box prints after the press of the box
+        # before, and the closed text box ends the skip without waiting
+        self.assertEqual(3 * PRESS_FRAMES + 2 * (5 - PRESS_FRAMES) + 1, frames)
+        self.assertNotEqual(DOWN_ARROW_TILE, pyboy.memory[PROMPT_ADDRESS])
+        # Only the last frame is rendered
+        self.assertEqual([False] * (len(pyboy.rendered) - 1) + [True], pyboy.rendered)
+
+    def test_printing(self):
+        """Tests the _skip_text() method with a text box that is still printing."""
+        pyboy = FakeTextPyBoy(n_boxes=1)
+        pyboy.memory[PROMPT_ADDRESS] = 0
+        pyboy.countdown = 4
+        frames = _skip_text(pyboy, PROMPT_ADDRESS, TEXT_BOX_ADDRESS, render=True)
+        self.assertEqual(1, pyboy.presses)
+        self.assertEqual(4 + PRESS_FRAMES + 1, frames)
+
+    def test_max_frames(self):
+        """Tests the _skip_text() method with endless text boxes."""
+        pyboy = FakeTextPyBoy(n_boxes=10**6)
+        frames = _skip_text(pyboy, PROMPT_ADDRESS, TEXT_BOX_ADDRESS, render=False)
+        self.assertEqual(pyboy.frames, frames)
+        self.assertLessEqual(frames, MAX_TEXT_FRAMES + 1)
@@ -0,0 +1,250 @@
+"""Tests environments/env.py."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import gymboy
+
+
+class TestPyBoyEnv(unittest.TestCase):
+    """Tests the PyBoyEnv class."""
+
+    def setUp(self):
+        self.rom_path = "./resources/roms/tetris/tetris/tetris.gb"
+        self.init_state_path = "./resources/states/tetris/tetris/tetris_lvl_5.state"
+
+    def test_render_policy(self):
+        """Tests the render_policy argument."""
+        for env_id, render_policy, expected in [
+            ("Tetris-flatten-v1", "auto", False),
+            ("Tetris-minimal-image-v1", "auto", False),
+            ("Tetris-full-image-v1", "auto", True),
+            ("Tetris-flatten-v1", "always", True),
+            ("Tetris-full-image-v1", "never", False),
+        ]:
+            env = gymboy.make(
+                env_id=env_id,
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                render_policy=render_policy,
+            )
+            self.assertEqual(expected, env._render_last_frame)
+            env.close()
+
+    def test_invalid_render_policy(self):
+        """Tests the render_policy argument with an invalid value."""
+        with self.assertRaises(ValueError):
+            gymboy.make(
+                env_id="Tetris-flatten-v1",
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                render_policy="sometimes",
+            )
+
+    def test_init_state_read_once(self):
+        """Tests that the initial state file is only read at construction."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            init_state_path = os.path.join(tmp_dir, "tetris.state")
+            shutil.copy(self.init_state_path, init_state_path)
+            env = gymboy.make(
+                env_id="Tetris-flatten-v1",
+                rom_path=self.rom_path,
+                init_state_path=init_state_path,
+            )
+            os.remove(init_state_path)
+            env.reset()
+            env.close()
+
+    def test_init_state(self):
+        """Tests the init_state argument."""
+        with open(self.init_state_path, "rb") as f:
+            init_state = f.read()
+
+        env1 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env2 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state=init_state,
+        )
+        obs1, _ = env1.reset(seed=0)
+        obs2, _ = env2.reset(seed=0)
+        np.testing.assert_array_equal(obs1, obs2)
+        self.assertIs(init_state, env2.init_state)
+        env1.close()
+        env2.close()
+
+    def test_copy_observation(self):
+        """Tests the copy_observation argument."""
+        env1 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env2 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            copy_observation=False,
+        )
+        obs1, _ = env1.reset(seed=0)
+        obs2, _ = env2.reset(seed=0)
+        np.testing.assert_array_equal(obs1, obs2)
+        self.assertIsNot(obs1, env1.step(0)[0])
+        self.assertIs(obs2, env2.step(0)[0])
+        self.assertIs(obs2, env2.observation_buffer.array)
+
+        # The observations of step_many() are copied anyway
+        observations, *_ = env2.step_many([0, 0], observe_every=1)
+        self.assertFalse(np.shares_memory(observations, obs2))
+        env1.close()
+        env2.close()
+
+    def test_step_many(self):
+        """Tests the step_many() method."""
+        env1 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env2 = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env1.reset(seed=0)
+        env2.reset(seed=0)
+
+        actions = np.random.default_rng(0).integers(0, 9, size=20).tolist()
+        expected = [env1.step(action) for action in actions]
+        observations, rewards, terminations, truncations, info = env2.step_many(
+            actions, observe_every=8
+        )
+        np.testing.assert_array_equal([7, 15, 19], info["observation_steps"])
+        self.assertEqual((3, *env2.observation_space.shape), observations.shape)
+        for observation, t in zip(observations, info["observation_steps"]):
+            np.testing.assert_array_equal(expected[t][0], observation)
+        np.testing.assert_array_equal([e[1] for e in expected], rewards)
+        np.testing.assert_array_equal([e[2] for e in expected], terminations)
+        np.testing.assert_array_equal([e[3] for e in expected], truncations)
+        env1.close()
+        env2.close()
+
+    def test_invalid_step_many(self):
+        """Tests the step_many() method with invalid arguments."""
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env.reset(seed=0)
+        with self.assertRaises(ValueError):
+            env.step_many([])
+        with self.assertRaises(ValueError):
+            env.step_many([0, 1], observe_every=0)
+        with self.assertRaises(ValueError):
+            env.step_many([0, 100])
+        env.close()
+
+    def test_snapshot_restore(self):
+        """Tests the snapshot() and restore() methods."""
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env.reset(seed=0)
+        actions = np.random.default_rng(0).integers(0, 9, size=20).tolist()
+
+        buffer = env.snapshot()
+        expected = [env.step(action) for action in actions]
+        env.restore(buffer)
+        result = [env.step(action) for action in actions]
+        for (obs1, reward1, *_), (obs2, reward2, *_) in zip(expected, result):
+            np.testing.assert_array_equal(obs1, obs2)
+            self.assertEqual(reward1, reward2)
+
+        # The buffer is reused for the next snapshot
+        self.assertIs(buffer, env.snapshot(buffer))
+        env.close()
+
+    def test_profile(self):
+        """Tests the profile argument and the perf_stats() method."""
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            profile=True,
+        )
+        env.reset(seed=0)
+        for action in range(9):
+            env.step(action)
+
+        stats = env.perf_stats()
+        self.assertEqual(1, stats["reset"]["count"])
+        for phase in ["action", "emulation", "observation", "reward", "termination"]:
+            self.assertEqual(9, stats[phase]["count"])
+            self.assertEqual(9, sum(stats[phase]["histogram"]))
+            self.assertGreater(stats[phase]["total_s"], 0.0)
+
+        # The steps of step_many() are recorded as well
+        env.step_many([0, 1, 2, 3], observe_every=2)
+        stats = env.perf_stats()
+        for phase in ["action", "emulation", "reward", "termination"]:
+            self.assertEqual(13, stats[phase]["count"])
+        self.assertEqual(11, stats["observation"]["count"])
+        env.close()
+
+        # Without profiling, no stats are recorded
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env.reset(seed=0)
+        env.step(0)
+        self.assertEqual({}, env.perf_stats())
+        env.close()
+
+    def test_spaces(self):
+        """Tests that the spaces are built once per environment."""
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        self.assertIs(env.unwrapped.action_space, env.unwrapped.action_space)
+        self.assertIs(env.unwrapped.observation_space, env.unwrapped.observation_space)
+        env.close()
+
+    def test_step_validation(self):
+        """Tests the validation of the actions of the step() method."""
+        env = gymboy.make(
+            env_id="Tetris-flatten-v1",
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        env.reset(seed=0)
+        for action in [0, np.int64(3), np.array(8)]:
+            env.step(action)
+        for action in [-1, 9, 1.0, "a"]:
+            with self.assertRaises(ValueError):
+                env.step(action)
+
+        # Trusted actions are not validated
+        env.unwrapped.trust_actions = True
+        env.unwrapped._validate_action = None
+        env.step(1)
+        env.step_many([1, 2])
+        env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
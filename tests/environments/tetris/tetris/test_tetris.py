@@ -6,6 +6,15 @@ from typing import Dict
 import numpy as np
 
 import gymboy
+from gymboy.environments.env import PyBoyEnv
+from gymboy.environments.tetris.tetris._constant import (
+    BLOCK_X_ADDRESS,
+    BLOCK_Y_ADDRESS,
+    MAX_DROP_FRAMES,
+    NEXT_BLOCK_ADDRESS,
+)
+from gymboy.environments.tetris.tetris._memory import _next_block
+from gymboy.testing import FakePyBoy, make_fake
 
 
 class TestTetrisFlatten(unittest.TestCase):
@@ -201,6 +210,127 @@ class TestTetrisFullImage(unittest.TestCase):
         vectorized_env.close()
 
 
+class TestTetrisGrayscaleImage(unittest.TestCase):
+    """Tests the TetrisGrayscaleImage class."""
+
+    def setUp(self):
+        self.env_id = "Tetris-grayscale-image-v1"
+        self.rom_path = "./resources/roms/tetris/tetris/tetris.gb"
+        self.init_state_path = "./resources/states/tetris/tetris/tetris_lvl_5.state"
+        self.num_envs = 3
+        self.vectorization_mode = "sync"
+
+        self.env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+        self.env.reset()
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_step(self):
+        """Tests the step() method."""
+        obs, reward, terminated, truncated, info = self.env.step(0)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = self.env.step(1)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+    def test_reset(self):
+        """Tests the reset() method."""
+        obs, _ = self.env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_observation(self):
+        """Tests the observation() method."""
+        obs = self.env.observation()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((144, 160), obs.shape)
+
+    def test_palette_index(self):
+        """Tests the downsample and palette_index arguments."""
+        env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            downsample=2,
+            palette_index=True,
+        )
+        obs, _ = env.reset()
+        self.assertEqual((72, 80), obs.shape)
+        self.assertTrue(np.all(obs <= 3))
+        env.close()
+
+    def test_invalid_downsample(self):
+        """Tests the downsample argument with an invalid value."""
+        with self.assertRaises(ValueError):
+            gymboy.make(
+                env_id=self.env_id,
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                downsample=0,
+            )
+
+    def test_reward(self):
+        """Tests the reward() method."""
+        self.assertIsInstance(self.env.reward(), float)
+
+    def test_vectorized_env(self):
+        """Tests the vectorized environment."""
+        vectorized_env = gymboy.make_vec(
+            env_id=self.env_id,
+            num_envs=self.num_envs,
+            vectorization_mode=self.vectorization_mode,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+        )
+
+        obs, info = vectorized_env.reset()
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [0] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        obs, reward, terminated, truncated, info = vectorized_env.step(
+            [1] * self.num_envs
+        )
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((self.num_envs, 144, 160), obs.shape)
+        self.assertIsInstance(reward, np.ndarray)
+        self.assertEqual((self.num_envs,), reward.shape)
+        self.assertIsInstance(terminated, np.ndarray)
+        self.assertEqual((self.num_envs,), terminated.shape)
+        self.assertIsInstance(truncated, np.ndarray)
+        self.assertEqual((self.num_envs,), truncated.shape)
+        self.assertIsInstance(info, Dict)
+
+        vectorized_env.close()
+
+
 class TestTetrisMinimalImage(unittest.TestCase):
     """Tests the TetrisMinimalImage class."""
 
@@ -298,5 +428,160 @@ class TestTetrisMinimalImage(unittest.TestCase):
         vectorized_env.close()
 
 
+class TestTetrisPlacement(unittest.TestCase):
+    """Tests the Tetris class with the placement action mode."""
+
+    def setUp(self):
+        self.env_id = "Tetris-flatten-v1"
+        self.rom_path = "./resources/roms/tetris/tetris/tetris.gb"
+        self.init_state_path = "./resources/states/tetris/tetris/tetris_lvl_5.state"
+        self.env = gymboy.make(
+            env_id=self.env_id,
+            rom_path=self.rom_path,
+            init_state_path=self.init_state_path,
+            action_mode="placement",
+        )
+        self.env.reset()
+
+    def tearDown(self):
+        self.env.close()
+
+    def test_action_space(self):
+        """Tests the action_space property."""
+        self.assertEqual(40, self.env.action_space.n)
+
+    def test_step(self):
+        """Tests the step() method."""
+        frame_count = self.env.pyboy.frame_count
+        next_block = _next_block(self.env.pyboy)
+
+        obs, reward, terminated, truncated, info = self.env.step(13)
+        self.assertIsInstance(obs, np.ndarray)
+        self.assertEqual((182,), obs.shape)
+        self.assertIsInstance(reward, float)
+        self.assertIsInstance(terminated, bool)
+        self.assertIsInstance(truncated, bool)
+        self.assertIsInstance(info, Dict)
+
+        # One action places the whole block, which is detected before the drop
+        # runs into the frame limit
+        frame_delta = self.env.pyboy.frame_count - frame_count
+        self.assertGreater(frame_delta, 10)
+        self.assertLess(frame_delta, MAX_DROP_FRAMES)
+        self.assertNotEqual(next_block, _next_block(self.env.pyboy))
+
+    def test_invalid_action_mode(self):
+        """Tests the action_mode argument with an invalid value."""
+        with self.assertRaises(ValueError):
+            gymboy.make(
+                env_id=self.env_id,
+                rom_path=self.rom_path,
+                init_state_path=self.init_state_path,
+                action_mode="joystick",
+            )
+
+
+class TetrisScript:
+    """
+    A script of a FakePyBoy that moves the current block of Tetris like the game.
+
+    Each press of "left" or "right" moves the block by one column up to the walls
+    and each frame with "down" held drops it by one row. On the floor, the block is
+    locked at its column and a new block spawns, which either changes the next
+    block (and keeps the block on the floor) or resets the y position of the block.
+
+    Args:
+        lock (str):
+            The change that marks a locked block.
+            Can be either "next_block" or "y_reset".
+
+        right_wall (int):
+            The highest column of the block
+    """
+
+    SPAWN_X, SPAWN_Y, FLOOR_Y = 4, 1, 17
+
+    def __init__(self, lock: str, right_wall: int = 9):
+        self.lock = lock
+        self.right_wall = right_wall
+        self.n_presses = 0
+        self.locked_columns = []
+
+    def __call__(self, pyboy: FakePyBoy):
+        x, y = pyboy.memory[BLOCK_X_ADDRESS], pyboy.memory[BLOCK_Y_ADDRESS]
+        for _, button in pyboy.pressed_buttons[self.n_presses :]:
+            if button == "left":
+                x = max(x - 1, 0)
+            elif button == "right":
+                x = min(x + 1, self.right_wall)
+        self.n_presses = len(pyboy.pressed_buttons)
+
+        if "down" not in pyboy.held_buttons:
+            pyboy.memory[BLOCK_X_ADDRESS] = x
+            return
+
+        y += 1
+        if y >= self.FLOOR_Y:
+            self.locked_columns.append(x)
+            x = self.SPAWN_X
+            if self.lock == "next_block":
+                pyboy.memory[NEXT_BLOCK_ADDRESS] += 4
+            else:
+                y = self.SPAWN_Y
+        pyboy.memory[BLOCK_X_ADDRESS] = x
+        pyboy.memory[BLOCK_Y_ADDRESS] = y
+
+
+class TestTetrisPlacementFake(unittest.TestCase):
+    """Tests the placement action mode with a scripted FakePyBoy."""
+
+    def _make(self, script: TetrisScript) -> PyBoyEnv:
+        env = make_fake(
+            "Tetris-flatten-v1", script=script, action_mode="placement"
+        ).unwrapped
+        env.reset(seed=0)
+        env.pyboy.memory[BLOCK_X_ADDRESS] = TetrisScript.SPAWN_X
+        env.pyboy.memory[BLOCK_Y_ADDRESS] = TetrisScript.SPAWN_Y
+        return env
+
+    def test_lock_by_next_block(self):
+        """Tests that a changed next block ends the drop."""
+        script = TetrisScript(lock="next_block")
+        env = self._make(script)
+        frame_count = env.pyboy.frame_count
+
+        env.step(12)
+        self.assertEqual([2], script.locked_columns)
+        self.assertLess(env.pyboy.frame_count - frame_count, MAX_DROP_FRAMES)
+        self.assertNotIn("down", env.pyboy.held_buttons)
+        env.close()
+
+    def test_lock_by_y_reset(self):
+        """Tests that a decreased y position ends the drop."""
+        script = TetrisScript(lock="y_reset")
+        env = self._make(script)
+        frame_count = env.pyboy.frame_count
+
+        env.step(7)
+        self.assertEqual([7], script.locked_columns)
+        self.assertLess(env.pyboy.frame_count - frame_count, MAX_DROP_FRAMES)
+
+        # Each action places exactly one block
+        env.step(0)
+        self.assertEqual([7, 0], script.locked_columns)
+        env.close()
+
+    def test_wall_clamping(self):
+        """Tests that the block stops at the walls."""
+        script = TetrisScript(lock="y_reset", right_wall=7)
+        env = self._make(script)
+
+        env.step(9)
+        self.assertEqual([7], script.locked_columns)
+        env.step(30)
+        self.assertEqual([7, 0], script.locked_columns)
+        env.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Tests registration.py."""
 
+import subprocess
+import sys
 from typing import Type
 
 import gymnasium as gym
@@ -9,41 +11,49 @@ import gymboy
 from gymboy.environments.kirby.dream_land_1.kirby_dream_land_1 import (
     KirbyDreamLand1Flatten,
     KirbyDreamLand1FullImage,
+    KirbyDreamLand1GrayscaleImage,
     KirbyDreamLand1MinimalImage,
 )
 from gymboy.environments.mario.land_1.super_mario_land_1 import (
     SuperMarioLand1Flatten,
     SuperMarioLand1FullImage,
+    SuperMarioLand1GrayscaleImage,
     SuperMarioLand1MinimalImage,
 )
 from gymboy.environments.pokemon.gen_1.blue import (
     PokemonBlueFlatten,
     PokemonBlueFullImage,
+    PokemonBlueGrayscaleImage,
     PokemonBlueMinimalImage,
 )
 from gymboy.environments.pokemon.gen_1.red import (
     PokemonRedFlatten,
     PokemonRedFullImage,
+    PokemonRedGrayscaleImage,
     PokemonRedMinimalImage,
 )
 from gymboy.environments.pokemon.gen_1.yellow import (
     PokemonYellowFlatten,
     PokemonYellowFullImage,
+    PokemonYellowGrayscaleImage,
     PokemonYellowMinimalImage,
 )
 from gymboy.environments.pokemon.gen_2.gold import (
     PokemonGoldFlatten,
     PokemonGoldFullImage,
+    PokemonGoldGrayscaleImage,
     PokemonGoldMinimalImage,
 )
 from gymboy.environments.pokemon.gen_2.silver import (
     PokemonSilverFlatten,
     PokemonSilverFullImage,
+    PokemonSilverGrayscaleImage,
     PokemonSilverMinimalImage,
 )
 from gymboy.environments.tetris.tetris.tetris import (
     TetrisFlatten,
     TetrisFullImage,
+    TetrisGrayscaleImage,
     TetrisMinimalImage,
 )
 
@@ -63,6 +73,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
             KirbyDreamLand1FullImage,
         ),
+        (
+            "Kirby-Dream-Land-1-grayscale-image-v1",
+            "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
+            "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
+            KirbyDreamLand1GrayscaleImage,
+        ),
         (
             "Kirby-Dream-Land-1-minimal-image-v1",
             "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
@@ -81,6 +97,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
             PokemonBlueFullImage,
         ),
+        (
+            "Pokemon-Blue-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_blue.gb",
+            "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
+            PokemonBlueGrayscaleImage,
+        ),
         (
             "Pokemon-Blue-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_blue.gb",
@@ -99,6 +121,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
             PokemonGoldFullImage,
         ),
+        (
+            "Pokemon-Gold-grayscale-image-v1",
+            "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
+            "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
+            PokemonGoldGrayscaleImage,
+        ),
         (
             "Pokemon-Gold-minimal-image-v1",
             "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
@@ -117,6 +145,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
             PokemonRedFullImage,
         ),
+        (
+            "Pokemon-Red-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_red.gb",
+            "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
+            PokemonRedGrayscaleImage,
+        ),
         (
             "Pokemon-Red-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_red.gb",
@@ -135,6 +169,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
             PokemonSilverFullImage,
         ),
+        (
+            "Pokemon-Silver-grayscale-image-v1",
+            "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
+            "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
+            PokemonSilverGrayscaleImage,
+        ),
         (
             "Pokemon-Silver-minimal-image-v1",
             "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
@@ -153,6 +193,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
             PokemonYellowFullImage,
         ),
+        (
+            "Pokemon-Yellow-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
+            "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
+            PokemonYellowGrayscaleImage,
+        ),
         (
             "Pokemon-Yellow-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
@@ -171,6 +217,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
             SuperMarioLand1FullImage,
         ),
+        (
+            "Super-Mario-Land-1-grayscale-image-v1",
+            "resources/roms/mario/land_1/super_mario_land_1.gb",
+            "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
+            SuperMarioLand1GrayscaleImage,
+        ),
         (
             "Super-Mario-Land-1-minimal-image-v1",
             "resources/roms/mario/land_1/super_mario_land_1.gb",
@@ -189,6 +241,12 @@ from gymboy.environments.tetris.tetris.tetris import (
             "resources/states/tetris/tetris/tetris_after_intro.state",
             TetrisFullImage,
         ),
+        (
+            "Tetris-grayscale-image-v1",
+            "resources/roms/tetris/tetris/tetris.gb",
+            "resources/states/tetris/tetris/tetris_after_intro.state",
+            TetrisGrayscaleImage,
+        ),
         (
             "Tetris-minimal-image-v1",
             "resources/roms/tetris/tetris/tetris.gb",
@@ -223,6 +281,12 @@ def test_make(
             "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
             100,
         ),
+        (
+            "Kirby-Dream-Land-1-grayscale-image-v1",
+            "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
+            "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
+            100,
+        ),
         (
             "Kirby-Dream-Land-1-minimal-image-v1",
             "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
@@ -241,6 +305,12 @@ def test_make(
             "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Blue-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_blue.gb",
+            "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Blue-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_blue.gb",
@@ -259,6 +329,12 @@ def test_make(
             "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Gold-grayscale-image-v1",
+            "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
+            "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Gold-minimal-image-v1",
             "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
@@ -277,6 +353,12 @@ def test_make(
             "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Red-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_red.gb",
+            "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Red-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_red.gb",
@@ -295,6 +377,12 @@ def test_make(
             "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Silver-grayscale-image-v1",
+            "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
+            "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Silver-minimal-image-v1",
             "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
@@ -313,6 +401,12 @@ def test_make(
             "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Yellow-grayscale-image-v1",
+            "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
+            "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Yellow-minimal-image-v1",
             "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
@@ -331,6 +425,12 @@ def test_make(
             "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
             100,
         ),
+        (
+            "Super-Mario-Land-1-grayscale-image-v1",
+            "resources/roms/mario/land_1/super_mario_land_1.gb",
+            "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
+            100,
+        ),
         (
             "Super-Mario-Land-1-minimal-image-v1",
             "resources/roms/mario/land_1/super_mario_land_1.gb",
@@ -349,6 +449,12 @@ def test_make(
             "resources/states/tetris/tetris/tetris_after_intro.state",
             100,
         ),
+        (
+            "Tetris-grayscale-image-v1",
+            "resources/roms/tetris/tetris/tetris.gb",
+            "resources/states/tetris/tetris/tetris_after_intro.state",
+            100,
+        ),
         (
             "Tetris-minimal-image-v1",
             "resources/roms/tetris/tetris/tetris.gb",
@@ -390,6 +496,13 @@ def test_env_reset_step(
             "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
             KirbyDreamLand1FullImage,
         ),
+        (
+            "Kirby-Dream-Land-1-grayscale-image-v1",
+            1,
+            "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
+            "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
+            KirbyDreamLand1GrayscaleImage,
+        ),
         (
             "Kirby-Dream-Land-1-minimal-image-v1",
             1,
@@ -411,6 +524,13 @@ def test_env_reset_step(
             "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
             PokemonBlueFullImage,
         ),
+        (
+            "Pokemon-Blue-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_blue.gb",
+            "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
+            PokemonBlueGrayscaleImage,
+        ),
         (
             "Pokemon-Blue-minimal-image-v1",
             1,
@@ -432,6 +552,13 @@ def test_env_reset_step(
             "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
             PokemonGoldFullImage,
         ),
+        (
+            "Pokemon-Gold-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
+            "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
+            PokemonGoldGrayscaleImage,
+        ),
         (
             "Pokemon-Gold-minimal-image-v1",
             1,
@@ -453,6 +580,13 @@ def test_env_reset_step(
             "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
             PokemonRedFullImage,
         ),
+        (
+            "Pokemon-Red-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_red.gb",
+            "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
+            PokemonRedGrayscaleImage,
+        ),
         (
             "Pokemon-Red-minimal-image-v1",
             1,
@@ -474,6 +608,13 @@ def test_env_reset_step(
             "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
             PokemonSilverFullImage,
         ),
+        (
+            "Pokemon-Silver-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
+            "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
+            PokemonSilverGrayscaleImage,
+        ),
         (
             "Pokemon-Silver-minimal-image-v1",
             1,
@@ -495,6 +636,13 @@ def test_env_reset_step(
             "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
             PokemonYellowFullImage,
         ),
+        (
+            "Pokemon-Yellow-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
+            "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
+            PokemonYellowGrayscaleImage,
+        ),
         (
             "Pokemon-Yellow-minimal-image-v1",
             1,
@@ -516,6 +664,13 @@ def test_env_reset_step(
             "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
             SuperMarioLand1FullImage,
         ),
+        (
+            "Super-Mario-Land-1-grayscale-image-v1",
+            1,
+            "resources/roms/mario/land_1/super_mario_land_1.gb",
+            "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
+            SuperMarioLand1GrayscaleImage,
+        ),
         (
             "Super-Mario-Land-1-minimal-image-v1",
             1,
@@ -537,6 +692,13 @@ def test_env_reset_step(
             "resources/states/tetris/tetris/tetris_after_intro.state",
             TetrisFullImage,
         ),
+        (
+            "Tetris-grayscale-image-v1",
+            1,
+            "resources/roms/tetris/tetris/tetris.gb",
+            "resources/states/tetris/tetris/tetris_after_intro.state",
+            TetrisGrayscaleImage,
+        ),
         (
             "Tetris-minimal-image-v1",
             1,
@@ -580,6 +742,13 @@ def test_make_vec(
             "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
             100,
         ),
+        (
+            "Kirby-Dream-Land-1-grayscale-image-v1",
+            1,
+            "resources/roms/kirby/dream_land_1/kirby_dream_land_1.gb",
+            "resources/states/kirby/dream_land_1/kirby_dream_land_1_after_intro.state",
+            100,
+        ),
         (
             "Kirby-Dream-Land-1-minimal-image-v1",
             1,
@@ -601,6 +770,13 @@ def test_make_vec(
             "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Blue-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_blue.gb",
+            "resources/states/pokemon/gen_1/pokemon_blue_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Blue-minimal-image-v1",
             1,
@@ -622,6 +798,13 @@ def test_make_vec(
             "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Gold-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_2/pokemon_gold.gbc",
+            "resources/states/pokemon/gen_2/pokemon_gold_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Gold-minimal-image-v1",
             1,
@@ -643,6 +826,13 @@ def test_make_vec(
             "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Red-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_red.gb",
+            "resources/states/pokemon/gen_1/pokemon_red_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Red-minimal-image-v1",
             1,
@@ -664,6 +854,13 @@ def test_make_vec(
             "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Silver-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_2/pokemon_silver.gbc",
+            "resources/states/pokemon/gen_2/pokemon_silver_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Silver-minimal-image-v1",
             1,
@@ -685,6 +882,13 @@ def test_make_vec(
             "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
             100,
         ),
+        (
+            "Pokemon-Yellow-grayscale-image-v1",
+            1,
+            "resources/roms/pokemon/gen_1/pokemon_yellow.gbc",
+            "resources/states/pokemon/gen_1/pokemon_yellow_after_intro.state",
+            100,
+        ),
         (
             "Pokemon-Yellow-minimal-image-v1",
             1,
@@ -706,6 +910,13 @@ def test_make_vec(
             "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
             100,
         ),
+        (
+            "Super-Mario-Land-1-grayscale-image-v1",
+            1,
+            "resources/roms/mario/land_1/super_mario_land_1.gb",
+            "resources/states/mario/land_1/super_mario_land_1_after_intro.state",
+            100,
+        ),
         (
             "Super-Mario-Land-1-minimal-image-v1",
             1,
@@ -727,6 +938,13 @@ def test_make_vec(
             "resources/states/tetris/tetris/tetris_after_intro.state",
             100,
         ),
+        (
+            "Tetris-grayscale-image-v1",
+            1,
+            "resources/roms/tetris/tetris/tetris.gb",
+            "resources/states/tetris/tetris/tetris_after_intro.state",
+            100,
+        ),
         (
             "Tetris-minimal-image-v1",
             1,
@@ -761,3 +979,31 @@ def test_env_reset_step_vec(
         assert rewards.shape[0] == num_envs
         assert terminations.shape[0] == num_envs
         assert truncations.shape[0] == num_envs
+
+
+def test_import_is_lazy():
+    """Tests that importing gymboy does not import the game environments."""
+    code = (
+        "import sys, gymboy; "
+        "assert not any(m.startswith(('gymboy.environments.', 'pyboy', 'skimage')) "
+        "for m in sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_make_invalid_env_id():
+    """Tests the make() method with an unregistered environment ID."""
+    with pytest.raises(ValueError):
+        gymboy.make(
+            env_id="Tetris-v0", rom_path="resources/roms/tetris/tetris/tetris.gb"
+        )
+
+
+def test_gym_make():
+    """Tests that the environments are registered in gymnasium."""
+    env = gym.make(
+        "gymboy/Tetris-flatten-v1",
+        rom_path="resources/roms/tetris/tetris/tetris.gb",
+        init_state_path="resources/states/tetris/tetris/tetris_after_intro.state",
+    )
+    assert isinstance(env.unwrapped, TetrisFlatten)
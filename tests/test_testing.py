@@ -0,0 +1,127 @@
+"""Tests testing.py."""
+
+import io
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+import gymboy
+from gymboy.environments.pokemon.gen_1._constant import LEVELS_ADDRESSES
+from gymboy.environments.pokemon.gen_1._memory import _levels
+from gymboy.environments.tetris.tetris._constant import GAME_OVER_ADDRESS
+from gymboy.environments.tetris.tetris._memory import _score
+from gymboy.testing import FakePyBoy, make_fake
+from gymboy.utils import tilemap_game_area
+
+
+def test_tick():
+    """Tests the tick() and button() methods."""
+    frames = []
+    pyboy = FakePyBoy("TETRIS", script=lambda p: frames.append(p.frame_count))
+    pyboy.button("a", delay=2)
+    pyboy.button_press("down")
+    assert pyboy.tick(1, False)
+    assert set(pyboy.held_buttons) == {"a", "down"}
+    pyboy.tick(2, True)
+    assert set(pyboy.held_buttons) == {"down"}
+    pyboy.button_release("down")
+    assert pyboy.held_buttons == {}
+    assert frames == [1, 2, 3]
+    assert pyboy.rendered_frames == 1
+    assert pyboy.pressed_buttons == [(0, "a"), (0, "down")]
+
+
+def test_memory():
+    """Tests that the memory readers accept the FakePyBoy."""
+    pyboy = FakePyBoy("TETRIS")
+    pyboy.memory[0xC0A0:0xC0A3] = [0x45, 0x23, 0x01]
+    assert _score(pyboy) == 12345
+    assert pyboy.memory[0xC0A0:0xC0A3] == [0x45, 0x23, 0x01]
+
+    pyboy = FakePyBoy("POKEMON RED")
+    for i, address in enumerate(LEVELS_ADDRESSES):
+        pyboy.memory[address] = i + 1
+    np.testing.assert_array_equal(_levels(pyboy), np.arange(1, 7))
+
+
+def test_sprites():
+    """Tests the get_sprite() and set_sprite() methods."""
+    pyboy = FakePyBoy("POKEMON_GLDAAU", cgb=True)
+    pyboy.set_sprite(3, x=16, y=24, tile_identifier=7)
+    sprite = pyboy.get_sprite(3)
+    assert (sprite.x, sprite.y, sprite.tile_identifier) == (16, 24, 7)
+    assert sprite.on_screen
+    assert tilemap_game_area(pyboy)[3, 2] == 7
+
+    with pytest.raises(ValueError):
+        pyboy.get_sprite(40)
+
+
+def test_save_load_state():
+    """Tests the save_state() and load_state() methods."""
+    pyboy = FakePyBoy("TETRIS")
+    pyboy.memory[0xC000] = 1
+    pyboy.game_area_array[0, 0] = 2
+    pyboy.screen.ndarray[0, 0, 0] = 3
+    pyboy.tick(5)
+
+    state = io.BytesIO()
+    pyboy.save_state(state)
+    pyboy.memory[0xC000] = 0
+    pyboy.game_area_array[0, 0] = 0
+    pyboy.screen.ndarray[0, 0, 0] = 0
+    pyboy.tick(5)
+
+    state.seek(0)
+    pyboy.load_state(state)
+    assert pyboy.memory[0xC000] == 1
+    assert pyboy.game_area()[0, 0] == 2
+    assert pyboy.screen.ndarray[0, 0, 0] == 3
+    assert pyboy.frame_count == 5
+
+
+@pytest.mark.parametrize("env_id", gymboy.registered_envs)
+def test_make_fake(env_id: str):
+    """Tests the make_fake() method for each registered environment."""
+    env = make_fake(env_id, n_frameskip=2)
+    obs, info = env.reset(seed=0)
+    assert obs.shape == env.observation_space.shape
+    for action in range(env.action_space.n):
+        obs, reward, terminated, truncated, info = env.step(action)
+        assert obs.shape == env.observation_space.shape
+        assert isinstance(reward, float)
+    # The reset progresses the game by one frame
+    assert env.unwrapped.pyboy.frame_count == 1 + 2 * env.action_space.n
+    env.close()
+
+
+def test_make_fake_script():
+    """Tests the make_fake() method with a script that ends the game."""
+
+    def game_over(pyboy: FakePyBoy):
+        if pyboy.frame_count == 4:
+            pyboy.memory[GAME_OVER_ADDRESS] = 0x0D
+
+    env = make_fake("Tetris-flatten-v1", script=game_over)
+    env.reset(seed=0)
+    assert [env.step(0)[2] for _ in range(3)] == [False, False, True]
+    env.close()
+
+
+def test_make_fake_vector():
+    """Tests vector environments of FakePyBoy environments."""
+    envs = gym.vector.SyncVectorEnv(
+        [lambda: make_fake("Tetris-minimal-image-v1") for _ in range(3)]
+    )
+    obs, _ = envs.reset(seed=0)
+    assert obs.shape == (3, 18, 10)
+    obs, *_ = envs.step(np.zeros(3, dtype=np.int64))
+    assert obs.shape == (3, 18, 10)
+    envs.close()
+
+
+def test_make_fake_invalid_env_id():
+    """Tests the make_fake() method with an invalid environment ID."""
+    with pytest.raises(ValueError):
+        make_fake("Tetris-v0")
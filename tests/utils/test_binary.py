@@ -1,14 +1,19 @@
 """Tests utils/binary.py."""
 
-from typing import List
+from typing import Callable, List
 
+import numpy as np
 import pytest
 
 from gymboy.utils import (
     bcds_to_integer,
+    bcds_to_integer_array,
     bytes_bit_count,
+    bytes_bit_count_array,
     bytes_to_int,
+    bytes_to_int_array,
     reduced_bcds_to_integer,
+    reduced_bcds_to_integer_array,
 )
 
 
@@ -70,3 +75,30 @@ def test_bcds_to_integer(numbers: List[int], expected: int):
 def test_reduced_bcds_to_integer(numbers: List[int], expected: int):
     """Tests the reduced_bcds_to_integer() method."""
     assert reduced_bcds_to_integer(numbers) == expected
+
+
+@pytest.mark.parametrize(
+    argnames=["scalar_fn", "array_fn", "n_bytes", "high"],
+    argvalues=[
+        (bytes_bit_count, bytes_bit_count_array, 320, 256),
+        (bytes_to_int, bytes_to_int_array, 3, 256),
+        (bcds_to_integer, bcds_to_integer_array, 4, 0x9A),
+        (reduced_bcds_to_integer, reduced_bcds_to_integer_array, 4, 0x0A),
+    ],
+)
+def test_array_decoders(
+    scalar_fn: Callable, array_fn: Callable, n_bytes: int, high: int
+):
+    """Tests that the array decoders are equal to the scalar decoders."""
+    rng = np.random.default_rng(0)
+    numbers = rng.integers(0, high, size=(4, 8, n_bytes), dtype=np.uint8)
+    result = array_fn(numbers)
+    assert result.shape == (4, 8)
+    expected = [[scalar_fn(row.tolist()) for row in batch] for batch in numbers]
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_bytes_to_int_array_too_many_bytes():
+    """Tests the bytes_to_int_array() method with too many bytes."""
+    with pytest.raises(ValueError):
+        bytes_to_int_array(np.zeros((2, 8), dtype=np.uint8))
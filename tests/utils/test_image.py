@@ -0,0 +1,89 @@
+"""Tests utils/image.py."""
+
+from typing import Tuple
+
+import numpy as np
+import pytest
+import skimage as ski
+from PIL import Image
+
+from gymboy.utils import (
+    downsampled_shape,
+    rgba_to_grayscale,
+    rgba_to_palette_index,
+    rgba_to_rgb,
+)
+
+
+@pytest.mark.parametrize(argnames="seed", argvalues=[0, 1, 2])
+def test_rgba_to_rgb(seed: int):
+    """Tests the rgba_to_rgb() method."""
+    rng = np.random.default_rng(seed)
+    rgba = rng.integers(0, 256, size=(144, 160, 4), dtype=np.uint8)
+    rgba[..., 3] = 255
+    rgba[0, :, :3] = np.arange(160)[:, None]
+    rgba[1, :96, :3] = np.arange(160, 256)[:, None]
+
+    expected = (255 * ski.color.rgba2rgb(Image.fromarray(rgba, "RGBA"))).clip(0, 255)
+    np.testing.assert_array_equal(expected.astype(np.uint8), rgba_to_rgb(rgba))
+
+
+def test_rgba_to_rgb_out():
+    """Tests the rgba_to_rgb() method with a preallocated buffer."""
+    rgba = np.full((144, 160, 4), 255, dtype=np.uint8)
+    out = np.zeros((144, 160, 3), dtype=np.uint8)
+    result = rgba_to_rgb(rgba, out=out)
+    assert result is out
+    np.testing.assert_array_equal(np.full((144, 160, 3), 255), out)
+
+
+@pytest.mark.parametrize(argnames="seed", argvalues=[0, 1, 2])
+def test_rgba_to_grayscale(seed: int):
+    """Tests the rgba_to_grayscale() method."""
+    rng = np.random.default_rng(seed)
+    rgba = rng.integers(0, 256, size=(144, 160, 4), dtype=np.uint8)
+    rgba[..., 3] = 255
+    rgba[0, :, :3] = 255
+
+    expected = np.round(rgba[..., :3].astype(np.float64) @ [77, 150, 29] / 256)
+    grayscale = rgba_to_grayscale(rgba)
+    assert grayscale.dtype == np.uint8
+    np.testing.assert_allclose(expected, grayscale, atol=1)
+    np.testing.assert_array_equal(np.full(160, 255), grayscale[0])
+
+
+@pytest.mark.parametrize(
+    argnames=["downsample", "expected"],
+    argvalues=[(1, (144, 160)), (2, (72, 80)), (3, (48, 54)), (16, (9, 10))],
+)
+def test_rgba_to_grayscale_downsample(downsample: int, expected: Tuple[int, int]):
+    """Tests the rgba_to_grayscale() method with a downsample factor."""
+    rgba = np.zeros((144, 160, 4), dtype=np.uint8)
+    rgba[::downsample, ::downsample, :3] = 255
+    grayscale = rgba_to_grayscale(rgba, downsample)
+    assert expected == downsampled_shape(downsample) == grayscale.shape
+    np.testing.assert_array_equal(np.full(expected, 255), grayscale)
+
+
+def test_rgba_to_grayscale_out():
+    """Tests the rgba_to_grayscale() method with a preallocated buffer."""
+    rgba = np.full((144, 160, 4), 255, dtype=np.uint8)
+    out = np.zeros((72, 80), dtype=np.uint8)
+    result = rgba_to_grayscale(rgba, 2, out=out)
+    assert result is out
+    np.testing.assert_array_equal(np.full((72, 80), 255), out)
+
+
+def test_rgba_to_palette_index():
+    """Tests the rgba_to_palette_index() method."""
+    rgba = np.zeros((144, 160, 4), dtype=np.uint8)
+    rgba[:, :, :3] = np.array([0xFF, 0x99, 0x55, 0x00]).repeat(40)[:, None]
+    palette_index = rgba_to_palette_index(rgba, 4)
+    assert (36, 40) == palette_index.shape
+    np.testing.assert_array_equal(np.arange(4).repeat(10), palette_index[0])
+
+
+def test_downsampled_shape_invalid():
+    """Tests the downsampled_shape() method with an invalid factor."""
+    with pytest.raises(ValueError):
+        downsampled_shape(0)
@@ -0,0 +1,53 @@
+"""Tests utils/memory.py."""
+
+from typing import List, Tuple
+
+import pytest
+
+from gymboy.utils import SnapshotMemory
+
+
+@pytest.fixture(name="memory")
+def fixture_memory() -> List[int]:
+    """Returns a fake game boy memory."""
+    return [address % 256 for address in range(0x10000)]
+
+
+@pytest.mark.parametrize(
+    argnames=["address_ranges", "start", "end", "expected"],
+    argvalues=[
+        ([(0xC000, 0xC010)], 0xC000, 0xC010, True),
+        ([(0xC000, 0xC010)], 0xC008, 0xC009, True),
+        ([(0xC000, 0xC010)], 0xC008, 0xC011, False),
+        ([(0xC000, 0xC008), (0xC008, 0xC010)], 0xC004, 0xC00C, True),
+        ([(0xC000, 0xC004), (0xC008, 0xC010)], 0xC002, 0xC00A, False),
+        ([], 0xC000, 0xC001, False),
+    ],
+)
+def test_covers(
+    memory: List[int],
+    address_ranges: List[Tuple[int, int]],
+    start: int,
+    end: int,
+    expected: bool,
+):
+    """Tests the covers() method."""
+    snapshot = SnapshotMemory(memory, address_ranges)
+    assert snapshot.covers(start, end) == expected
+
+
+def test_getitem(memory: List[int]):
+    """Tests the __getitem__() method."""
+    snapshot = SnapshotMemory(memory, [(0xC000, 0xC010)])
+    snapshot.update()
+
+    # Change the live memory after the copy was taken
+    memory[0xC000] = 0xFF
+    memory[0xD000] = 0xFF
+
+    assert snapshot[0xC000] == 0x00
+    assert snapshot[0xC001:0xC004] == [0x01, 0x02, 0x03]
+    assert snapshot[0xD000] == 0xFF
+
+    snapshot.update()
+    assert snapshot[0xC000] == 0xFF
@@ -0,0 +1,49 @@
+"""Tests utils/observation.py."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from gymboy.utils import ObservationBuffer
+
+
+def test_observation_buffer():
+    """Tests the ObservationBuffer class."""
+    buffer = ObservationBuffer([("level", ()), ("ids", (2,)), ("game_area", (2, 3))])
+    assert buffer.slices == {
+        "level": slice(0, 1),
+        "ids": slice(1, 3),
+        "game_area": slice(3, 9),
+    }
+
+    buffer["level"] = 5
+    buffer["ids"] = np.array([1, 2], dtype=np.uint32)
+    buffer["game_area"] = np.arange(6).reshape(2, 3)
+    np.testing.assert_array_equal(buffer["game_area"], [[0, 1, 2], [3, 4, 5]])
+
+    observation = buffer.get()
+    assert observation.dtype == np.float32
+    np.testing.assert_array_equal(observation, [5, 1, 2, 0, 1, 2, 3, 4, 5])
+    assert observation is not buffer.array
+    assert buffer.get(copy=False) is buffer.array
+
+
+def test_observation_buffer_pickle():
+    """Tests that the slices of an unpickled ObservationBuffer write to its array."""
+    buffer = ObservationBuffer([("level", ()), ("game_area", (2, 2))])
+    buffer["level"] = 5
+    buffer = pickle.loads(pickle.dumps(buffer))
+    np.testing.assert_array_equal(buffer.get(), [5, 0, 0, 0, 0])
+
+    buffer["level"] = 6
+    buffer["game_area"] = [[1, 2], [3, 4]]
+    np.testing.assert_array_equal(buffer.get(), [6, 1, 2, 3, 4])
+
+
+def test_invalid_observation_buffer():
+    """Tests the ObservationBuffer class with invalid layouts."""
+    with pytest.raises(ValueError):
+        ObservationBuffer([("level", ()), ("level", ())])
+    with pytest.raises(ValueError):
+        ObservationBuffer([("game_area", (0, 20))])
@@ -0,0 +1,56 @@
+"""Tests utils/profiler.py."""
+
+import time
+
+import pytest
+
+from gymboy.utils import PhaseProfiler, merge_perf_stats
+from gymboy.utils.profiler import HISTOGRAM_EDGES
+
+
+def test_record():
+    """Tests the record() method."""
+    profiler = PhaseProfiler(["a", "b"])
+    start = time.perf_counter()
+    end = profiler.record("a", start - 1.5e-6 * 2**10)
+    assert end >= start
+    profiler.record("a", end - 10.0)
+
+    stats = profiler.stats()
+    assert stats["a"]["count"] == 2
+    assert stats["a"]["total_s"] >= 10.0
+    assert stats["a"]["mean_us"] >= 5e6
+    assert len(stats["a"]["histogram"]) == len(HISTOGRAM_EDGES) + 1
+    assert stats["a"]["histogram"][11] == 1
+    assert stats["a"]["histogram"][-1] == 1
+    assert stats["b"] == {
+        "count": 0,
+        "total_s": 0.0,
+        "mean_us": 0.0,
+        "histogram": [0] * (len(HISTOGRAM_EDGES) + 1),
+    }
+
+    profiler.reset()
+    assert profiler.stats()["a"]["count"] == 0
+
+
+def test_duplicated_phases():
+    """Tests the PhaseProfiler with duplicated phases."""
+    with pytest.raises(ValueError):
+        PhaseProfiler(["a", "a"])
+
+
+def test_merge_perf_stats():
+    """Tests the merge_perf_stats() method."""
+    profilers = [PhaseProfiler(["a"]) for _ in range(3)]
+    for i, profiler in enumerate(profilers):
+        for _ in range(i + 1):
+            profiler.record("a", time.perf_counter())
+
+    merged = merge_perf_stats([profiler.stats() for profiler in profilers])
+    assert merged["a"]["count"] == 6
+    assert sum(merged["a"]["histogram"]) == 6
+    assert merged["a"]["total_s"] == pytest.approx(
+        sum(profiler.totals["a"] for profiler in profilers)
+    )
+    assert merge_perf_stats([]) == {}
@@ -0,0 +1,90 @@
+"""Tests utils/schema.py."""
+
+import numpy as np
+import pytest
+
+from gymboy.utils import Field, Schema, SnapshotMemory
+
+
+@pytest.fixture(name="memory")
+def fixture_memory() -> np.ndarray:
+    """Returns a fake game boy memory."""
+    memory = np.zeros(0x10000, dtype=np.uint8)
+    memory[0xC000:0xC004] = [0x12, 0x34, 0x56, 0x78]
+    memory[0xC010:0xC018] = [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08]
+    memory[0xC020:0xC022] = [0xFF, 0x0F]
+    return memory
+
+
+@pytest.mark.parametrize(
+    argnames=["field", "expected"],
+    argvalues=[
+        (Field("value", 0xC000), 0x12),
+        (Field("value", 0xC000, width=2, encoding="int"), 0x1234),
+        (Field("value", 0xC000, width=2, encoding="int", byteorder="little"), 0x3412),
+        (Field("value", 0xC000, width=3, encoding="bcd"), 123456),
+        (Field("value", 0xC000, width=3, encoding="bcd", byteorder="little"), 563412),
+        (Field("value", 0xC010, width=4, encoding="reduced_bcd"), 1234),
+        (Field("value", 0xC020, width=2, encoding="popcount"), 12),
+        (Field("value", 0xC000, width=2), [0x12, 0x34]),
+        (Field("value", 0xC010, count=4, stride=2), [0x01, 0x03, 0x05, 0x07]),
+        (
+            Field("value", 0xC010, width=2, encoding="int", count=2, stride=4),
+            [0x0102, 0x0506],
+        ),
+        (
+            Field("value", 0xC010, width=2, count=2, stride=4),
+            [[0x01, 0x02], [0x05, 0x06]],
+        ),
+    ],
+)
+def test_read(memory: np.ndarray, field: Field, expected: int | list):
+    """Tests the read() method."""
+    schema = Schema([field])
+    np.testing.assert_array_equal(schema.read(memory)["value"], expected)
+    np.testing.assert_array_equal(schema.read(memory.tolist())["value"], expected)
+
+
+def test_read_offset(memory: np.ndarray):
+    """Tests the read() method with an offset."""
+    schema = Schema([Field("value", 0xC001, width=2, encoding="int")], offset=-1)
+    assert schema.address_ranges == [(0xC000, 0xC002)]
+    assert schema.read(memory)["value"] == 0x1234
+
+
+def test_read_batch(memory: np.ndarray):
+    """Tests the read() method with a batch of memories."""
+    schema = Schema(
+        [
+            Field("value", 0xC000, width=2, encoding="int"),
+            Field("values", 0xC010, count=3),
+        ]
+    )
+    memories = np.stack([memory, np.zeros_like(memory)])
+    fields = schema.read(memories)
+    np.testing.assert_array_equal(fields["value"], [0x1234, 0])
+    np.testing.assert_array_equal(fields["values"], [[1, 2, 3], [0, 0, 0]])
+
+
+def test_read_snapshot_memory(memory: np.ndarray):
+    """Tests the read() method with a SnapshotMemory."""
+    schema = Schema([Field("value", 0xC000, width=2, encoding="int")])
+    snapshot = SnapshotMemory(memory.tolist(), schema.address_ranges)
+    snapshot.update()
+    assert schema.read(snapshot)["value"] == 0x1234
+
+
+def test_invalid_field():
+    """Tests the Field class with invalid arguments."""
+    with pytest.raises(ValueError):
+        Field("value", 0xC000, encoding="ascii")
+    with pytest.raises(ValueError):
+        Field("value", 0xC000, byteorder="middle")
+    with pytest.raises(ValueError):
+        Field("value", 0xC000, width=0)
+
+
+def test_duplicated_names():
+    """Tests the Schema class with duplicated field names."""
+    with pytest.raises(ValueError):
+        Schema([Field("value", 0xC000), Field("value", 0xC001)])
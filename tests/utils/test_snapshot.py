@@ -0,0 +1,78 @@
+"""Tests utils/snapshot.py."""
+
+import io
+
+import pytest
+
+from gymboy.utils import SnapshotStore
+
+
+class FakeEnv:
+    """An environment whose state is a single integer."""
+
+    def __init__(self):
+        self.state = 0
+        self.allocations = 0
+
+    def snapshot(self, buffer: io.BytesIO | None = None) -> io.BytesIO:
+        if buffer is None:
+            buffer = io.BytesIO()
+            self.allocations += 1
+        buffer.seek(0)
+        buffer.write(self.state.to_bytes(4, "little"))
+        return buffer
+
+    def restore(self, buffer: io.BytesIO):
+        self.state = int.from_bytes(buffer.getvalue(), "little")
+
+
+def test_save_restore():
+    """Tests the save() and restore() methods."""
+    env = FakeEnv()
+    store = SnapshotStore(env, max_size=4)
+    for state in range(3):
+        env.state = state
+        store.save(f"node{state}")
+
+    store.restore("node1")
+    assert env.state == 1
+    assert len(store) == 3
+    assert "node2" in store
+
+    with pytest.raises(KeyError):
+        store.restore("unknown")
+
+
+def test_lru_eviction():
+    """Tests that the least recently used state is evicted."""
+    env = FakeEnv()
+    store = SnapshotStore(env, max_size=2)
+    store.save("a")
+    store.save("b")
+    store.restore("a")
+    store.save("c")
+
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+
+    # The buffer of the evicted state is reused
+    assert env.allocations == 2
+
+
+def test_discard_clear():
+    """Tests the discard() and clear() methods."""
+    store = SnapshotStore(FakeEnv(), max_size=2)
+    store.save("a")
+    store.save("b")
+    store.discard("a")
+    store.discard("unknown")
+    assert len(store) == 1
+    store.clear()
+    assert len(store) == 0
+
+
+def test_invalid_max_size():
+    """Tests the SnapshotStore with an invalid max_size."""
+    with pytest.raises(ValueError):
+        SnapshotStore(FakeEnv(), max_size=0)
@@ -0,0 +1,82 @@
+"""Tests utils/tilemap.py."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gymboy.utils import tilemap_game_area
+
+
+def _fake_pyboy(memory: np.ndarray, scx: int = 0, scy: int = 0) -> SimpleNamespace:
+    """Returns a fake game boy instance with the given memory and scroll offsets."""
+    return SimpleNamespace(
+        memory=memory.tolist(),
+        screen=SimpleNamespace(
+            tilemap_position_list=[[scx, scy, -7, 0] for _ in range(144)]
+        ),
+    )
+
+
+@pytest.fixture(name="memory")
+def fixture_memory() -> np.ndarray:
+    """Returns a fake game boy memory with tile i at position i of both tilemaps."""
+    memory = np.zeros(0x10000, dtype=np.uint8)
+    memory[0xFF40] = 0b10010001
+    memory[0x9800:0x9C00] = np.arange(0x400) % 256
+    memory[0x9C00:0xA000] = 255 - np.arange(0x400) % 256
+    return memory
+
+
+def test_tilemap_game_area(memory: np.ndarray):
+    """Tests the tilemap_game_area() method."""
+    area = tilemap_game_area(_fake_pyboy(memory))
+    expected = (32 * np.arange(18)[:, None] + np.arange(20)) % 256
+    assert area.shape == (18, 20)
+    np.testing.assert_array_equal(area, expected)
+
+
+def test_tilemap_game_area_high_tilemap(memory: np.ndarray):
+    """Tests the tilemap_game_area() method with the high tilemap."""
+    memory[0xFF40] |= 0b1000
+    area = tilemap_game_area(_fake_pyboy(memory))
+    expected = 255 - (32 * np.arange(18)[:, None] + np.arange(20)) % 256
+    np.testing.assert_array_equal(area, expected)
+
+
+def test_tilemap_game_area_signed(memory: np.ndarray):
+    """Tests the tilemap_game_area() method with signed tile indices."""
+    memory[0xFF40] &= 0b11101111
+    area = tilemap_game_area(_fake_pyboy(memory))
+    assert area[0, 0] == 256
+    assert area[0, 1] == 257
+    assert area[4, 0] == 128
+
+
+def test_tilemap_game_area_scroll(memory: np.ndarray):
+    """Tests the tilemap_game_area() method with scroll offsets that wrap around."""
+    area = tilemap_game_area(_fake_pyboy(memory, scx=8 * 20, scy=8 * 31))
+    assert area[0, 0] == (32 * 31 + 20) % 256
+    assert area[0, 12] == (32 * 31) % 256
+    assert area[1, 0] == 20
+
+
+def test_tilemap_game_area_sprites(memory: np.ndarray):
+    """Tests the tilemap_game_area() method with sprites."""
+    # Sprites 0 and 1 are on the same tile, so sprite 1 is shown
+    memory[0xFE00:0xFE04] = [16 + 8 * 2, 8 + 8 * 3, 0x10, 0]
+    memory[0xFE04:0xFE08] = [16 + 8 * 2 + 3, 8 + 8 * 3 + 5, 0x11, 0]
+    # Sprite 2 uses the second VRAM bank
+    memory[0xFE08:0xFE0C] = [16 + 8 * 5, 8, 0x12, 0b1000]
+    # Sprite 3 is outside of the screen
+    memory[0xFE0C:0xFE10] = [0, 0, 0x13, 0]
+
+    area = tilemap_game_area(_fake_pyboy(memory))
+    assert area[2, 3] == 0x11
+    assert area[5, 0] == 0x12
+    assert area[0, 0] == 0
+
+    # Game boy color games use the VRAM bank of the sprites
+    memory[0x0143] = 0x80
+    area = tilemap_game_area(_fake_pyboy(memory))
+    assert area[5, 0] == 384 + 0x12
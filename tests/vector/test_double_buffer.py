@@ -0,0 +1,143 @@
+"""Tests vector/double_buffer.py."""
+
+import time
+
+import numpy as np
+import pytest
+
+import gymboy
+from gymboy.testing import make_fake
+from gymboy.vector import DoubleBufferVectorEnv
+
+ROM_PATH = "resources/roms/tetris/tetris/tetris.gb"
+INIT_STATE_PATH = "resources/states/tetris/tetris/tetris_lvl_5.state"
+
+
+@pytest.mark.parametrize(
+    argnames=["env_id", "num_envs", "num_groups"],
+    argvalues=[
+        ("Tetris-flatten-v1", 2, 2),
+        ("Tetris-flatten-v1", 5, 2),
+        ("Tetris-minimal-image-v1", 6, 3),
+    ],
+)
+def test_send_recv(env_id: str, num_envs: int, num_groups: int):
+    """Tests that each group steps like the SyncVectorEnv."""
+    kwargs = {"rom_path": ROM_PATH, "init_state_path": INIT_STATE_PATH}
+    sync_envs = gymboy.make_vec(env_id, num_envs, "sync", **kwargs)
+    envs = gymboy.make_vec(
+        env_id, num_envs, "double_buffer", num_workers=num_groups, **kwargs
+    )
+    assert isinstance(envs, DoubleBufferVectorEnv)
+    assert envs.num_groups == num_groups
+
+    n_steps = 20
+    actions = np.random.default_rng(0).integers(0, 9, size=(n_steps, num_envs))
+    expected = [sync_envs.reset(seed=0)[0]]
+    expected += [sync_envs.step(action)[0] for action in actions]
+
+    # Each group performs all steps at its own pace
+    result = np.zeros((n_steps + 1, *expected[0].shape), dtype=expected[0].dtype)
+    steps = np.zeros(num_envs, dtype=np.int64)
+    envs.async_reset(seed=0)
+    for _ in range(num_groups * (n_steps + 1)):
+        obs, reward, terminated, truncated, info = envs.recv()
+        env_ids = info["env_id"]
+        assert obs.shape[0] == reward.shape[0] == len(env_ids)
+        result[steps[env_ids], env_ids] = obs
+        if steps[env_ids[0]] < n_steps:
+            envs.send(actions[steps[env_ids], env_ids], env_ids)
+        steps[env_ids] += 1
+    np.testing.assert_array_equal(np.stack(expected), result)
+
+    # Lockstep steps are possible if no group is running
+    envs.reset(seed=0)
+    envs.step(actions[0])
+
+    sync_envs.close()
+    envs.close()
+
+
+def test_recv_fairness():
+    """Tests that recv() returns the finished groups in the order of dispatch."""
+    envs = DoubleBufferVectorEnv(
+        [lambda: make_fake("Tetris-flatten-v1") for _ in range(3)], num_groups=3
+    )
+    envs.async_reset(seed=0)
+    groups = []
+    for _ in range(12):
+        # All groups finish while the policy computes the next action
+        time.sleep(0.05)
+        *_, info = envs.recv()
+        groups.append(int(info["env_id"][0]))
+        envs.send([0], info["env_id"])
+    assert groups == [0, 1, 2] * 4
+
+    envs.close()
+
+
+def test_invalid_send_recv():
+    """Tests the send() and recv() methods with invalid calls."""
+    envs = DoubleBufferVectorEnv(
+        [
+            lambda: gymboy.make(
+                "Tetris-flatten-v1", rom_path=ROM_PATH, init_state_path=INIT_STATE_PATH
+            )
+            for _ in range(4)
+        ],
+        num_groups=2,
+    )
+    with pytest.raises(ValueError):
+        envs.recv()
+    envs.async_reset(seed=0)
+    with pytest.raises(ValueError):
+        envs.send([0, 0], [0, 1])
+    with pytest.raises(ValueError):
+        envs.step(np.zeros(4, dtype=np.int64))
+
+    obs, *_, info = envs.recv()
+    with pytest.raises(ValueError):
+        envs.send([0], info["env_id"][:1])
+    with pytest.raises(ValueError):
+        envs.send([0, 9], info["env_id"])
+    with pytest.raises(ValueError):
+        envs.send([0, 1, 2], info["env_id"])
+    envs.send([0, 1], info["env_id"])
+
+    # The running groups are received before closing
+    envs.close()
+
+
+def test_send_cached_action_spaces(monkeypatch: pytest.MonkeyPatch):
+    """Tests that send() validates the actions without building a space."""
+    envs = DoubleBufferVectorEnv(
+        [
+            lambda: gymboy.make(
+                "Tetris-flatten-v1", rom_path=ROM_PATH, init_state_path=INIT_STATE_PATH
+            )
+            for _ in range(4)
+        ],
+        num_groups=2,
+    )
+
+    def batch_space(*args, **kwargs):
+        raise AssertionError("batch_space() called in send().")
+
+    monkeypatch.setattr("gymboy.vector.double_buffer.batch_space", batch_space)
+    envs.async_reset(seed=0)
+    for _ in range(2):
+        envs.recv()
+    with pytest.raises(ValueError):
+        envs.send([0, 1, 2, 9])
+    envs.send([0, 1, 2, 3])
+    for _ in range(2):
+        envs.recv()
+    envs.close()
+
+
+def test_invalid_num_groups():
+    """Tests the DoubleBufferVectorEnv with an invalid number of groups."""
+    with pytest.raises(ValueError):
+        DoubleBufferVectorEnv([lambda: None, lambda: None], num_groups=1)
+    with pytest.raises(ValueError):
+        DoubleBufferVectorEnv([lambda: None, lambda: None], num_groups=3)
@@ -0,0 +1,61 @@
+"""Tests vector/fork_server.py."""
+
+import numpy as np
+import pytest
+
+import gymboy
+from gymboy.vector import ForkServerVectorEnv
+
+ROM_PATH = "resources/roms/tetris/tetris/tetris.gb"
+INIT_STATE_PATH = "resources/states/tetris/tetris/tetris_lvl_5.state"
+
+
+@pytest.mark.parametrize(
+    argnames=["env_id", "num_envs"],
+    argvalues=[
+        ("Tetris-flatten-v1", 1),
+        ("Tetris-flatten-v1", 5),
+        ("Tetris-minimal-image-v1", 4),
+    ],
+)
+def test_step(env_id: str, num_envs: int):
+    """Tests that the ForkServerVectorEnv is equal to the SyncVectorEnv."""
+    kwargs = {"rom_path": ROM_PATH, "init_state_path": INIT_STATE_PATH}
+    sync_envs = gymboy.make_vec(env_id, num_envs, "sync", **kwargs)
+    fork_envs = gymboy.make_vec(env_id, num_envs, "fork_server", **kwargs)
+    assert isinstance(fork_envs, ForkServerVectorEnv)
+    assert fork_envs.observation_space == sync_envs.observation_space
+
+    np.testing.assert_array_equal(
+        sync_envs.reset(seed=0)[0], fork_envs.reset(seed=0)[0]
+    )
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        actions = rng.integers(0, 9, size=num_envs)
+        for expected, result in zip(
+            sync_envs.step(actions)[:4], fork_envs.step(actions)[:4]
+        ):
+            np.testing.assert_array_equal(expected, result)
+
+    sync_envs.close()
+    fork_envs.close()
+
+
+def test_template():
+    """Tests that the environments are created only once."""
+    n_calls = []
+
+    def make_env():
+        n_calls.append(1)
+        return gymboy.make(
+            "Tetris-flatten-v1", rom_path=ROM_PATH, init_state_path=INIT_STATE_PATH
+        )
+
+    envs = ForkServerVectorEnv(make_env, num_envs=3)
+    assert len(n_calls) == 1
+    assert envs.num_workers == 3
+    envs.reset(seed=0)
+    envs.set_attr("n_frameskip", [1, 2, 3])
+    assert envs.get_attr("n_frameskip") == (1, 2, 3)
+    envs.close()
+    assert not envs.processes[0].is_alive()
@@ -0,0 +1,150 @@
+"""Tests vector/multi_game.py."""
+
+import numpy as np
+import pytest
+from gymnasium import spaces
+
+import gymboy
+from gymboy.environments.mario.land_1._constant import WORLD_LEVEL_ADDRESS
+from gymboy.environments.tetris.tetris._constant import LEVEL_ADDRESS
+from gymboy.testing import FakePyBoy, make_fake
+from gymboy.vector import MultiGameVectorEnv
+
+TETRIS = (
+    "resources/roms/tetris/tetris/tetris.gb",
+    "resources/states/tetris/tetris/tetris_lvl_5.state",
+)
+MARIO = (
+    "resources/roms/mario/land_1/super_mario_land_1.gb",
+    "resources/states/mario/land_1/super_mario_land_1_lvl_1_1.state",
+)
+
+
+@pytest.mark.parametrize(
+    argnames=["variant", "num_workers"],
+    argvalues=[
+        ("flatten", 2),
+        ("minimal-image", 3),
+    ],
+)
+def test_step(variant: str, num_workers: int):
+    """Tests that the environments of each group step like single environments."""
+    groups = [
+        (f"Tetris-{variant}-v1", *TETRIS, 2),
+        (f"Super-Mario-Land-1-{variant}-v1", *MARIO, 1),
+    ]
+    single_envs = [
+        gymboy.make(env_id, rom_path, init_state_path)
+        for env_id, rom_path, init_state_path, count in groups
+        for _ in range(count)
+    ]
+    envs = MultiGameVectorEnv(groups, num_workers=num_workers)
+    assert isinstance(envs.action_space, spaces.MultiDiscrete)
+    np.testing.assert_array_equal(envs.group_ids, [0, 0, 1])
+    shape = np.max([env.observation_space.shape for env in single_envs], 0)
+    assert envs.single_observation_space.shape == tuple(shape)
+
+    observations, _ = envs.reset(seed=0)
+    expected = [env.reset(seed=i)[0] for i, env in enumerate(single_envs)]
+    actions = np.random.default_rng(0).integers(0, 9, size=(10, len(single_envs)))
+    for action in actions:
+        _assert_observations(envs, observations, expected)
+        observations, rewards, *_ = envs.step(action)
+        expected = []
+        for i, env in enumerate(single_envs):
+            observation, reward, *_ = env.step(action[i])
+            assert rewards[i] == reward
+            expected.append(observation)
+    _assert_observations(envs, observations, expected)
+
+    for env in single_envs:
+        env.close()
+    envs.close()
+
+
+def _count_levels(pyboy: FakePyBoy):
+    """Changes the level of Tetris and Super Mario Land with each frame."""
+    pyboy.memory[LEVEL_ADDRESS] = pyboy.frame_count % 256
+    pyboy.memory[WORLD_LEVEL_ADDRESS] = pyboy.frame_count % 256
+
+
+def _make_fake(
+    env_id: str,
+    rom_path: str,
+    init_state_path: str | None = None,
+    pyboy: FakePyBoy | None = None,
+    **env_kwargs,
+):
+    """Replaces gymboy.make() to create the environments on a FakePyBoy."""
+    return make_fake(env_id, script=_count_levels, **env_kwargs)
+
+
+def test_migrate(monkeypatch: pytest.MonkeyPatch):
+    """Tests that the migrated environments step like single environments."""
+    monkeypatch.setattr("gymboy.vector.multi_game.make", _make_fake)
+    groups = [
+        ("Tetris-flatten-v1", *TETRIS, 2),
+        ("Super-Mario-Land-1-flatten-v1", *MARIO, 1),
+    ]
+    single_envs = [
+        _make_fake(env_id, rom_path)
+        for env_id, rom_path, _, count in groups
+        for _ in range(count)
+    ]
+    envs = MultiGameVectorEnv(groups, num_workers=2)
+
+    observations, _ = envs.reset(seed=0)
+    expected = [env.reset(seed=i)[0] for i, env in enumerate(single_envs)]
+    for i in range(6):
+        if i == 3:
+            # Swap the workers of the first Tetris and the Mario environment
+            envs._migrate(0, 1)
+            envs._migrate(2, 0)
+        _assert_observations(envs, observations, expected)
+        observations, *_ = envs.step(np.zeros(len(single_envs), dtype=np.int64))
+        expected = [env.step(0)[0] for env in single_envs]
+    _assert_observations(envs, observations, expected)
+    assert envs.migrations == 2
+
+    for env in single_envs:
+        env.close()
+    envs.close()
+
+
+def _assert_observations(
+    envs: MultiGameVectorEnv, observations: np.ndarray, expected: list
+):
+    """Asserts that the padded observations match the observations of each env."""
+    assert envs.observation_space.contains(observations)
+    tetris, mario = envs.split(observations)
+    np.testing.assert_array_equal(tetris, np.stack(expected[:2]))
+    np.testing.assert_array_equal(mario, np.stack(expected[2:]))
+
+    # The padding of the smaller observations is zero
+    padding = observations[:2].copy()
+    padding[(slice(None), *(slice(0, size) for size in tetris.shape[1:]))] = 0
+    assert not padding.any()
+
+
+def test_invalid_groups():
+    """Tests the constructor with invalid groups."""
+    with pytest.raises(ValueError):
+        MultiGameVectorEnv([])
+    with pytest.raises(ValueError):
+        MultiGameVectorEnv([("Tetris-flatten-v1", *TETRIS, 0)])
+    with pytest.raises(ValueError):
+        # Observations with different dtypes
+        MultiGameVectorEnv(
+            [
+                ("Tetris-flatten-v1", *TETRIS, 1),
+                ("Super-Mario-Land-1-full-image-v1", *MARIO, 1),
+            ]
+        )
+    with pytest.raises(ValueError):
+        # Observations with different dimensions
+        MultiGameVectorEnv(
+            [
+                ("Tetris-flatten-v1", *TETRIS, 1),
+                ("Super-Mario-Land-1-minimal-image-v1", *MARIO, 1),
+            ]
+        )
@@ -0,0 +1,107 @@
+"""Tests vector/shared_memory.py."""
+
+import numpy as np
+import pytest
+
+import gymboy
+from gymboy.vector import SharedMemoryVectorEnv
+
+ROM_PATH = "resources/roms/tetris/tetris/tetris.gb"
+INIT_STATE_PATH = "resources/states/tetris/tetris/tetris_lvl_5.state"
+
+
+@pytest.mark.parametrize(
+    argnames=["env_id", "num_envs", "num_workers"],
+    argvalues=[
+        ("Tetris-flatten-v1", 1, 1),
+        ("Tetris-flatten-v1", 5, 2),
+        ("Tetris-minimal-image-v1", 4, 4),
+    ],
+)
+def test_step(env_id: str, num_envs: int, num_workers: int):
+    """Tests that the SharedMemoryVectorEnv is equal to the SyncVectorEnv."""
+    kwargs = {"rom_path": ROM_PATH, "init_state_path": INIT_STATE_PATH}
+    sync_envs = gymboy.make_vec(env_id, num_envs, "sync", **kwargs)
+    shared_envs = gymboy.make_vec(
+        env_id, num_envs, "shared_memory", num_workers=num_workers, **kwargs
+    )
+    assert isinstance(shared_envs, SharedMemoryVectorEnv)
+    assert shared_envs.observation_space == sync_envs.observation_space
+
+    np.testing.assert_array_equal(
+        sync_envs.reset(seed=0)[0], shared_envs.reset(seed=0)[0]
+    )
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        actions = rng.integers(0, 9, size=num_envs)
+        for expected, result in zip(
+            sync_envs.step(actions)[:4], shared_envs.step(actions)[:4]
+        ):
+            np.testing.assert_array_equal(expected, result)
+
+    sync_envs.close()
+    shared_envs.close()
+
+
+def test_call():
+    """Tests the call(), get_attr() and set_attr() methods."""
+    envs = gymboy.make_vec(
+        "Tetris-flatten-v1",
+        3,
+        "shared_memory",
+        num_workers=2,
+        rom_path=ROM_PATH,
+        init_state_path=INIT_STATE_PATH,
+    )
+    envs.reset(seed=0)
+    assert envs.get_attr("n_frameskip") == (1, 1, 1)
+    envs.set_attr("n_frameskip", [1, 2, 3])
+    assert envs.get_attr("n_frameskip") == (1, 2, 3)
+    assert len(envs.call("observation")) == 3
+    with pytest.raises(RuntimeError):
+        envs.call("unknown_method")
+    envs.close()
+
+
+def test_perf_stats():
+    """Tests the perf_stats() method."""
+    envs = gymboy.make_vec(
+        "Tetris-flatten-v1",
+        3,
+        "shared_memory",
+        num_workers=2,
+        rom_path=ROM_PATH,
+        init_state_path=INIT_STATE_PATH,
+        profile=True,
+    )
+    envs.reset(seed=0)
+    envs.step(np.zeros(3, dtype=np.int64))
+    stats = envs.perf_stats()
+    assert stats["reset"]["count"] == 3
+    assert stats["emulation"]["count"] == 3
+    envs.close()
+
+
+def test_invalid_actions():
+    """Tests that the batch of actions is validated before the step."""
+    envs = gymboy.make_vec(
+        "Tetris-flatten-v1",
+        3,
+        "shared_memory",
+        num_workers=2,
+        rom_path=ROM_PATH,
+        init_state_path=INIT_STATE_PATH,
+    )
+    envs.reset(seed=0)
+    assert envs.get_attr("trust_actions") == (True, True, True)
+    for actions in [[0, 1, 9], [0, -1, 0], [0.0, 1.0, 2.0], [0, 1]]:
+        with pytest.raises(ValueError):
+            envs.step(actions)
+    envs.step([0, 1, 8])
+    envs.close()
+
+
+def test_invalid_num_workers():
+    """Tests the SharedMemoryVectorEnv with an invalid number of workers."""
+    with pytest.raises(ValueError):
+        SharedMemoryVectorEnv([lambda: None], num_workers=0)
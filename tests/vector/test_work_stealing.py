@@ -0,0 +1,166 @@
+"""Tests vector/work_stealing.py."""
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+import gymboy
+from gymboy.environments.tetris.tetris._constant import LEVEL_ADDRESS
+from gymboy.testing import FakePyBoy, make_fake
+from gymboy.vector import WorkStealingVectorEnv
+
+ROM_PATH = "resources/roms/tetris/tetris/tetris.gb"
+INIT_STATE_PATH = "resources/states/tetris/tetris/tetris_lvl_5.state"
+
+
+def _make_env():
+    return gymboy.make(
+        "Tetris-flatten-v1", rom_path=ROM_PATH, init_state_path=INIT_STATE_PATH
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["env_id", "num_envs", "num_workers"],
+    argvalues=[
+        ("Tetris-flatten-v1", 3, 2),
+        ("Tetris-minimal-image-v1", 4, 2),
+    ],
+)
+def test_step(env_id: str, num_envs: int, num_workers: int):
+    """Tests that the environments step like the SyncVectorEnv with migrations."""
+    kwargs = {"rom_path": ROM_PATH, "init_state_path": INIT_STATE_PATH}
+    sync_envs = gymboy.make_vec(env_id, num_envs, "sync", **kwargs)
+    envs = gymboy.make_vec(
+        env_id, num_envs, "work_stealing", num_workers=num_workers, **kwargs
+    )
+    assert isinstance(envs, WorkStealingVectorEnv)
+
+    # The attributes changed by set_attr() are migrated with the environment
+    n_frameskip = tuple(range(1, num_envs + 1))
+    sync_envs.set_attr("n_frameskip", list(n_frameskip))
+    envs.set_attr("n_frameskip", list(n_frameskip))
+
+    np.testing.assert_array_equal(sync_envs.reset(seed=0)[0], envs.reset(seed=0)[0])
+    actions = np.random.default_rng(0).integers(0, 9, size=(30, num_envs))
+    for i, action in enumerate(actions):
+        if i == 10:
+            # Move the first environment to the last worker in the middle of it
+            envs._migrate(0, num_workers - 1)
+            assert 0 in envs.env_ids[-1] and 0 not in envs.env_ids[0]
+            assert envs.get_attr("n_frameskip") == n_frameskip
+        expected = sync_envs.step(action)
+        result = envs.step(action)
+        for expected_value, value in zip(expected[:4], result[:4]):
+            np.testing.assert_array_equal(expected_value, value)
+    assert envs.migrations == 1
+
+    # The results of call() and set_attr() keep the order of the environments
+    envs.set_attr("n_frameskip", list(reversed(n_frameskip)))
+    assert envs.get_attr("n_frameskip") == tuple(reversed(n_frameskip))
+
+    sync_envs.close()
+    envs.close()
+
+
+def _count_levels(pyboy: FakePyBoy):
+    """Changes the level with each frame, so that each observation differs."""
+    pyboy.memory[LEVEL_ADDRESS] = pyboy.frame_count % 256
+
+
+def test_migrate_observation():
+    """Tests that the observations of a migrated environment keep changing."""
+    env_fns = [
+        lambda: make_fake("Tetris-flatten-v1", script=_count_levels) for _ in range(3)
+    ]
+    sync_envs = gym.vector.SyncVectorEnv(env_fns)
+    envs = WorkStealingVectorEnv(env_fns, num_workers=2)
+
+    np.testing.assert_array_equal(sync_envs.reset(seed=0)[0], envs.reset(seed=0)[0])
+    for i in range(6):
+        if i == 3:
+            envs._migrate(0, 1)
+        action = np.zeros(3, dtype=np.int64)
+        np.testing.assert_array_equal(sync_envs.step(action)[0], envs.step(action)[0])
+    assert envs.migrations == 1
+
+    sync_envs.close()
+    envs.close()
+
+
+def test_rebalance():
+    """Tests that the least loaded worker steals an environment of the most loaded."""
+    envs = WorkStealingVectorEnv(
+        [_make_env for _ in range(4)], num_workers=2, rebalance_interval=5
+    )
+    envs.reset(seed=0)
+
+    # The environments of the first worker are the slowest ones
+    envs._costs[:] = [3.0, 2.0, 1.0, 1.0]
+    np.testing.assert_array_equal(envs.worker_loads(), [5.0, 2.0])
+    envs._rebalance()
+    assert envs.migrations == 1
+    np.testing.assert_array_equal(envs.env_ids[0], [0])
+    np.testing.assert_array_equal(envs.env_ids[1], [1, 2, 3])
+    np.testing.assert_array_equal(envs.worker_loads(), [3.0, 4.0])
+
+    # No environment of the most loaded worker reduces its load any further
+    envs._rebalance()
+    assert envs.migrations == 1
+
+    envs.close()
+
+
+def test_migrate_perf_stats():
+    """Tests that the recorded times of the profiler are migrated."""
+    envs = WorkStealingVectorEnv(
+        [
+            lambda: gymboy.make(
+                "Tetris-flatten-v1",
+                rom_path=ROM_PATH,
+                init_state_path=INIT_STATE_PATH,
+                profile=True,
+            )
+            for _ in range(2)
+        ],
+        num_workers=2,
+    )
+    envs.reset(seed=0)
+    for _ in range(3):
+        envs.step(envs.action_space.sample())
+    expected = envs.call("perf_stats")
+
+    envs._migrate(0, 1)
+    assert envs.call("perf_stats") == expected
+
+    envs.close()
+
+
+def test_utilization():
+    """Tests the utilization() method."""
+    envs = gymboy.make_vec(
+        "Tetris-flatten-v1",
+        4,
+        "work_stealing",
+        num_workers=2,
+        rom_path=ROM_PATH,
+        init_state_path=INIT_STATE_PATH,
+    )
+    np.testing.assert_array_equal(envs.utilization(), [0.0, 0.0])
+
+    envs.reset(seed=0)
+    for _ in range(10):
+        envs.step(envs.action_space.sample())
+    utilization = envs.utilization()
+    assert utilization.shape == (2,)
+    assert np.all(utilization > 0.0) and np.all(utilization <= 1.0)
+    assert np.all(envs.worker_loads() > 0.0)
+
+    envs.close()
+
+
+def test_invalid_arguments():
+    """Tests the constructor with invalid arguments."""
+    with pytest.raises(ValueError):
+        WorkStealingVectorEnv([_make_env], rebalance_interval=0)
+    with pytest.raises(ValueError):
+        WorkStealingVectorEnv([_make_env], tolerance=-1.0)
@@ -0,0 +1,93 @@
+"""Tests wrappers/frame_stack.py."""
+
+import numpy as np
+import pytest
+
+from gymboy.testing import FakePyBoy, make_fake
+from gymboy.wrappers import FrameStack
+
+
+def _count_frames(pyboy: FakePyBoy):
+    """Writes the frame count into the game area and screen."""
+    pyboy.game_area_array[...] = pyboy.frame_count
+    pyboy.screen.ndarray[..., :3] = pyboy.frame_count % 256
+
+
+def test_step():
+    """Tests the step() method."""
+    env = FrameStack(
+        make_fake("Tetris-minimal-image-v1", script=_count_frames), n_frames=3
+    )
+    assert env.observation_space.shape == (3, 18, 10)
+
+    obs, _ = env.reset(seed=0)
+    assert obs.shape == (3, 18, 10)
+    np.testing.assert_array_equal(obs[:, 0, 0], [1, 1, 1])
+    for t in range(2, 8):
+        obs, *_ = env.step(0)
+        assert obs.shape == (3, 18, 10)
+        assert env.observation_space.contains(obs)
+        np.testing.assert_array_equal(obs[:, 0, 0], [max(t - 2, 1), max(t - 1, 1), t])
+    env.close()
+
+
+def test_copy():
+    """Tests the copy argument."""
+    env = FrameStack(
+        make_fake("Tetris-minimal-image-v1", script=_count_frames), copy=True
+    )
+    obs, _ = env.reset(seed=0)
+    env.step(0)
+    np.testing.assert_array_equal(obs[:, 0, 0], [1, 1, 1, 1])
+
+    env = FrameStack(make_fake("Tetris-minimal-image-v1", script=_count_frames))
+    obs, _ = env.reset(seed=0)
+    assert np.shares_memory(obs, env.frames)
+    env.close()
+
+
+def test_max_pool():
+    """Tests the max_pool argument."""
+
+    def flicker(pyboy: FakePyBoy):
+        # Every even frame shows a sprite at the top left corner
+        pyboy.screen.ndarray[0, 0, :3] = 255 * (1 - pyboy.frame_count % 2)
+        pyboy.screen.ndarray[1, 1, :3] = pyboy.frame_count
+
+    env = FrameStack(
+        make_fake("Tetris-full-image-v1", script=flicker, n_frameskip=4),
+        n_frames=2,
+        max_pool=True,
+    )
+    assert env.observation_space.shape == (2, 144, 160, 3)
+    env.reset(seed=0)
+    for t in range(2):
+        obs, *_ = env.step(0)
+        # The sprite of the second last frame is part of the observation
+        np.testing.assert_array_equal(obs[-1, 0, 0], [255, 255, 255])
+        np.testing.assert_array_equal(obs[-1, 1, 1], [5 + 4 * t] * 3)
+    env.close()
+
+
+def test_max_pool_restore():
+    """Tests that restore() replaces the max-pooled screen."""
+    env = FrameStack(
+        make_fake("Tetris-full-image-v1", script=_count_frames),
+        n_frames=2,
+        max_pool=True,
+    )
+    env.reset(seed=0)
+    buffer = env.unwrapped.snapshot()
+    for _ in range(5):
+        env.step(0)
+    env.unwrapped.restore(buffer)
+    np.testing.assert_array_equal(env.unwrapped.observation()[0, 0], [1, 1, 1])
+    env.close()
+
+
+def test_invalid_arguments():
+    """Tests the FrameStack with invalid arguments."""
+    with pytest.raises(ValueError):
+        FrameStack(make_fake("Tetris-minimal-image-v1"), n_frames=0)
+    with pytest.raises(ValueError):
+        FrameStack(make_fake("Tetris-minimal-image-v1"), max_pool=True)